@@ -0,0 +1,152 @@
+"""
+Eşleştirme İndeksi Karşılaştırma Betiği
+Sentetik 128 boyutlu kodlamalar üzerinde kesin tarama ile yaklaşık (IVF) ve
+sıkıştırılmış (float16 / int8) indekslerin isabet oranını (recall@1), sorgu
+gecikmesini ve bellekte tuttuğu dizilerin boyutunu karşılaştırır.
+
+Kullanım:
+    python benchmark_indeks.py --boyutlar 1000 10000 50000 --taranacak 4 8 16
+    python benchmark_indeks.py --boyutlar 10000 100000 --taranacak 8 --aday 8 16
+"""
+
+import os
+import argparse
+import json
+import time
+import tempfile
+import numpy as np
+from eslestirici import INDEKS_TURLERI, KODLAMA_BOYUTU
+
+def sentetik_kodlamalar(kisi_sayisi, rng, grup_boyutu=50):
+    """
+    Gerçek yüz kodlamalarına benzer şekilde gruplanmış sentetik kadro üretir
+
+    Args:
+        kisi_sayisi (int): Üretilecek kişi sayısı
+        rng (numpy.random.Generator): Rastgele sayı üreteci
+        grup_boyutu (int): Ortak bir merkez etrafında toplanan kişi sayısı
+
+    Returns:
+        numpy.ndarray: (kisi_sayisi, 128) float32 kodlama matrisi
+
+    Not:
+        Kişiler arası mesafe ~1.0, aynı kişinin farklı görüntüleri arası mesafe ~0.3
+        olacak şekilde ölçeklenmiştir (face_recognition kodlamalarına yakın)
+    """
+    grup_sayisi = max(1, kisi_sayisi // grup_boyutu)
+    merkezler = rng.normal(0, 0.08, size=(grup_sayisi, KODLAMA_BOYUTU))
+    gruplar = rng.integers(0, grup_sayisi, size=kisi_sayisi)
+    kodlamalar = merkezler[gruplar] + rng.normal(0, 0.06, size=(kisi_sayisi, KODLAMA_BOYUTU))
+    return kodlamalar.astype(np.float32)
+
+def indeks_bellegi(indeks):
+    """
+    İndeksin bellekte tuttuğu NumPy dizilerinin toplam boyutunu hesaplar
+
+    Returns:
+        tuple: (bellekteki toplam MB, ilk taramada okunan dizinin MB'ı)
+
+    Not:
+        Bellek eşlemeli (diskteki) diziler bellekte sayılmaz; yalnızca okunan sayfaları yüklenir
+    """
+    toplam = 0
+    for deger in vars(indeks).values():
+        diziler = deger if isinstance(deger, list) else [deger]
+        toplam += sum(dizi.nbytes for dizi in diziler
+                      if isinstance(dizi, np.ndarray) and not isinstance(dizi, np.memmap))
+    taranan = getattr(indeks, 'kucuk', indeks.matris)
+    return toplam / 2**20, taranan.nbytes / 2**20
+
+def olc(indeks, sorgular, dogru_cevaplar):
+    """
+    Bir indeksin sorgu başına gecikmesini ve isabet oranını ölçer
+
+    Returns:
+        dict: recall@1 ve milisaniye cinsinden p50/p95/ortalama gecikme
+    """
+    sureler = []
+    isabet = 0
+    for i in range(sorgular.shape[0]):
+        baslangic = time.perf_counter()
+        indeksler, _ = indeks.ara(sorgular[i:i + 1], k=1)  # Karede tek yüz varmış gibi
+        sureler.append((time.perf_counter() - baslangic) * 1000)
+        isabet += int(indeksler[0, 0] == dogru_cevaplar[i])
+    sureler = np.array(sureler)
+    return {
+        "recall_at_1": isabet / len(dogru_cevaplar),
+        "p50_ms": float(np.percentile(sureler, 50)),
+        "p95_ms": float(np.percentile(sureler, 95)),
+        "ortalama_ms": float(sureler.mean()),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Kesin ve yaklaşık eşleştirme indekslerini karşılaştırır")
+    parser.add_argument('--boyutlar', type=int, nargs='+', default=[1000, 10000, 50000], help="Kadro büyüklükleri")
+    parser.add_argument('--sorgu', type=int, default=200, help="Her kadro için sorgu sayısı")
+    parser.add_argument('--gurultu', type=float, default=0.02, help="Sorgulara eklenen gürültünün standart sapması")
+    parser.add_argument('--taranacak', type=int, nargs='+', default=[4, 8, 16], help="IVF için taranacak liste sayıları")
+    parser.add_argument('--aday', type=int, nargs='+', default=[8],
+                        help="float16/int8 indeksleri için float32 ile yeniden sıralanacak aday sayıları")
+    parser.add_argument('--tohum', type=int, default=0, help="Rastgele sayı tohumu")
+    parser.add_argument('--json', help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.tohum)
+    sonuclar = []
+
+    # Diskteki float32 kopyalar geçici klasöre yazılır; klasör ölçüm bitince silinir
+    with tempfile.TemporaryDirectory(prefix="indeks_benchmark_") as gecici:
+        for kisi_sayisi in args.boyutlar:
+            kadro = sentetik_kodlamalar(kisi_sayisi, rng)
+            kisiler = rng.integers(0, kisi_sayisi, size=args.sorgu)
+            sorgular = (kadro[kisiler] + rng.normal(0, args.gurultu, size=(args.sorgu, KODLAMA_BOYUTU))).astype(np.float32)
+
+            baslangic = time.perf_counter()
+            kesin = INDEKS_TURLERI['kesin'](kadro)
+            kurulum = time.perf_counter() - baslangic
+            dogru_cevaplar, _ = kesin.ara(sorgular, k=1)  # Yaklaşık indeks kesin taramaya göre değerlendirilir
+            dogru_cevaplar = dogru_cevaplar[:, 0]
+
+            olcum = olc(kesin, sorgular, dogru_cevaplar)
+            bellek_mb, taranan_mb = indeks_bellegi(kesin)
+            sonuclar.append(dict(kadro=kisi_sayisi, indeks='kesin', kurulum_s=kurulum,
+                                 bellek_mb=bellek_mb, taranan_mb=taranan_mb, **olcum))
+
+            baslangic = time.perf_counter()
+            ivf = INDEKS_TURLERI['ivf'](kadro)
+            kurulum = time.perf_counter() - baslangic
+            for taranacak in args.taranacak:
+                ivf.taranacak_liste = taranacak
+                olcum = olc(ivf, sorgular, dogru_cevaplar)
+                bellek_mb, taranan_mb = indeks_bellegi(ivf)
+                sonuclar.append(dict(kadro=kisi_sayisi, indeks=f'ivf (liste={ivf.liste_sayisi}, taranan={taranacak})',
+                                     kurulum_s=kurulum, bellek_mb=bellek_mb, taranan_mb=taranan_mb, **olcum))
+
+            # Sıkıştırılmış indeksler: float32 matris bellekte veya diskte (bellek eşlemeli)
+            for tur in ('float16', 'int8'):
+                for diskte in (False, True):
+                    siralama_dosyasi = os.path.join(gecici, f'{tur}_{kisi_sayisi}.npy') if diskte else None
+                    baslangic = time.perf_counter()
+                    indeks = INDEKS_TURLERI[tur](kadro, siralama_dosyasi=siralama_dosyasi)
+                    kurulum = time.perf_counter() - baslangic
+                    for aday in args.aday:
+                        indeks.aday_sayisi = aday
+                        olcum = olc(indeks, sorgular, dogru_cevaplar)
+                        bellek_mb, taranan_mb = indeks_bellegi(indeks)
+                        sonuclar.append(dict(kadro=kisi_sayisi, indeks=f'{tur} (aday={aday}{", disk" if diskte else ""})',
+                                             kurulum_s=kurulum, bellek_mb=bellek_mb, taranan_mb=taranan_mb, **olcum))
+                    indeks.kapat()  # Bellek eşlemesi klasör silinmeden kapatılır
+
+    print(f"{'Kadro':>8} {'Indeks':<32} {'Kurulum(s)':>10} {'Bellek(MB)':>10} {'Taranan(MB)':>11} "
+          f"{'Recall@1':>9} {'p50(ms)':>9} {'p95(ms)':>9}")
+    for sonuc in sonuclar:
+        print(f"{sonuc['kadro']:>8} {sonuc['indeks']:<32} {sonuc['kurulum_s']:>10.2f} "
+              f"{sonuc['bellek_mb']:>10.1f} {sonuc['taranan_mb']:>11.1f} "
+              f"{sonuc['recall_at_1']:>9.3f} {sonuc['p50_ms']:>9.3f} {sonuc['p95_ms']:>9.3f}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(sonuclar, f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+"""
+Raporlama Sorguları Ölçüm Betiği
+Farklı büyüklükte sentetik yoklama veritabanları üretir ve geçmiş, özet ve öğrenci
+bazlı sorguların gecikmesini ölçer. Raporlama sorgularındaki yavaşlamaları
+canlı veritabanına ulaşmadan yakalamak için kullanılır.
+
+Kullanım:
+    python benchmark_sorgular.py --boyutlar 10000 100000 1000000 --ogrenci 200
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+import numpy as np
+from yoklama_db import (Veritabani, sentetik_veri_olustur, genel_istatistikler, dersleri_getir,
+                        ders_detayi_getir, yoklama_getir, ozetleri_yeniden_olustur)
+
+def olc(sorgu, tekrar):
+    """
+    Bir sorgu fonksiyonunu tekrar tekrar çalıştırıp gecikmesini ölçer
+
+    Args:
+        sorgu (callable): Parametresiz çağrılan sorgu
+        tekrar (int): Ölçüm sayısı
+
+    Returns:
+        dict: Milisaniye cinsinden p50/p95/ortalama gecikme
+    """
+    sorgu()  # İlk çağrı: ifade derlenir ve sayfalar önbelleğe alınır
+    sureler = []
+    for _ in range(tekrar):
+        baslangic = time.perf_counter()
+        sorgu()
+        sureler.append((time.perf_counter() - baslangic) * 1000)
+    sureler = np.array(sureler)
+    return {
+        "p50_ms": float(np.percentile(sureler, 50)),
+        "p95_ms": float(np.percentile(sureler, 95)),
+        "ortalama_ms": float(sureler.mean()),
+    }
+
+def veritabani_olc(yol, kayit_sayisi, ogrenci_sayisi, tekrar, tohum):
+    """
+    Verilen büyüklükte bir veritabanı üretir ve raporlama sorgularını ölçer
+
+    Returns:
+        list: Her sorgu için bir ölçüm sözlüğü
+    """
+    ders_sayisi = max(1, kayit_sayisi // ogrenci_sayisi)
+    db = Veritabani(yol)
+    conn = db.baglanti()
+    rastgele = random.Random(tohum)
+
+    baslangic = time.perf_counter()
+    eklenen = sentetik_veri_olustur(conn, ogrenci_sayisi, ders_sayisi, tohum=tohum)
+    yukleme = time.perf_counter() - baslangic
+    print(f"{eklenen} kayit {yukleme:.1f} sn'de eklendi ({eklenen / yukleme:,.0f} kayit/sn)")
+
+    # Derin sayfa ölçümü için geçmişin ortasındaki bir dersin anahtarı alınır
+    orta = conn.execute('''
+        SELECT id, zaman
+        FROM ders_oturumlari
+        ORDER BY zaman DESC LIMIT 1 OFFSET ?
+    ''', (ders_sayisi // 2,)).fetchone()
+    ogrenciler = [f"Ogrenci_{i:05d}" for i in range(1, ogrenci_sayisi + 1)]
+
+    sorgular = {
+        "genel_istatistikler": lambda: genel_istatistikler(conn),
+        "ders_listesi_ilk_sayfa": lambda: dersleri_getir(conn, None, 200),
+        "ders_listesi_orta_sayfa": lambda: dersleri_getir(conn, (orta[1], orta[0]), 200),
+        "ders_detayi_ilk_sayfa": lambda: ders_detayi_getir(conn, orta[0], None, 200),
+        "ogrenci_son_dersleri": lambda: yoklama_getir(conn, rastgele.choice(ogrenciler)),
+        "ogrenci_ozeti": lambda: conn.execute('''
+            SELECT oz.* FROM ogrenciler o JOIN ogrenci_ozetleri oz ON oz.ogrenci_id = o.id
+            WHERE o.isim = ?
+        ''', (rastgele.choice(ogrenciler),)).fetchone(),
+    }
+
+    sonuclar = [dict(kayit=eklenen, sorgu="yukleme", toplam_s=yukleme)]
+    for isim, sorgu in sorgular.items():
+        sonuclar.append(dict(kayit=eklenen, sorgu=isim, **olc(sorgu, tekrar)))
+
+    # Özetlerin baştan hesaplanması (şema yükseltmesi / toplu yükleme sonrası) tek sefer ölçülür
+    baslangic = time.perf_counter()
+    ozetleri_yeniden_olustur(conn)
+    sonuclar.append(dict(kayit=eklenen, sorgu="ozetleri_yeniden_olustur",
+                         toplam_s=time.perf_counter() - baslangic))
+
+    db.kapat()
+    return sonuclar
+
+def main():
+    parser = argparse.ArgumentParser(description="Raporlama sorgularını büyük sentetik veritabanlarında ölçer")
+    parser.add_argument('--boyutlar', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help="Yoklama kaydı sayıları")
+    parser.add_argument('--ogrenci', type=int, default=200, help="Öğrenci sayısı")
+    parser.add_argument('--tekrar', type=int, default=50, help="Her sorgunun ölçüm sayısı")
+    parser.add_argument('--tohum', type=int, default=0, help="Rastgele sayı tohumu")
+    parser.add_argument('--klasor', help="Veritabanlarının oluşturulacağı klasör (verilmezse geçici klasör)")
+    parser.add_argument('--json', help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    klasor = args.klasor or tempfile.mkdtemp(prefix="yoklama_benchmark_")
+    os.makedirs(klasor, exist_ok=True)
+    sonuclar = []
+
+    for kayit_sayisi in args.boyutlar:
+        yol = os.path.join(klasor, f"yoklama_{kayit_sayisi}.db")
+        for uzanti in ('', '-wal', '-shm'):  # Önceki çalıştırmadan kalan dosyalar silinir
+            if os.path.exists(yol + uzanti):
+                os.remove(yol + uzanti)
+        sonuclar.extend(veritabani_olc(yol, kayit_sayisi, args.ogrenci, args.tekrar, args.tohum))
+
+    print(f"{'Kayit':>9} {'Sorgu':<28} {'p50(ms)':>9} {'p95(ms)':>9} {'Toplam(s)':>10}")
+    for sonuc in sonuclar:
+        if 'toplam_s' in sonuc:
+            print(f"{sonuc['kayit']:>9} {sonuc['sorgu']:<28} {'':>9} {'':>9} {sonuc['toplam_s']:>10.2f}")
+        else:
+            print(f"{sonuc['kayit']:>9} {sonuc['sorgu']:<28} {sonuc['p50_ms']:>9.3f} {sonuc['p95_ms']:>9.3f}")
+    print(f"Veritabanlari: {klasor}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(sonuclar, f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,304 @@
+"""
+Uçtan Uca Tanıma Ölçüm Betiği
+Kadroyu faces klasöründen yükler, faces fotoğraflarından üretilmiş bileşik kareleri
+(veya kaydedilmiş bir videoyu) tanıma hattından geçirir ve şunları ölçer:
+- Kadro yükleme süresi (depo boşken ve doluyken)
+- Aşama gecikmeleri: küçültme, hareket kapısı, tespit, takip, kodlama, eşleştirme,
+  veritabanı yazma, çizim
+- Kare/sn cinsinden işlem hızı, tanıma oranı ve en yüksek bellek kullanımı
+Sonuçlar sürümler arası karşılaştırma için JSON olarak yazılabilir.
+
+Kullanım:
+    python benchmark_tanima.py --yuz-sayilari 1 4 8 --cozunurlukler 640x480 1280x720 --json sonuc.json
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import itertools
+import platform
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+import cv2
+import numpy as np
+from yoklama_db import Veritabani, yeni_ders_baslat, toplu_yoklama_ekle
+from kodlama_deposu import kodlamalari_yukle, dosya_adindan_isim
+from eslestirici import INDEKS_TURLERI
+from tespit import TESPITCI_TURLERI
+from cizim import yuzleri_ciz, KatilimciPaneli
+from olcum import AsamaOlcer
+from yoklama_sistemi import Kadro
+
+try:
+    import resource  # Windows'ta bulunmaz
+except ImportError:
+    resource = None
+
+def en_yuksek_bellek_mb():
+    """
+    Sürecin şimdiye kadarki en yüksek yerleşik bellek kullanımını döndürür
+
+    Returns:
+        float: MB cinsinden bellek, ölçülemiyorsa None
+    """
+    if resource is None:
+        return None
+    tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux'ta KB, macOS'ta bayt cinsindendir
+    return tepe / (1024 * 1024) if sys.platform == 'darwin' else tepe / 1024
+
+def kisi_fotograflari(faces_dir, filenames):
+    """
+    Her kişi için okunabilen ilk fotoğrafı yükler
+
+    Args:
+        faces_dir (str): Yüz fotoğraflarının bulunduğu klasör
+        filenames (iterable): faces klasörüne göre fotoğraf yolları ('isim.jpg' veya 'isim/1.jpg')
+
+    Returns:
+        list: (isim, BGR fotoğraf) çiftleri
+
+    Not:
+        cv2.imread'in okuyamadığı dosyalar uyarıyla atlanır; kişinin klasöründe başka
+        fotoğraf varsa o kullanılır
+    """
+    fotograflar = {}
+    for filename in filenames:
+        isim = dosya_adindan_isim(filename)
+        if isim in fotograflar:
+            continue
+        foto = cv2.imread(os.path.join(faces_dir, *filename.split('/')))
+        if foto is None:
+            print(f"  {filename}: okunamadi, atlaniyor")
+            continue
+        fotograflar[isim] = foto
+    return list(fotograflar.items())
+
+def bilesik_kareler(fotograflar, yuz_sayisi, genislik, yukseklik, yuz_olcegi, kare_sayisi, rng, kutularla=False):
+    """
+    Kadro fotoğraflarını ızgaraya yerleştirerek sentetik sınıf kareleri üretir
+
+    Args:
+        fotograflar (list): (isim, BGR fotoğraf) çiftleri
+        yuz_sayisi (int): Karedeki kişi sayısı
+        genislik (int): Kare genişliği
+        yukseklik (int): Kare yüksekliği
+        yuz_olcegi (float): Fotoğrafın kendi hücresinde kapladığı en büyük oran (0-1)
+        kare_sayisi (int): Üretilecek kare sayısı
+        rng (random.Random): Rastgele sayı üreteci
+        kutularla (bool): Her karedeki fotoğrafların (top, right, bottom, left) kutuları da döndürülsün mü
+
+    Returns:
+        tuple: (BGR kareler listesi, karedeki isimler kümesi), kutularla ise sonuna
+            kare başına kutu listeleri eklenir
+
+    Not:
+        Her karede fotoğraflar birkaç piksel kaydırılır; böylece hareket kapısı ve
+        takipçi, oturan bir sınıftaki küçük kıpırdanmalara benzer bir girdi görür
+    """
+    sutun = math.ceil(math.sqrt(yuz_sayisi))
+    satir = math.ceil(yuz_sayisi / sutun)
+    hucre_g, hucre_y = genislik // sutun, yukseklik // satir
+    secilenler = [fotograflar[i % len(fotograflar)] for i in range(yuz_sayisi)]
+
+    yerlesim = []
+    for i, (_, foto) in enumerate(secilenler):
+        oran = yuz_olcegi * min(hucre_g / foto.shape[1], hucre_y / foto.shape[0])
+        kucuk = cv2.resize(foto, (max(1, int(foto.shape[1] * oran)), max(1, int(foto.shape[0] * oran))))
+        x = (i % sutun) * hucre_g + (hucre_g - kucuk.shape[1]) // 2
+        y = (i // sutun) * hucre_y + (hucre_y - kucuk.shape[0]) // 2
+        yerlesim.append((kucuk, x, y))
+
+    kareler, kutular = [], []
+    for _ in range(kare_sayisi):
+        kare = np.full((yukseklik, genislik, 3), 90, dtype=np.uint8)
+        kare_kutulari = []
+        for kucuk, x, y in yerlesim:
+            dx, dy = rng.randint(-2, 2), rng.randint(-2, 2)
+            x = min(max(0, x + dx), genislik - kucuk.shape[1])
+            y = min(max(0, y + dy), yukseklik - kucuk.shape[0])
+            kare[y:y + kucuk.shape[0], x:x + kucuk.shape[1]] = kucuk
+            kare_kutulari.append((y, x + kucuk.shape[1], y + kucuk.shape[0], x))
+        kareler.append(kare)
+        kutular.append(kare_kutulari)
+    if kutularla:
+        return kareler, {isim for isim, _ in secilenler}, kutular
+    return kareler, {isim for isim, _ in secilenler}
+
+def kareleri_isle(kareler, beklenen, tanimlayici, olcer, conn, ders_id, isimler, olcek):
+    """
+    Kareleri canlı döngüdeki sırayla (tanıma, yoklama yazma, çizim) işler
+
+    Returns:
+        dict: İşlem hızı ve tanıma oranı
+    """
+    yoklama_durumu = {isim: False for isim in isimler}
+    katilimci_paneli = KatilimciPaneli()
+    bulunanlar = set()
+    baslangic = time.perf_counter()
+    for frame in kareler:
+        with olcer.asama('toplam'):
+            with olcer.asama('tanima'):
+                sonuclar = tanimlayici.tani(frame, olcek)
+            with olcer.asama('vt_yazma'):
+                yeni = [s.isim for s in sonuclar if s.kabul and not yoklama_durumu[s.isim]]
+                if yeni:
+                    toplu_yoklama_ekle(conn, ders_id, yeni, "KATILDI")
+                    yoklama_durumu.update((isim, True) for isim in yeni)
+            with olcer.asama('cizim'):
+                cizilen = frame.copy()
+                yuzleri_ciz(cizilen, sonuclar)
+                katilimci_paneli.ciz(cizilen, isimler, yoklama_durumu, 0)
+        bulunanlar.update(s.isim for s in sonuclar if s.kabul)
+    sure = time.perf_counter() - baslangic
+
+    sonuc = {"kare_sayisi": len(kareler), "sure_s": sure, "kare_sn": len(kareler) / sure if sure else None}
+    if beklenen is not None:
+        sonuc["tanima_orani"] = len(bulunanlar & beklenen) / len(beklenen) if beklenen else None
+        sonuc["yanlis_kisi"] = len(bulunanlar - beklenen)
+    return sonuc
+
+def olcumleri_yap(args, gecici):
+    """
+    Kadroyu yükler, bütün yapılandırmaları ölçer ve raporu hazırlar
+
+    Args:
+        args (argparse.Namespace): Komut satırı ayarları
+        gecici (str): Kodlama deposu ve veritabanının yazılacağı geçici klasör
+
+    Returns:
+        dict: Ölçüm raporu, kadro kurulamazsa None
+    """
+    # Kadro yükleme: önce boş depoyla (bütün fotoğraflar kodlanır), sonra dolu depoyla
+    depo_yolu = os.path.join(gecici, 'kodlamalar.npz')
+    baslangic = time.perf_counter()
+    fotograf_kodlamalari = kodlamalari_yukle(args.faces, depo_yolu, isci_sayisi=args.isci)
+    yukleme_bos = time.perf_counter() - baslangic
+    baslangic = time.perf_counter()
+    fotograf_kodlamalari = kodlamalari_yukle(args.faces, depo_yolu, isci_sayisi=args.isci)
+    yukleme_dolu = time.perf_counter() - baslangic
+    if not fotograf_kodlamalari:
+        print(f"Hiç yüz bulunamadı! Lütfen '{args.faces}' klasörünü kontrol edin.")
+        return None
+    kadro = Kadro([dosya_adindan_isim(filename) for filename, _ in fotograf_kodlamalari],
+                  [kodlama for _, kodlama in fotograf_kodlamalari], indeks_turu=args.indeks)
+    isimler = kadro.isimler
+    # Bileşik karelerde kişi başına bir fotoğraf (kişi klasörlerinde okunabilen ilk fotoğraf) kullanılır
+    fotograflar = kisi_fotograflari(args.faces, [filename for filename, _ in fotograf_kodlamalari])
+    if not fotograflar:
+        print(f"Okunabilen fotoğraf yok! Lütfen '{args.faces}' klasörünü kontrol edin.")
+        return None
+
+    db = Veritabani(os.path.join(gecici, 'yoklama.db'))
+    try:
+        conn = db.baglanti()
+
+        # Yapılandırmalar: (ad, kareler, beklenen isimler)
+        rng = random.Random(args.tohum)
+        yapilandirmalar = []
+        for cozunurluk in args.cozunurlukler:
+            genislik, yukseklik = (int(v) for v in cozunurluk.lower().split('x'))
+            for yuz_sayisi in args.yuz_sayilari:
+                kareler, beklenen = bilesik_kareler(fotograflar, yuz_sayisi, genislik, yukseklik,
+                                                    args.yuz_olcegi, args.kare, rng)
+                yapilandirmalar.append((f"{cozunurluk} / {yuz_sayisi} yuz", kareler, beklenen))
+        if args.video:
+            from toplu_isle import kareleri_oku
+            kareler = [frame for _, _, frame in itertools.islice(kareleri_oku(args.video), args.video_kare)]
+            yapilandirmalar.append((f"video: {os.path.basename(args.video)}", kareler, None))
+
+        sonuclar = []
+        for ad, kareler, beklenen in yapilandirmalar:
+            olcer = AsamaOlcer()
+            tanimlayici = kadro.tanimlayici(olcek=args.olcek, takip=args.takip, hareket=args.hareket,
+                                            olcer=olcer, tespitci=args.tespitci,
+                                            tam_cozunurlukte_kodla=not args.kucuk_kodlama)
+            ders_id = yeni_ders_baslat(conn, datetime(2000, 1, 1) + timedelta(minutes=len(sonuclar)))  # Her yapılandırmaya ayrı ders
+            sonuc = dict(yapilandirma=ad, **kareleri_isle(kareler, beklenen, tanimlayici, olcer,
+                                                          conn, ders_id, isimler, args.olcek))
+            sonuc["atlanan_tespit"] = tanimlayici.atlanan_tespit
+            sonuc["atlanan_kodlama"] = tanimlayici.atlanan_kodlama
+            sonuc["asamalar"] = olcer.ozet()
+            sonuclar.append(sonuc)
+
+            asamalar = sonuc["asamalar"]
+            print(f"\n{ad}: {sonuc['kare_sn']:.1f} kare/sn"
+                  + (f", tanima orani {sonuc['tanima_orani']:.2f}" if sonuc.get('tanima_orani') is not None else ""))
+            for asama, istatistik in asamalar.items():
+                print(f"  {asama:<12} p50 {istatistik['p50_ms']:8.2f} ms   p95 {istatistik['p95_ms']:8.2f} ms"
+                      f"   ({istatistik['sayi']} olcum)")
+    finally:
+        db.kapat()  # Geçici klasör silinmeden önce bağlantılar kapatılır
+
+    rapor = {
+        "zaman": datetime.now().isoformat(timespec='seconds'),
+        "ortam": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "islemci_sayisi": os.cpu_count(),
+            "opencv": cv2.__version__,
+            "numpy": np.__version__,
+        },
+        "ayarlar": vars(args),
+        "kadro": {
+            "kisi_sayisi": len(kadro),
+            "fotograf_sayisi": len(fotograf_kodlamalari),
+            "matris_satir_sayisi": len(kadro.eslestirici),
+            "yukleme_bos_depo_s": yukleme_bos,
+            "yukleme_dolu_depo_s": yukleme_dolu,
+        },
+        "sonuclar": sonuclar,
+        "en_yuksek_bellek_mb": en_yuksek_bellek_mb(),
+    }
+    if args.tracemalloc:
+        rapor["tracemalloc_tepe_mb"] = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+
+    return rapor
+
+def main():
+    parser = argparse.ArgumentParser(description="Yüz tanıma hattını uçtan uca ölçer")
+    parser.add_argument('--faces', default='faces', help="Yüz fotoğraflarının bulunduğu klasör")
+    parser.add_argument('--yuz-sayilari', type=int, nargs='+', default=[1, 4, 8], help="Karedeki kişi sayıları")
+    parser.add_argument('--cozunurlukler', nargs='+', default=['640x480', '1280x720'], help="GENISLIKxYUKSEKLIK")
+    parser.add_argument('--yuz-olcegi', type=float, default=0.8, help="Fotoğrafın hücresinde kapladığı oran")
+    parser.add_argument('--kare', type=int, default=30, help="Her yapılandırma için kare sayısı")
+    parser.add_argument('--olcek', type=float, default=0.25, help="Tespit öncesi küçültme oranı")
+    parser.add_argument('--indeks', choices=sorted(INDEKS_TURLERI), default='kesin', help="Eşleştirme indeksi")
+    parser.add_argument('--tespitci', choices=sorted(TESPITCI_TURLERI), default='hog', help="Yüz tespitçisi")
+    parser.add_argument('--kucuk-kodlama', action='store_true',
+                        help="Yüzleri orijinal kare yerine tespitle aynı küçültülmüş karede kodlar (eski davranış)")
+    parser.add_argument('--takip', action='store_true', help="Takipçiyi açar")
+    parser.add_argument('--hareket', action='store_true', help="Hareket kapısını açar")
+    parser.add_argument('--video', help="Sentetik kareler yerine (veya yanında) işlenecek kayıtlı video / kare klasörü")
+    parser.add_argument('--video-kare', type=int, default=300, help="Videodan okunacak en fazla kare sayısı")
+    parser.add_argument('--isci', type=int, default=None, help="Kadro kodlama süreç sayısı")
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help="Python bellek ayırmalarının tepe değerini de ölçer (ölçümleri yavaşlatır)")
+    parser.add_argument('--tohum', type=int, default=0, help="Rastgele sayı tohumu")
+    parser.add_argument('--json', help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    if args.tracemalloc:
+        tracemalloc.start()
+    # Kodlama deposu ve veritabanı geçici klasöre yazılır; klasör ölçüm bitince silinir
+    with tempfile.TemporaryDirectory(prefix="tanima_benchmark_") as gecici:
+        rapor = olcumleri_yap(args, gecici)
+    if rapor is None:
+        return
+
+    print(f"\nKadro yukleme: bos depo {rapor['kadro']['yukleme_bos_depo_s']:.2f} sn, "
+          f"dolu depo {rapor['kadro']['yukleme_dolu_depo_s']:.3f} sn")
+    if rapor["en_yuksek_bellek_mb"] is not None:
+        print(f"En yuksek bellek: {rapor['en_yuksek_bellek_mb']:.0f} MB")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(rapor, f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""
+Yüz Tespitçisi Ölçüm Betiği
+Aynı kareler üzerinde tespitçileri (HOG, Haar, LBP, YuNet) ve küçültme oranlarını
+karşılaştırır:
+- Kare başına tespit gecikmesi (p50 / p95)
+- İsabet (recall): bulunan yüzlerin gerçek yüzlere oranı
+- Yanlış tespit: hiçbir gerçek yüze denk gelmeyen kutuların kare başına sayısı
+Sentetik karelerde gerçek yüzler, faces fotoğraflarının yerleştirildiği kutulardır;
+kayıtlı videoda ise referans tespitçinin tam çözünürlükte bulduğu kutular gerçek kabul edilir.
+Bir tespit, merkezi henüz eşleşmemiş bir gerçek kutunun içindeyse isabet sayılır.
+Deneysel tespitçiler (DENEYSEL_TESPITCILER) de burada ölçülebilir; sonuçlar modeller/README.md'dedir.
+
+Kullanım:
+    python benchmark_tespit.py --tespitciler hog haar yunet --olcekler 0.25 0.5
+    python benchmark_tespit.py --video ders.mp4 --referans hog --yunet-model modeller/face_detection_yunet_2023mar.onnx
+"""
+
+import os
+import json
+import time
+import random
+import argparse
+import itertools
+import cv2
+import numpy as np
+from kodlama_deposu import fotograflari_listele
+from tespit import TESPITCI_TURLERI, DENEYSEL_TESPITCILER, tespitci_olustur
+from benchmark_tanima import bilesik_kareler, kisi_fotograflari
+
+def eslestir(tespitler, gercekler):
+    """
+    Tespit kutularını gerçek kutularla birebir eşleştirir
+
+    Args:
+        tespitler (list): Orijinal kare koordinatlarında (top, right, bottom, left) kutular
+        gercekler (list): Aynı koordinatlarda gerçek yüz kutuları
+
+    Returns:
+        tuple: (isabet sayısı, yanlış tespit sayısı)
+    """
+    kalan = list(gercekler)
+    isabet = 0
+    for top, right, bottom, left in tespitler:
+        y, x = (top + bottom) / 2, (left + right) / 2
+        for i, (g_top, g_right, g_bottom, g_left) in enumerate(kalan):
+            if g_top <= y <= g_bottom and g_left <= x <= g_right:
+                del kalan[i]
+                isabet += 1
+                break
+    return isabet, len(tespitler) - isabet
+
+def olc(tespitci, kareler, gercekler, olcek):
+    """
+    Tespitçiyi bütün karelerde küçültülmüş görüntü üzerinde çalıştırır
+
+    Returns:
+        dict: Gecikme yüzdelikleri, isabet oranı ve kare başına yanlış tespit
+    """
+    sureler = []
+    isabet = yanlis = toplam = 0
+    for frame, kutular in zip(kareler, gercekler):
+        small_frame = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), (0, 0), fx=olcek, fy=olcek)
+        baslangic = time.perf_counter()
+        bulunanlar = tespitci.bul(small_frame)
+        sureler.append(time.perf_counter() - baslangic)
+        bulunanlar = [tuple(int(v / olcek) for v in kutu) for kutu in bulunanlar]
+        dogru, hatali = eslestir(bulunanlar, kutular)
+        isabet += dogru
+        yanlis += hatali
+        toplam += len(kutular)
+    sureler_ms = np.array(sureler) * 1000
+    return {
+        "p50_ms": float(np.percentile(sureler_ms, 50)),
+        "p95_ms": float(np.percentile(sureler_ms, 95)),
+        "recall": isabet / toplam if toplam else None,
+        "yanlis_kare_basina": yanlis / len(kareler),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Yüz tespitçilerini aynı karelerde karşılaştırır")
+    turler = list(TESPITCI_TURLERI) + list(DENEYSEL_TESPITCILER)
+    parser.add_argument('--faces', default='faces', help="Yüz fotoğraflarının bulunduğu klasör")
+    parser.add_argument('--tespitciler', nargs='+', choices=sorted(turler), default=turler,
+                        help="Karşılaştırılacak tespitçiler (model dosyası bulunamayanlar atlanır)")
+    parser.add_argument('--olcekler', type=float, nargs='+', default=[0.25, 0.5], help="Tespit öncesi küçültme oranları")
+    parser.add_argument('--yuz-sayilari', type=int, nargs='+', default=[1, 4, 8], help="Karedeki kişi sayıları")
+    parser.add_argument('--cozunurlukler', nargs='+', default=['640x480', '1280x720'], help="GENISLIKxYUKSEKLIK")
+    parser.add_argument('--yuz-olcegi', type=float, default=0.8, help="Fotoğrafın hücresinde kapladığı oran")
+    parser.add_argument('--kare', type=int, default=20, help="Her yapılandırma için kare sayısı")
+    parser.add_argument('--video', help="Sentetik kareler yerine işlenecek kayıtlı video / kare klasörü")
+    parser.add_argument('--video-kare', type=int, default=200, help="Videodan okunacak en fazla kare sayısı")
+    parser.add_argument('--referans', choices=sorted(turler), default='hog',
+                        help="Videoda gerçek kutuları (tam çözünürlükte) belirleyen tespitçi")
+    parser.add_argument('--haar-model', help="Haar kaskat XML dosyası")
+    parser.add_argument('--lbp-model', help="LBP kaskat XML dosyası")
+    parser.add_argument('--yunet-model', help="YuNet ONNX dosyası")
+    parser.add_argument('--tohum', type=int, default=0, help="Rastgele sayı tohumu")
+    parser.add_argument('--json', help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    modeller = {'haar': args.haar_model, 'lbp': args.lbp_model, 'yunet': args.yunet_model}
+    def olustur(tur):
+        if modeller.get(tur):
+            return tespitci_olustur(tur, deneysel=True, model=modeller[tur])
+        return tespitci_olustur(tur, deneysel=True)
+
+    # Yapılandırmalar: (ad, kareler, kare başına gerçek kutular)
+    yapilandirmalar = []
+    if args.video:
+        from toplu_isle import kareleri_oku
+        kareler = [frame for _, _, frame in itertools.islice(kareleri_oku(args.video), args.video_kare)]
+        referans = olustur(args.referans)
+        gercekler = [referans.bul(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)) for frame in kareler]
+        yapilandirmalar.append((f"video: {os.path.basename(args.video)} (referans {args.referans})", kareler, gercekler))
+    else:
+        fotograflar = kisi_fotograflari(args.faces, fotograflari_listele(args.faces))
+        if not fotograflar:
+            print(f"Hiç fotoğraf bulunamadı! Lütfen '{args.faces}' klasörünü kontrol edin.")
+            return
+        rng = random.Random(args.tohum)
+        for cozunurluk in args.cozunurlukler:
+            genislik, yukseklik = (int(v) for v in cozunurluk.lower().split('x'))
+            for yuz_sayisi in args.yuz_sayilari:
+                kareler, _, gercekler = bilesik_kareler(fotograflar, yuz_sayisi, genislik, yukseklik,
+                                                        args.yuz_olcegi, args.kare, rng, kutularla=True)
+                yapilandirmalar.append((f"{cozunurluk} / {yuz_sayisi} yuz", kareler, gercekler))
+
+    sonuclar = []
+    for tur in args.tespitciler:
+        try:
+            tespitci = olustur(tur)
+            tespitci.bul(np.zeros((120, 160, 3), dtype=np.uint8))  # Modeller ölçümden önce yüklenir
+        except (ImportError, OSError, RuntimeError, ValueError, cv2.error) as e:
+            print(f"{tur}: atlaniyor ({e})")
+            continue
+        for olcek in args.olcekler:
+            for ad, kareler, gercekler in yapilandirmalar:
+                sonuclar.append(dict(tespitci=tur, olcek=olcek, yapilandirma=ad,
+                                     **olc(tespitci, kareler, gercekler, olcek)))
+
+    print(f"{'Tespitci':<8} {'Olcek':>5} {'Yapilandirma':<28} {'p50(ms)':>9} {'p95(ms)':>9} {'Recall':>7} {'Yanlis/kare':>11}")
+    for sonuc in sonuclar:
+        recall = f"{sonuc['recall']:.3f}" if sonuc['recall'] is not None else "-"
+        print(f"{sonuc['tespitci']:<8} {sonuc['olcek']:>5.2f} {sonuc['yapilandirma']:<28} {sonuc['p50_ms']:>9.2f} "
+              f"{sonuc['p95_ms']:>9.2f} {recall:>7} {sonuc['yanlis_kare_basina']:>11.2f}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"ayarlar": vars(args), "opencv": cv2.__version__, "sonuclar": sonuclar},
+                      f, ensure_ascii=False, indent=2)
+
+if __name__ == '__main__':
+    main()
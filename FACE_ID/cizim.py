@@ -0,0 +1,244 @@
+"""
+Çizim Modülü
+Bu modül, kamera karesinin üzerine tanınan yüzlerin çerçevelerini ve isimlerini,
+sol üst köşeye de kaydırılabilir katılımcı listesini ve isteğe bağlı performans panelini çizer.
+"""
+
+import cv2
+import numpy as np
+
+ETIKET_YUKSEKLIGI = 30  # Yüz altındaki isim panelinin yüksekliği
+ETIKET_RENGI = (32, 33, 36)  # İsim paneli zemin rengi (BGR)
+
+_etiket_zemini = np.empty((0, 0, 3), dtype=np.uint8)  # İsim panelleri için paylaşılan sabit renkli tampon
+
+def _zemin_al(yukseklik, genislik):
+    """
+    İsim paneli zemininden istenen boyutta bir görünüm döndürür
+
+    Not:
+        Tampon yalnızca daha büyük bir panel gerektiğinde büyütülür; her yüz ve her
+        kare için yeni dizi ayrılmaz
+    """
+    global _etiket_zemini
+    if _etiket_zemini.shape[0] < yukseklik or _etiket_zemini.shape[1] < genislik:
+        _etiket_zemini = np.empty((max(yukseklik, _etiket_zemini.shape[0]),
+                                   max(genislik, _etiket_zemini.shape[1]), 3), dtype=np.uint8)
+        _etiket_zemini[:, :] = ETIKET_RENGI
+    return _etiket_zemini[:yukseklik, :genislik]
+
+def yuzleri_ciz(frame, sonuclar):
+    """
+    Tanınan yüzlerin çerçevelerini ve isim panellerini kareye çizer
+
+    Args:
+        frame (numpy.ndarray): Üzerine çizilecek BGR kare (yerinde değiştirilir)
+        sonuclar (list): Gösterilecek TanimaSonucu listesi
+    """
+    for sonuc in sonuclar:
+        top, right, bottom, left = sonuc.konum
+
+        # Yüz çerçevesi
+        cv2.rectangle(frame, (left-2, top-2), (right+2, bottom+2), (87, 187, 138), 2)
+
+        # Panel konumunu ayarla
+        y1 = bottom
+        y2 = min(bottom + ETIKET_YUKSEKLIGI, frame.shape[0])
+        x1 = max(left - 2, 0)
+        x2 = min(right + 2, frame.shape[1])
+
+        # İsim paneli karenin kendi bölgesiyle yerinde harmanlanır (ara dizi ayrılmaz)
+        if y1 < frame.shape[0] and x1 < frame.shape[1] and y2 > y1 and x2 > x1:
+            panel_region = frame[y1:y2, x1:x2]
+            cv2.addWeighted(panel_region, 0.2, _zemin_al(y2 - y1, x2 - x1), 0.8, 0, dst=panel_region)
+
+        # İsmi yaz
+        cv2.putText(frame, sonuc.isim, (left + 5, bottom + 20),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+
+def katilimci_panelini_ciz(frame, known_face_names, yoklama_durumu, scroll_position, max_visible_items,
+                           sorted_names=None):
+    """
+    Katılımcı listesini ve yoklama durumlarını kareye çizer
+
+    Args:
+        frame (numpy.ndarray): Üzerine çizilecek BGR kare (yerinde değiştirilir)
+        known_face_names (list): Kadrodaki isimler
+        yoklama_durumu (dict): İsim -> katıldı mı
+        scroll_position (int): Listenin kaydırma konumu
+        max_visible_items (int): Aynı anda gösterilecek en fazla kişi sayısı
+        sorted_names (list): Önceden sıralanmış isimler, None ise burada sıralanır
+
+    Not:
+        Canlı döngüde doğrudan değil, KatilimciPaneli önbelleği üzerinden kullanılır
+    """
+    # Katılımcı listesi paneli
+    panel_start_x = 10
+    panel_width = 200
+    panel_start_y = 10  # Panel başlangıç pozisyonu
+
+    # Panel arka planı
+    cv2.rectangle(frame, (panel_start_x-5, panel_start_y-5), 
+                 (panel_start_x + panel_width, panel_start_y + 220),
+                 (32, 33, 36), -1)
+
+    # Başlık paneli
+    cv2.rectangle(frame, (panel_start_x-5, panel_start_y-5), 
+                 (panel_start_x + panel_width, panel_start_y + 20), 
+                 (48, 51, 107), -1)
+    cv2.putText(frame, "KATILIMCILAR", (panel_start_x + 10, panel_start_y + 15),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+
+    # Kaydırma çubuğu
+    scrollbar_height = 200
+    scrollbar_width = 5
+    scrollbar_x = panel_start_x + panel_width - 10
+    scrollbar_height = 180
+
+    # Kaydırma çubuğu arka planı
+    cv2.rectangle(frame,
+                 (scrollbar_x, panel_start_y + 25),
+                 (scrollbar_x + scrollbar_width, panel_start_y + scrollbar_height),
+                 (60, 60, 60), -1)
+
+    # Kaydırma göstergesi
+    if len(known_face_names) > max_visible_items:
+        scroll_ratio = scroll_position / (len(known_face_names) - max_visible_items)
+        scroll_handle_pos = int(panel_start_y + 25 + (scrollbar_height - 30) * scroll_ratio)
+        cv2.rectangle(frame,
+                     (scrollbar_x, scroll_handle_pos),
+                     (scrollbar_x + scrollbar_width, scroll_handle_pos + 30),
+                     (100, 100, 100), -1)
+
+    # Katılımcı listesini göster
+    if sorted_names is None:
+        sorted_names = sorted(known_face_names)  # İsimleri alfabetik sırala
+    visible_names = sorted_names[scroll_position:scroll_position + max_visible_items]  # Görünür isimleri al
+
+    y_offset = panel_start_y + 30  # Liste başlangıç pozisyonu
+
+    # Her görünür isim için
+    for name in visible_names:
+        # Kişi panel arka planı 
+        cv2.rectangle(frame, (panel_start_x-5, y_offset-5), 
+                     (panel_start_x + panel_width - 15, y_offset+20), 
+                     (40, 42, 54), -1)
+
+        # Katılım durumu
+        durum = "KATILDI" if yoklama_durumu[name] else "KATILMADI"
+        renk = (87, 187, 138) if yoklama_durumu[name] else (71, 75, 189)  # Yeşil veya kırmızı
+
+        # İsim ve durumu yaz
+        cv2.putText(frame, f"{name}", (panel_start_x, y_offset+10), 
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+        cv2.putText(frame, durum, (panel_start_x + 100, y_offset+10), 
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.4, renk, 1)
+
+        y_offset += 25  # Sonraki satıra geç
+
+class KatilimciPaneli:
+    """
+    Katılımcı panelini bir kez çizip önbellekte tutan sınıf
+
+    Not:
+        - Panel yalnızca görünen kişilerin yoklama durumu, kaydırma konumu veya kadro
+          değiştiğinde yeniden çizilir; diğer karelerde hazır görüntü kareye kopyalanır
+        - Panel iki farklı zemine çizilerek hangi piksellerin boyandığı bulunur (maske),
+          böylece kopyalama önceki çizimle piksel piksel aynı sonucu verir
+        - İsimler kadro değişmedikçe bir kez sıralanır
+    """
+
+    def __init__(self, max_visible_items=8):
+        """
+        Args:
+            max_visible_items (int): Aynı anda gösterilecek en fazla kişi sayısı
+        """
+        self.max_visible_items = max_visible_items
+        self._kadro_anahtari = None
+        self._sirali = []
+        self._anahtar = None
+        self._goruntu = None  # Panelin boyanmış bölgesi
+        self._maske = None  # Boyanmış pikseller (uint8, 1 = boyalı)
+        self._konum = (0, 0)  # Bölgenin karedeki sol üst köşesi (y, x)
+        self.yeniden_cizim = 0  # Panelin kaç kez yeniden çizildiği
+
+    def _ciz(self, known_face_names, yoklama_durumu, scroll_position):
+        """Paneli boş tuvallere çizer, boyanan bölgeyi ve maskesini saklar"""
+        tuvaller = []
+        for zemin in (0, 255):
+            tuval = np.full((260, 240, 3), zemin, dtype=np.uint8)
+            katilimci_panelini_ciz(tuval, known_face_names, yoklama_durumu, scroll_position,
+                                   self.max_visible_items, sorted_names=self._sirali)
+            tuvaller.append(tuval)
+        maske = np.all(tuvaller[0] == tuvaller[1], axis=2)
+        satirlar, sutunlar = np.nonzero(maske)
+        ust, alt, sol, sag = satirlar.min(), satirlar.max() + 1, sutunlar.min(), sutunlar.max() + 1
+        self._goruntu = tuvaller[0][ust:alt, sol:sag].copy()
+        self._maske = maske[ust:alt, sol:sag].astype(np.uint8)
+        self._konum = (ust, sol)
+        self.yeniden_cizim += 1
+
+    def ciz(self, frame, known_face_names, yoklama_durumu, scroll_position):
+        """
+        Katılımcı panelini kareye yerleştirir, gerekiyorsa önce yeniden çizer
+
+        Args:
+            frame (numpy.ndarray): Üzerine çizilecek BGR kare (yerinde değiştirilir)
+            known_face_names (list): Kadrodaki isimler
+            yoklama_durumu (dict): İsim -> katıldı mı
+            scroll_position (int): Listenin kaydırma konumu
+        """
+        kadro_anahtari = (id(known_face_names), len(known_face_names))
+        if kadro_anahtari != self._kadro_anahtari:
+            self._sirali = sorted(known_face_names)  # İsimleri alfabetik sırala
+            self._kadro_anahtari = kadro_anahtari
+
+        gorunen = self._sirali[scroll_position:scroll_position + self.max_visible_items]
+        anahtar = (kadro_anahtari, scroll_position, tuple(yoklama_durumu[name] for name in gorunen))
+        if anahtar != self._anahtar:
+            self._ciz(known_face_names, yoklama_durumu, scroll_position)
+            self._anahtar = anahtar
+
+        # Hazır panel, karenin sınırları içinde kalan kısmıyla maske üzerinden yerinde kopyalanır
+        # (np.copyto(where=...) bu boyutta cv2.copyTo'dan onlarca kat yavaştır)
+        ust, sol = self._konum
+        yukseklik = min(self._goruntu.shape[0], frame.shape[0] - ust)
+        genislik = min(self._goruntu.shape[1], frame.shape[1] - sol)
+        if yukseklik > 0 and genislik > 0:
+            cv2.copyTo(self._goruntu[:yukseklik, :genislik], self._maske[:yukseklik, :genislik],
+                       frame[ust:ust + yukseklik, sol:sol + genislik])
+
+def performans_panelini_ciz(frame, ozet, sayaclar, panel_start_x=220, panel_start_y=10):
+    """
+    Aşama gecikmelerini ve hat sayaçlarını katılımcı panelinin yanına çizer
+
+    Args:
+        frame (numpy.ndarray): Üzerine çizilecek BGR kare (yerinde değiştirilir)
+        ozet (dict): AsamaOlcer.ozet() çıktısı
+        sayaclar (dict): Sayaç adı -> değer
+        panel_start_x (int): Panelin sol kenarı
+        panel_start_y (int): Panelin üst kenarı
+    """
+    satirlar = [f"{'asama':<11}{'p50':>7}{'p95':>7}{'p99':>7}"]
+    for ad, istatistik in ozet.items():
+        satirlar.append(f"{ad:<11}{istatistik['p50_ms']:>7.1f}{istatistik['p95_ms']:>7.1f}{istatistik['p99_ms']:>7.1f}")
+    satirlar.extend(f"{ad}: {deger}" for ad, deger in sayaclar.items())
+
+    panel_width = 250
+    panel_height = 25 + 16 * len(satirlar)
+
+    # Panel arka planı ve başlık
+    cv2.rectangle(frame, (panel_start_x-5, panel_start_y-5),
+                 (panel_start_x + panel_width, panel_start_y + panel_height),
+                 (32, 33, 36), -1)
+    cv2.rectangle(frame, (panel_start_x-5, panel_start_y-5),
+                 (panel_start_x + panel_width, panel_start_y + 20),
+                 (48, 51, 107), -1)
+    cv2.putText(frame, "PERFORMANS (ms)", (panel_start_x + 10, panel_start_y + 15),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+
+    y_offset = panel_start_y + 38
+    for satir in satirlar:
+        cv2.putText(frame, satir, (panel_start_x, y_offset),
+                    cv2.FONT_HERSHEY_PLAIN, 0.9, (200, 200, 200), 1)
+        y_offset += 16
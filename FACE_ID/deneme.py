@@ -5,19 +5,14 @@ Bu program, kamera kullanarak gerçek zamanlı yüz tanıma yaparak yoklama alan
 """
 
 # Gerekli kütüphanelerin içe aktarılması
-import face_recognition  # Yüz tanıma işlemleri için temel kütüphane
 import cv2              # Görüntü işleme ve kamera kontrolü için OpenCV kütüphanesi
-import os              # Dosya ve klasör işlemleri için işletim sistemi modülü
-import numpy as np     # Matematiksel işlemler ve dizi manipülasyonu için
-from datetime import datetime  # Tarih ve saat işlemleri için
-from yoklama_db import *      # Veritabanı işlemleri için özel modül
+from yoklama_sistemi import Kadro, YoklamaDeposu  # Kadro, tanımlayıcı ve veritabanı erişimi
+from hat import TanimaHatti  # Kamera / tanıma / çizim iş parçacıkları
+from zamanlayici import UyarlamaliZamanlayici  # Yüke göre tanıma sıklığı
+from cizim import yuzleri_ciz, KatilimciPaneli, performans_panelini_ciz  # Kare üzerine çizimler
+from olcum import AsamaOlcer  # Aşama sürelerinin ölçümü
 import time                   # Zaman gecikmesi ve bekletme işlemleri için
-
-# Veritabanı bağlantısını oluştur ve yeni ders başlat
-conn = veritabani_olustur()  # Veritabanı bağlantısı oluşturulur
-ders_id = yeni_ders_baslat(conn)  # Yeni bir ders kaydı başlatılır ve ID'si alınır
-
-print("\nKatılımcılar yükleniyor...") # Kullanıcıya bilgi mesajı gösterilir
+from functools import partial  # Her tanıma işçisi için tanımlayıcı üretimi
 
 # Kaydırma işlemleri için global değişkenler tanımlanır
 scroll_position = 0  # Kaydırma çubuğunun başlangıç pozisyonu
@@ -35,48 +30,9 @@ def mouse_wheel(event, x, y, flags, param):
             scroll_position = min(max(0, len(known_face_names) - max_visible_items), scroll_position + 1) # Pozisyonu aşağı kaydır
 
 # Yüz tanıma için gerekli veri yapıları oluşturulur
-known_face_encodings = []  # Tanınan yüzlerin özellik vektörleri saklanır
 known_face_names = []      # Tanınan yüzlerin isimleri saklanır
-detected_people = set()    # Tespit edilen kişilerin kümesi tutulur
 yoklama_durumu = {}       # Kişilerin yoklama durumu sözlük yapısında saklanır
 
-# Faces klasöründeki fotoğraflar yüklenir ve işlenir
-faces_dir = 'faces'  # Yüz fotoğraflarının bulunduğu klasör yolu
-try:
-    for filename in os.listdir(faces_dir):  # Klasördeki her dosya için döngü
-        if filename.endswith(('.jpg', '.JPG', '.png', '.PNG')):  # Sadece desteklenen resim formatları işlenir
-            filepath = os.path.join(faces_dir, filename)  # Dosyanın tam yolu oluşturulur
-            try:
-                # Görüntü yüklenir ve yüz kodlaması yapılır
-                image = face_recognition.load_image_file(filepath)  # Görüntü dosyası yüklenir
-                face_encodings = face_recognition.face_encodings(image)  # Yüz özellikleri çıkarılır
-                
-                if face_encodings:  # Eğer yüz tespit edildiyse
-                    known_face_encodings.append(face_encodings[0])  # İlk yüzün özelliklerini kaydet
-                    # Dosya adından Türkçe karakterler düzeltilir
-                    name = os.path.splitext(filename)[0]  # Dosya uzantısı kaldırılır
-                    name = name.replace('ı', 'i').replace('ğ', 'g').replace('ü', 'u').replace('ş', 's').replace('ö', 'o').replace('ç', 'c')
-                    name = name.replace('İ', 'I').replace('Ğ', 'G').replace('Ü', 'U').replace('Ş', 'S').replace('Ö', 'O').replace('Ç', 'C')
-                    known_face_names.append(name)  # İsim listeye eklenir
-                    yoklama_durumu[name] = False   # Yoklama durumu başlangıçta false olarak ayarlanır
-                    print(f"{name} yüklendi!")  # Kullanıcıya bilgi verilir
-            except Exception as e:
-                continue  # Hata durumunda sonraki dosyaya geç
-
-    # Yükleme durumu özeti gösterilir
-    print(f"\nYüklenen yüz sayısı: {len(known_face_names)}")
-    print("Tanınacak kişiler:", ", ".join(known_face_names))
-    print("\nKamera başlatılıyor...")
-
-except Exception as e:
-    print(f"Klasör okuma hatası: {e}")  # Klasör okuma hatası durumunda bilgi verilir
-    exit()  # Program sonlandırılır
-
-# Hiç yüz yüklenmemişse program sonlandırılır
-if len(known_face_names) == 0:
-    print("\nHiç yüz bulunamadı! Lütfen 'faces' klasörünü kontrol edin.")
-    exit()
-
 def init_camera():
     """
     Kamera başlatma ve ayarlama fonksiyonu
@@ -94,191 +50,187 @@ def init_camera():
         time.sleep(1)  # 1 saniye beklenir
     return None
 
-# Kamera başlatılır
-video_capture = init_camera()  # Kamera nesnesi oluşturulur
-if video_capture is None:  # Kamera başlatılamazsa
-    print("Hata: Kamera başlatılamadı!")
-    exit()
-
-# Pencere oluşturulur ve fare olayları bağlanır
-cv2.namedWindow('Yuz Tanima Sistemi')  # Ana pencere oluşturulur
-cv2.setMouseCallback('Yuz Tanima Sistemi', mouse_wheel)  # Fare olayları dinlenir
-
-# Performans optimizasyonu için değişkenler
-frame_count = 0  # İşlenen kare sayısı
-process_interval = 3  # Kaç karede bir işlem yapılacağı
-last_face_locations = []  # Son tespit edilen yüz konumları
-last_face_names = []  # Son tespit edilen isimler
-
-# Ana program döngüsü başlar
-while True:
-    ret, frame = video_capture.read()  # Kameradan bir kare alınır
-    if not ret:  # Kare alınamazsa döngü sonlandırılır
-        break
-        
-    frame = cv2.flip(frame, 1)  # Görüntü yatay olarak çevrilir
-    
-    # Her 3 karede bir yüz tanıma işlemi yapılır (performans için)
-    process_this_frame = frame_count % process_interval == 0
-    frame_count += 1
-    
-    if process_this_frame:  # İşlenecek kare ise
-        # Görüntü ön işleme yapılır
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)  # BGR'den RGB'ye dönüşüm
-        small_frame = cv2.resize(rgb_frame, (0, 0), fx=0.25, fy=0.25)  # Görüntü küçültülür
-        
-        # Yüz tespiti ve tanıma işlemleri
-        face_locations = face_recognition.face_locations(small_frame, model="hog")  # Yüz konumları bulunur
-        face_encodings = face_recognition.face_encodings(small_frame, face_locations)  # Yüz özellikleri çıkarılır
-
-        last_face_locations = []  # Yüz konumları listesi temizlenir
-        last_face_names = []  # Yüz isimleri listesi temizlenir
-
-        # Her tespit edilen yüz için işlem yapılır
-        for (top, right, bottom, left), face_encoding in zip(face_locations, face_encodings):
-            # Koordinatlar orijinal boyuta çevrilir
-            top *= 4
-            right *= 4
-            bottom *= 4
-            left *= 4
-            
-            # Yüz eşleştirme işlemi yapılır
-            matches = face_recognition.compare_faces(known_face_encodings, face_encoding, tolerance=0.5)
-            face_distances = face_recognition.face_distance(known_face_encodings, face_encoding)
-            name = "Yetki Yok"  # Varsayılan isim
-            
-            if True in matches:  # Eşleşme varsa
-                best_match_index = np.argmin(face_distances)  # En iyi eşleşme bulunur
-                if matches[best_match_index]:
-                    name = known_face_names[best_match_index]  # Kişinin ismi alınır
-                    similarity = (1 - face_distances[best_match_index]) * 100  # Benzerlik oranı hesaplanır
-                    
-                    # Yoklama kaydı yapılır
-                    if not yoklama_durumu[name]:  # Daha önce kaydedilmemişse
-                        yoklama_durumu[name] = True  # Durumu güncelle
-                        yoklama_ekle(conn, ders_id, name, "KATILDI")  # Veritabanına ekle
-                        print(f"\n{name} derse katıldı! - Benzerlik Orani: %{similarity:.1f}")
-
-            last_face_locations.append((top, right, bottom, left))  # Konum kaydedilir
-            last_face_names.append(name)  # İsim kaydedilir
-
-    # Her karede yüz çerçevelerini çiz
-    for (top, right, bottom, left), name in zip(last_face_locations, last_face_names):
-        # Yüz çerçevesi
-        cv2.rectangle(frame, (left-2, top-2), (right+2, bottom+2), (87, 187, 138), 2)
-        
-        # İsim paneli için arka plan
-        panel_height = 30
-        panel_width = right - left + 4
-        gradient = np.zeros((panel_height, panel_width, 3), dtype=np.uint8)
-        gradient[:, :] = (32, 33, 36)
-        
-        # Panel konumunu ayarla
-        y1 = bottom
-        y2 = min(bottom + panel_height, frame.shape[0])
-        x1 = max(left - 2, 0)
-        x2 = min(right + 2, frame.shape[1])
-        
-        # Gradient paneli yerleştir
-        if y1 < frame.shape[0] and x1 < frame.shape[1] and y2 > y1 and x2 > x1:
-            try:
-                panel_region = frame[y1:y2, x1:x2]
-                gradient_region = gradient[:y2-y1, :x2-x1]
-                if panel_region.shape == gradient_region.shape:
-                    frame[y1:y2, x1:x2] = cv2.addWeighted(
-                        panel_region, 0.2,
-                        gradient_region, 0.8,
-                        0
-                    )
-            except:
-                pass
-        
-        # İsmi yaz
-        cv2.putText(frame, name, (left + 5, bottom + 20),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-
-    # Katılımcı listesi paneli
-    panel_start_x = 10
-    panel_width = 200
-    panel_start_y = 10  # Panel başlangıç pozisyonu
-    
-    # Panel arka planı
-    cv2.rectangle(frame, (panel_start_x-5, panel_start_y-5), 
-                 (panel_start_x + panel_width, panel_start_y + 220),
-                 (32, 33, 36), -1)
-    
-    # Başlık paneli
-    cv2.rectangle(frame, (panel_start_x-5, panel_start_y-5), 
-                 (panel_start_x + panel_width, panel_start_y + 20), 
-                 (48, 51, 107), -1)
-    cv2.putText(frame, "KATILIMCILAR", (panel_start_x + 10, panel_start_y + 15),
-                cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-
-    # Kaydırma çubuğu
-    scrollbar_height = 200
-    scrollbar_width = 5
-    scrollbar_x = panel_start_x + panel_width - 10
-    scrollbar_height = 180
-    
-    # Kaydırma çubuğu arka planı
-    cv2.rectangle(frame,
-                 (scrollbar_x, panel_start_y + 25),
-                 (scrollbar_x + scrollbar_width, panel_start_y + scrollbar_height),
-                 (60, 60, 60), -1)
-    
-    # Kaydırma göstergesi
-    if len(known_face_names) > max_visible_items:
-        scroll_ratio = scroll_position / (len(known_face_names) - max_visible_items)
-        scroll_handle_pos = int(panel_start_y + 25 + (scrollbar_height - 30) * scroll_ratio)
-        cv2.rectangle(frame,
-                     (scrollbar_x, scroll_handle_pos),
-                     (scrollbar_x + scrollbar_width, scroll_handle_pos + 30),
-                     (100, 100, 100), -1)
-
-    # Katılımcı listesini göster
-    sorted_names = sorted(known_face_names)  # İsimleri alfabetik sırala
-    visible_names = sorted_names[scroll_position:scroll_position + max_visible_items]  # Görünür isimleri al
-    
-    y_offset = panel_start_y + 30  # Liste başlangıç pozisyonu
-    
-    # Her görünür isim için
-    for name in visible_names:
-        # Kişi panel arka planı 
-        cv2.rectangle(frame, (panel_start_x-5, y_offset-5), 
-                     (panel_start_x + panel_width - 15, y_offset+20), 
-                     (40, 42, 54), -1)
-        
-        # Katılım durumu
-        durum = "KATILDI" if yoklama_durumu[name] else "KATILMADI"
-        renk = (87, 187, 138) if yoklama_durumu[name] else (71, 75, 189)  # Yeşil veya kırmızı
-        
-        # İsim ve durumu yaz
-        cv2.putText(frame, f"{name}", (panel_start_x, y_offset+10), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
-        cv2.putText(frame, durum, (panel_start_x + 100, y_offset+10), 
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.4, renk, 1)
-        
-        y_offset += 25  # Sonraki satıra geç
-
-    # Görüntüyü göster
-    cv2.imshow('Yuz Tanima Sistemi', frame)
-
-    # 'q' tuşuna basılırsa çık
-    if cv2.waitKey(1) & 0xFF == ord('q'):
-        break
-
-# Temizlik işlemleri
-video_capture.release()  # Kamerayı serbest bırak
-cv2.destroyAllWindows()  # Tüm pencereleri kapat
-
-# Katılmayanları veritabanına ekle
-for name, durum in yoklama_durumu.items():
-    if not durum:
-        yoklama_ekle(conn, ders_id, name, "KATILMADI")
-
-# Sonuç tablosunu göster
-sonuc_tablosu_goster(yoklama_durumu, ders_id)
+# Yüz kodlama işçi süreç sayısı (None: tüm çekirdekler)
+YUKLEME_ISCI_SAYISI = None
+# Eşleştirme indeksi: 'kesin' (küçük kadrolar), 'ivf' (on binlerce kişi) veya
+# 'int8' / 'float16' (daha az bellek, float32 ile yeniden sıralanır)
+ESLESTIRME_INDEKSI = 'kesin'
+# Yüz tespitçisi: 'hog' (varsayılan) veya 'haar' / 'lbp' (opencv-contrib-python ve modeller klasöründeki XML dosyası gerekir)
+YUZ_TESPITCISI = 'hog'
+# Tanıma iş parçacığı sayısı
+TANIMA_ISCI_SAYISI = 1
+# Bir tanıma geçişi için hedef süre (saniye)
+TANIMA_HEDEF_SURESI = 0.08
+# Kayan yüzdelikler için aşama başına tutulan ölçüm sayısı
+PERFORMANS_PENCERESI = 300
+# Performans özetlerinin eklendiği kayıt dosyası (.csv veya .jsonl)
+PERFORMANS_KAYDI = 'performans_kaydi.csv'
+# Performans paneli açıkken kayıt dosyasına kaç saniyede bir özet eklendiği
+PERFORMANS_KAYIT_ARALIGI = 10
+
+def main():
+    """
+    Yoklama programının ana akışı
 
-# Veritabanı bağlantısını kapat
-if conn:
-    conn.close()
\ No newline at end of file
+    Not:
+        Kodlama süreç havuzu Windows'ta ana betiği yeniden içe aktardığından
+        program akışı yalnızca betik doğrudan çalıştırıldığında başlar
+    """
+    # Veritabanına bağlan ve yeni ders başlat
+    depo = YoklamaDeposu()  # Ortak veritabanı (yoklama.db)
+    ders_id = depo.ders_baslat()  # Yeni bir ders kaydı başlatılır ve ID'si alınır
+    olcer = AsamaOlcer(pencere=PERFORMANS_PENCERESI)  # Aşama süreleri (performans paneli için)
+    yazici = depo.yazici(olcer=olcer)  # Yoklama kayıtları arka planda toplu yazılır
+
+    print("\nKatılımcılar yükleniyor...") # Kullanıcıya bilgi mesajı gösterilir
+
+    # Faces klasöründeki fotoğrafların kodlamaları depodan yüklenir
+    # (yalnızca yeni veya değişen fotoğraflar yeniden kodlanır)
+    faces_dir = 'faces'  # Yüz fotoğraflarının bulunduğu klasör yolu
+    try:
+        # Kadro tek bir matriste toplanır
+        kadro = Kadro.klasorden(faces_dir, isci_sayisi=YUKLEME_ISCI_SAYISI,
+                                tolerans=0.5, indeks_turu=ESLESTIRME_INDEKSI)
+        for name in kadro.isimler:  # İsimler dosya adlarından Türkçe karakterleri düzeltilerek üretilir
+            known_face_names.append(name)  # İsim listeye eklenir
+            yoklama_durumu[name] = False   # Yoklama durumu başlangıçta false olarak ayarlanır
+            print(f"{name} yüklendi!")  # Kullanıcıya bilgi verilir
+
+        # Yükleme durumu özeti gösterilir
+        print(f"\nYüklenen yüz sayısı: {len(known_face_names)}")
+        print("Tanınacak kişiler:", ", ".join(known_face_names))
+        print("\nKamera başlatılıyor...")
+
+    except Exception as e:
+        print(f"Klasör okuma hatası: {e}")  # Klasör okuma hatası durumunda bilgi verilir
+        return  # Program sonlandırılır
+
+    # Hiç yüz yüklenmemişse program sonlandırılır
+    if len(known_face_names) == 0:
+        print("\nHiç yüz bulunamadı! Lütfen 'faces' klasörünü kontrol edin.")
+        return
+
+    # Kamera başlatılır
+    video_capture = init_camera()  # Kamera nesnesi oluşturulur
+    if video_capture is None:  # Kamera başlatılamazsa
+        print("Hata: Kamera başlatılamadı!")
+        return
+
+    # Pencere oluşturulur ve fare olayları bağlanır
+    cv2.namedWindow('Yuz Tanima Sistemi')  # Ana pencere oluşturulur
+    cv2.setMouseCallback('Yuz Tanima Sistemi', mouse_wheel)  # Fare olayları dinlenir
+
+    # Tanıma hattı başlatılır: kamera okuma ve yüz tanıma ayrı iş parçacıklarında çalışır,
+    # bu döngü yalnızca en son kareyi ve en son bilinen sonuçları çizer
+    # Her tanıma işçisi kendi tanımlayıcısını (takipçi ve hareket kapısı) alır, eşleştirici ortaktır
+    hat = TanimaHatti(video_capture, partial(kadro.tanimlayici, olcek=0.25, olcer=olcer, tespitci=YUZ_TESPITCISI),
+                      isci_sayisi=TANIMA_ISCI_SAYISI)
+    hat.baslat()
+
+    # Tanıma aralığı ve küçültme oranı ölçülen yüke göre ayarlanır
+    zamanlayici = UyarlamaliZamanlayici(hedef_sure=TANIMA_HEDEF_SURESI)
+    kare_no = 0  # Kameradan alınan son karenin numarası
+    katilimci_paneli = KatilimciPaneli(max_visible_items)  # Yalnızca değiştiğinde yeniden çizilen panel
+
+    # Performans paneli ('p' tuşuyla açılıp kapanır) ve sayaçları
+    performans_acik = False
+    gosterilen_kare = 0  # Ekrana çizilen kare sayısı
+    gonderilen_kare = 0  # Tanımaya gönderilen kare sayısı
+    tamamlanan_kare = 0  # Tanıması biten kare sayısı
+    performans_ozeti, performans_sayaclari = {}, {}
+    son_ozet_zamani = son_kayit_zamani = 0.0
+
+    def sayaclari_topla():
+        """Hattın anlık sayaçlarını ve kuyruk doluluklarını toplar"""
+        return {
+            "kamera kare": kare_no,
+            "gosterilen": gosterilen_kare,
+            "taninan/gonderilen": f"{tamamlanan_kare}/{gonderilen_kare}",
+            "atilan (kuyruk)": hat.atilan_kare,
+            "atlanan tespit": hat.atlanan_tespit,
+            "atlanan kodlama": hat.atlanan_kodlama,
+            "kuyruk giris/sonuc/vt": f"{hat.giris_kuyrugu.qsize()}/{hat.cikis_kuyrugu.qsize()}/{yazici.kuyruk.qsize()}",
+            "aralik / olcek": f"{zamanlayici.aralik} / {zamanlayici.olcek}",
+        }
+
+    # Ana program döngüsü başlar
+    while True:
+        dongu_baslangic = time.perf_counter()
+        with olcer.asama('kare_bekleme'):
+            kare_no, frame = hat.kare_al(kare_no)  # En son kamera karesi alınır
+        if frame is None:
+            if not hat.acik:  # Kamera kapandıysa döngü sonlandırılır
+                break
+            continue
+
+        # Zamanlayıcının seçtiği karelerde tanıma yapılır (işçi yetişemezse eski kare atılır)
+        if zamanlayici.kare_gosterildi():
+            hat.tanimaya_gonder(kare_no, frame, zamanlayici.olcek)
+            gonderilen_kare += 1
+        frame = frame.copy()  # Tanıma işçisinin okuduğu kare üzerine çizim yapılmaz
+
+        # Tamamlanan tanıma sonuçlarıyla yoklama kaydı yapılır
+        for _, sonuclar, sure in hat.yeni_sonuclar():
+            olcer.ekle('tanima', sure)  # İşçideki toplam tanıma süresi
+            tamamlanan_kare += 1
+            zamanlayici.sonuc_bildir(sure, sonuclar)  # Süre ve sahne bilgisi zamanlayıcıya iletilir
+            for sonuc in sonuclar:
+                if sonuc.kabul and not yoklama_durumu[sonuc.isim]:  # Daha önce kaydedilmemişse
+                    yoklama_durumu[sonuc.isim] = True  # Durumu güncelle
+                    yazici.ekle(ders_id, sonuc.isim, "KATILDI")  # Yazma kuyruğuna ekle
+                    similarity = (1 - sonuc.mesafe) * 100  # Benzerlik oranı hesaplanır
+                    print(f"\n{sonuc.isim} derse katıldı! - Benzerlik Orani: %{similarity:.1f}")
+
+        # En son bilinen sonuçlar ve katılımcı listesi çizilir
+        with olcer.asama('cizim'):
+            yuzleri_ciz(frame, hat.son_sonuclar)
+            katilimci_paneli.ciz(frame, known_face_names, yoklama_durumu, scroll_position)
+
+        # Performans paneli: yüzdelikler her karede değil yarım saniyede bir hesaplanır
+        if performans_acik:
+            simdi = time.monotonic()
+            if simdi - son_ozet_zamani >= 0.5:
+                performans_ozeti, performans_sayaclari = olcer.ozet(), sayaclari_topla()
+                son_ozet_zamani = simdi
+            if simdi - son_kayit_zamani >= PERFORMANS_KAYIT_ARALIGI:
+                olcer.kaydet(PERFORMANS_KAYDI, performans_sayaclari)
+                son_kayit_zamani = simdi
+            performans_panelini_ciz(frame, performans_ozeti, performans_sayaclari)
+
+        # Görüntüyü göster
+        with olcer.asama('gosterim'):
+            cv2.imshow('Yuz Tanima Sistemi', frame)
+            tus = cv2.waitKey(1) & 0xFF
+        gosterilen_kare += 1
+        olcer.ekle('dongu', time.perf_counter() - dongu_baslangic)
+
+        # 'q' tuşuna basılırsa çık
+        if tus == ord('q'):
+            break
+        # 'p' tuşu performans panelini açıp kapatır
+        if tus == ord('p'):
+            performans_acik = not performans_acik
+            son_ozet_zamani = 0.0
+        # 'k' tuşu anlık performans özetini kayıt dosyasına ekler
+        if tus == ord('k'):
+            olcer.kaydet(PERFORMANS_KAYDI, sayaclari_topla())
+            print(f"Performans ozeti {PERFORMANS_KAYDI} dosyasina eklendi")
+
+    # Temizlik işlemleri
+    hat.durdur()  # İş parçacıkları durdurulur
+    video_capture.release()  # Kamerayı serbest bırak
+    cv2.destroyAllWindows()  # Tüm pencereleri kapat
+
+    # Bekleyen kayıtlar yazılır ve katılmayanlar tek işlemde veritabanına eklenir
+    yazici.durdur()
+    depo.katilmadi(ders_id, [name for name, durum in yoklama_durumu.items() if not durum])
+
+    # Sonuç tablosunu göster (tkinter yalnızca burada yüklenir)
+    from yoklama_arayuz import sonuc_tablosu_goster
+    sonuc_tablosu_goster(yoklama_durumu, ders_id)
+
+    # Veritabanı bağlantılarını kapat
+    depo.kapat()
+
+if __name__ == '__main__':
+    main()
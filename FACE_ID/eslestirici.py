@@ -0,0 +1,421 @@
+"""
+Yüz Eşleştirme Modülü
+Bu modül, kameradan gelen yüz kodlamalarını kayıtlı kadro ile eşleştirir.
+Kadro tek parça bir float32 matriste tutulur ve bir karedeki bütün yüzler
+tek bir matris işlemiyle karşılaştırılır. Arama, değiştirilebilir bir indeks
+üzerinden yapılır: küçük kadrolar için kesin tarama, on binlerce kişilik
+kadrolar için yaklaşık (IVF) arama veya float16/int8 sıkıştırılmış tarama
+kullanılabilir.
+"""
+
+from collections import namedtuple
+from functools import partial
+import numpy as np
+
+KODLAMA_BOYUTU = 128  # face_recognition kodlama vektörünün uzunluğu
+VARSAYILAN_TOLERANS = 0.5  # Bu mesafenin altındaki eşleşmeler kabul edilir
+
+# Her yüz için eşleştirme sonucu
+# indeks: en yakın kadro kaydının sırası, mesafe: öklid mesafesi, kabul: tolerans içinde mi
+Eslesme = namedtuple('Eslesme', ['indeks', 'mesafe', 'kabul'])
+
+def _kare_normlar(matris):
+    """Satır vektörlerinin kare normlarını hesaplar"""
+    return np.einsum('ij,ij->i', matris, matris)
+
+def _sorgu_matrisi(yuz_kodlamalari):
+    """Sorguları (M, 128) float32 matrise çevirir"""
+    return np.ascontiguousarray(np.asarray(yuz_kodlamalari, dtype=np.float32).reshape(-1, KODLAMA_BOYUTU))
+
+def oklid_mesafeleri(sorgular, matris, matris_kare_normlari):
+    """
+    Sorgularla matris satırları arasındaki öklid mesafelerini hesaplar
+
+    Args:
+        sorgular (numpy.ndarray): (M, 128) sorgu matrisi
+        matris (numpy.ndarray): (N, 128) aday matrisi
+        matris_kare_normlari (numpy.ndarray): Adayların önceden hesaplanmış kare normları
+
+    Returns:
+        numpy.ndarray: (M, N) mesafe matrisi
+
+    Not:
+        Mesafeler |a|^2 + |b|^2 - 2ab açılımıyla tek matris çarpımında bulunur
+    """
+    kare_mesafeler = sorgular @ matris.T
+    kare_mesafeler *= -2
+    kare_mesafeler += _kare_normlar(sorgular)[:, None]
+    kare_mesafeler += matris_kare_normlari[None, :]
+    np.maximum(kare_mesafeler, 0, out=kare_mesafeler)  # Yuvarlama kaynaklı negatifler temizlenir
+    return np.sqrt(kare_mesafeler, out=kare_mesafeler)
+
+def _en_yakinlar(mesafe_matrisi, k):
+    """Her satır için en yakın k sütunu (yakından uzağa) ve mesafelerini döndürür"""
+    k = min(k, mesafe_matrisi.shape[1])
+    if k < mesafe_matrisi.shape[1]:
+        adaylar = np.argpartition(mesafe_matrisi, k - 1, axis=1)[:, :k]
+    else:
+        adaylar = np.broadcast_to(np.arange(k), (mesafe_matrisi.shape[0], k))
+    aday_mesafeleri = np.take_along_axis(mesafe_matrisi, adaylar, axis=1)
+    sira = np.argsort(aday_mesafeleri, axis=1)
+    return np.take_along_axis(adaylar, sira, axis=1), np.take_along_axis(aday_mesafeleri, sira, axis=1)
+
+def en_yakin_merkezler(vektorler, merkezler, parca=8192):
+    """
+    Her vektörü en yakın merkeze atar
+
+    Args:
+        vektorler (numpy.ndarray): (N, 128) vektör matrisi
+        merkezler (numpy.ndarray): (K, 128) merkez matrisi
+        parca (int): Bellek için tek seferde işlenecek vektör sayısı
+
+    Returns:
+        numpy.ndarray: Her vektörün en yakın merkezinin sırası
+    """
+    merkez_kare_normlari = _kare_normlar(merkezler)
+    atamalar = np.empty(vektorler.shape[0], dtype=np.int64)
+    for bas in range(0, vektorler.shape[0], parca):
+        mesafeler = oklid_mesafeleri(vektorler[bas:bas + parca], merkezler, merkez_kare_normlari)
+        atamalar[bas:bas + parca] = np.argmin(mesafeler, axis=1)
+    return atamalar
+
+def kmeans(matris, kume_sayisi, iterasyon=10, rng=None):
+    """
+    Matris satırlarını k-means ile kümelere ayırır
+
+    Args:
+        matris (numpy.ndarray): (N, 128) float32 vektör matrisi
+        kume_sayisi (int): Küme sayısı (N'den büyük olamaz)
+        iterasyon (int): Iterasyon sayısı
+        rng (numpy.random.Generator): Başlangıç merkezleri için üreteç, None ise tohum 0
+
+    Returns:
+        numpy.ndarray: (kume_sayisi, 128) küme merkezleri
+    """
+    rng = rng or np.random.default_rng(0)
+    n = matris.shape[0]
+    merkezler = matris[rng.choice(n, kume_sayisi, replace=False)].copy()
+    for _ in range(iterasyon):
+        atamalar = en_yakin_merkezler(matris, merkezler)
+        sayilar = np.bincount(atamalar, minlength=kume_sayisi)
+        dolu = sayilar > 0
+        # Küme toplamları, kayıtlar kümeye göre sıralanıp tek seferde toplanarak bulunur
+        sira = np.argsort(atamalar, kind='stable')
+        baslangiclar = np.concatenate(([0], np.cumsum(sayilar)[:-1]))[dolu]
+        toplamlar = np.add.reduceat(matris[sira], baslangiclar, axis=0)
+        merkezler[dolu] = toplamlar / sayilar[dolu, None]
+        # Boş kalan kümeler rastgele kayıtlarla yeniden başlatılır
+        bos = np.flatnonzero(~dolu)
+        if len(bos):
+            merkezler[bos] = matris[rng.choice(n, len(bos), replace=False)]
+    return merkezler
+
+def prototipleri_olustur(isimler, kodlamalar, prototip_sayisi=3, iterasyon=10, tohum=0):
+    """
+    Kişi başına birden fazla fotoğrafın kodlamalarını az sayıda prototip vektöre indirger
+
+    Args:
+        isimler (list): Her kodlamanın ait olduğu kişi (aynı kişi birden fazla kez geçebilir)
+        kodlamalar (list): İsimlerle aynı sırada 128 boyutlu yüz kodlamaları
+        prototip_sayisi (int): Kişi başına en fazla prototip sayısı; None ise indirgenmez
+        iterasyon (int): k-means iterasyon sayısı
+        tohum (int): k-means başlangıcı için tohum
+
+    Returns:
+        tuple: (satır isimleri, (P, 128) float32 prototip matrisi); kişiler ilk
+               göründükleri sırada, her kişinin prototipleri art arda
+
+    Not:
+        - Tek fotoğraflı kişi olduğu gibi kalır
+        - Birden fazla fotoğraflı kişi için ilk prototip bütün kodlamaların ortalamasıdır;
+          kalan prototip_sayisi - 1 prototip, kodlamaların k-means küme merkezleridir
+          (farklı ışık, açı, gözlük vb. görünümler ayrı merkezlerde toplanır)
+        - Fotoğraf sayısı prototip sayısını aşmıyorsa merkezler fotoğrafların kendisidir
+    """
+    matris = _sorgu_matrisi(kodlamalar)
+    if prototip_sayisi is None:
+        return list(isimler), matris
+
+    gruplar = {}  # Kişi -> kodlama satırları (ilk görünme sırasıyla)
+    for satir, isim in enumerate(isimler):
+        gruplar.setdefault(isim, []).append(satir)
+
+    rng = np.random.default_rng(tohum)
+    satir_isimleri, prototipler = [], []
+    for isim, satirlar in gruplar.items():
+        kisi = matris[satirlar]
+        if len(satirlar) == 1 or prototip_sayisi == 1:
+            kisi_prototipleri = kisi.mean(axis=0, keepdims=True)
+        else:
+            kume_sayisi = prototip_sayisi - 1
+            merkezler = kisi if len(satirlar) <= kume_sayisi else kmeans(kisi, kume_sayisi, iterasyon, rng)
+            kisi_prototipleri = np.vstack([kisi.mean(axis=0, keepdims=True), merkezler])
+        satir_isimleri.extend([isim] * len(kisi_prototipleri))
+        prototipler.append(kisi_prototipleri)
+
+    if not prototipler:
+        return [], matris
+    return satir_isimleri, np.ascontiguousarray(np.vstack(prototipler), dtype=np.float32)
+
+class KesinIndeks:
+    """
+    Bütün kadroyu tarayan kesin (brute force) indeks
+
+    Not:
+        Birkaç bin kişiye kadar en hızlı ve her zaman doğru seçenektir
+    """
+
+    def __init__(self, matris):
+        """
+        Args:
+            matris (numpy.ndarray): (N, 128) float32 kadro matrisi
+        """
+        self.matris = matris
+        self.kare_normlar = _kare_normlar(matris)
+
+    def ara(self, sorgular, k=1):
+        """
+        Her sorgu için en yakın k kadro kaydını bulur
+
+        Args:
+            sorgular (numpy.ndarray): (M, 128) float32 sorgu matrisi
+            k (int): Döndürülecek komşu sayısı
+
+        Returns:
+            tuple: (M, k) indeks ve (M, k) mesafe matrisleri
+        """
+        return _en_yakinlar(oklid_mesafeleri(sorgular, self.matris, self.kare_normlar), k)
+
+class IVFIndeks:
+    """
+    Ters dosya (IVF) tabanlı yaklaşık en yakın komşu indeksi
+
+    Not:
+        - Kadro k-means ile liste_sayisi kümeye bölünür, her kayıt en yakın kümesinin listesine girer
+        - Arama, sorguya en yakın taranacak_liste kadar kümenin kayıtlarını kesin olarak tarar
+        - taranacak_liste büyüdükçe isabet artar, hız düşer
+    """
+
+    def __init__(self, matris, liste_sayisi=None, taranacak_liste=8, iterasyon=10, tohum=0):
+        """
+        Args:
+            matris (numpy.ndarray): (N, 128) float32 kadro matrisi
+            liste_sayisi (int): Küme sayısı, None ise yaklaşık 4*sqrt(N)
+            taranacak_liste (int): Arama sırasında taranacak en yakın küme sayısı
+            iterasyon (int): k-means iterasyon sayısı
+            tohum (int): Rastgele başlangıç için tohum
+        """
+        self.matris = matris
+        self.kare_normlar = _kare_normlar(matris)
+        n = matris.shape[0]
+        if liste_sayisi is None:
+            liste_sayisi = int(4 * np.sqrt(n))
+        self.liste_sayisi = max(1, min(liste_sayisi, n)) if n else 0
+        self.taranacak_liste = taranacak_liste
+        if n == 0:  # Boş kadro: küme yok, her arama sonuçsuz döner (KesinIndeks ile aynı)
+            self.merkezler = matris[:0].copy()
+            self.merkez_kare_normlari = _kare_normlar(self.merkezler)
+            self.listeler = []
+            return
+
+        self.merkezler = kmeans(matris, self.liste_sayisi, iterasyon, np.random.default_rng(tohum))
+        self.merkez_kare_normlari = _kare_normlar(self.merkezler)
+
+        # Her kayıt en yakın kümesinin listesine yerleştirilir
+        atamalar = en_yakin_merkezler(matris, self.merkezler)
+        sira = np.argsort(atamalar, kind='stable')
+        sinirlar = np.searchsorted(atamalar[sira], np.arange(self.liste_sayisi + 1))
+        self.listeler = [sira[sinirlar[i]:sinirlar[i + 1]] for i in range(self.liste_sayisi)]
+
+    def ara(self, sorgular, k=1):
+        """
+        Her sorgu için yaklaşık en yakın k kadro kaydını bulur
+
+        Args:
+            sorgular (numpy.ndarray): (M, 128) float32 sorgu matrisi
+            k (int): Döndürülecek komşu sayısı
+
+        Returns:
+            tuple: (M, k) indeks ve (M, k) mesafe matrisleri; yeterli aday yoksa
+                   eksik yerler -1 ve sonsuz ile doldurulur
+        """
+        indeksler = np.full((sorgular.shape[0], k), -1, dtype=np.int64)
+        mesafeler = np.full((sorgular.shape[0], k), np.inf, dtype=np.float32)
+        if self.liste_sayisi == 0:
+            return indeksler, mesafeler
+
+        taranacak = min(self.taranacak_liste, self.liste_sayisi)
+        merkez_mesafeleri = oklid_mesafeleri(sorgular, self.merkezler, self.merkez_kare_normlari)
+        en_yakin_kumeler, _ = _en_yakinlar(merkez_mesafeleri, taranacak)
+
+        for i, kumeler in enumerate(en_yakin_kumeler):
+            adaylar = np.concatenate([self.listeler[c] for c in kumeler])
+            if len(adaylar) == 0:
+                continue
+            aday_mesafeleri = oklid_mesafeleri(sorgular[i:i + 1], self.matris[adaylar], self.kare_normlar[adaylar])
+            yerel, yerel_mesafeler = _en_yakinlar(aday_mesafeleri, k)
+            adet = yerel.shape[1]
+            indeksler[i, :adet] = adaylar[yerel[0]]
+            mesafeler[i, :adet] = yerel_mesafeler[0]
+        return indeksler, mesafeler
+
+class NiceltilmisIndeks:
+    """
+    Kadronun float16 veya int8 kopyasını tarayıp en iyi adayları float32 ile yeniden sıralayan indeks
+
+    Not:
+        - İlk tarama, tek parça küçük kopya üzerinde parça parça float32'ye açılarak yapılır;
+          taranan bellek float16'da yarıya, int8'de dörtte bire iner
+        - int8'de her satır kendi ölçeğiyle (en büyük mutlak değer / 127) saklanır
+        - Yaklaşık mesafeye göre en yakın aday_sayisi kayıt, float32 kodlamalarla kesin
+          mesafeye göre yeniden sıralanır; döndürülen mesafeler kesindir
+        - siralama_dosyasi verilirse float32 matris diske yazılıp bellek eşlemeli okunur;
+          bellekte yalnızca küçük kopya ile yeniden sıralanan satırların sayfaları kalır
+        - NumPy float16 çarpımını hızlandırmadığı için float16 açma işlemi int8'den yavaştır
+    """
+
+    def __init__(self, matris, tur='int8', aday_sayisi=8, parca=2048, siralama_dosyasi=None):
+        """
+        Args:
+            matris (numpy.ndarray): (N, 128) float32 kadro matrisi
+            tur (str): Küçük kopyanın türü, 'int8' veya 'float16'
+            aday_sayisi (int): Kesin mesafeyle yeniden sıralanacak aday sayısı
+            parca (int): İlk taramada tek seferde float32'ye açılacak satır sayısı
+            siralama_dosyasi (str): float32 matrisin yazılacağı .npy dosyası (uzantı yoksa eklenir),
+                None ise bellekte tutulur
+        """
+        if tur == 'int8':
+            olcekler = np.abs(matris).max(axis=1) / 127
+            olcekler[olcekler == 0] = 1
+            self.kucuk = np.round(matris / olcekler[:, None]).astype(np.int8)
+            self.olcekler = olcekler.astype(np.float32)
+        elif tur == 'float16':
+            self.kucuk = matris.astype(np.float16)
+            self.olcekler = None
+        else:
+            raise ValueError(f"Bilinmeyen niceleme turu: {tur}")
+        self.tur = tur
+        self.aday_sayisi = aday_sayisi
+        self.parca = parca
+        # Açılmış (yaklaşık) satırların kare normları: ilk taramadaki mesafeler kendi içinde tutarlı olur
+        self.kucuk_kare_normlar = np.concatenate(
+            [_kare_normlar(self._ac(bas, min(bas + parca, matris.shape[0])))
+             for bas in range(0, matris.shape[0], parca)]) if matris.shape[0] else np.zeros(0, np.float32)
+
+        if siralama_dosyasi is not None:
+            # np.save uzantısız yola '.npy' ekler; okunan dosya yazılanla aynı olmalıdır
+            if not siralama_dosyasi.endswith('.npy'):
+                siralama_dosyasi += '.npy'
+            np.save(siralama_dosyasi, matris)
+            matris = np.load(siralama_dosyasi, mmap_mode='r')
+        self.siralama_dosyasi = siralama_dosyasi
+        self.matris = matris
+
+    def kapat(self):
+        """
+        Diskteki float32 kopyanın bellek eşlemesini kapatır; indeks bundan sonra kullanılamaz
+
+        Not:
+            Dosya silinmeden önce çağrılmalıdır (Windows'ta açık eşleme silmeyi engeller)
+        """
+        eslem = getattr(self.matris, '_mmap', None)
+        self.matris = None
+        if eslem is not None:
+            eslem.close()
+
+    def _ac(self, bas, son, tampon=None):
+        """Küçük kopyanın [bas, son) satırlarını float32'ye açar"""
+        tampon = np.empty((son - bas, KODLAMA_BOYUTU), dtype=np.float32) if tampon is None else tampon[:son - bas]
+        np.copyto(tampon, self.kucuk[bas:son], casting='unsafe')
+        if self.olcekler is not None:
+            tampon *= self.olcekler[bas:son, None]
+        return tampon
+
+    def ara(self, sorgular, k=1):
+        """
+        Her sorgu için en yakın k kadro kaydını bulur
+
+        Args:
+            sorgular (numpy.ndarray): (M, 128) float32 sorgu matrisi
+            k (int): Döndürülecek komşu sayısı
+
+        Returns:
+            tuple: (M, k) indeks ve (M, k) kesin mesafe matrisleri
+        """
+        n = self.kucuk.shape[0]
+        # İlk tarama: -2ab + |b|^2 (sorgu normu sıralamayı değiştirmediği için eklenmez)
+        yaklasik = np.empty((sorgular.shape[0], n), dtype=np.float32)
+        tampon = np.empty((min(self.parca, n), KODLAMA_BOYUTU), dtype=np.float32)  # İş parçacığı başına
+        for bas in range(0, n, self.parca):
+            son = min(bas + self.parca, n)
+            np.matmul(sorgular, self._ac(bas, son, tampon).T, out=yaklasik[:, bas:son])
+        yaklasik *= -2
+        yaklasik += self.kucuk_kare_normlar[None, :]
+        adaylar, _ = _en_yakinlar(yaklasik, max(k, self.aday_sayisi))
+
+        # Yeniden sıralama: adayların float32 kodlamalarıyla kesin mesafe
+        indeksler = np.empty((sorgular.shape[0], min(k, n)), dtype=np.int64)
+        mesafeler = np.empty(indeksler.shape, dtype=np.float32)
+        for i, satirlar in enumerate(adaylar):
+            satirlar = np.sort(satirlar)  # Bellek eşlemeli matris sırayla okunur
+            aday_matrisi = np.asarray(self.matris[satirlar], dtype=np.float32)
+            aday_mesafeleri = oklid_mesafeleri(sorgular[i:i + 1], aday_matrisi, _kare_normlar(aday_matrisi))
+            yerel, yerel_mesafeler = _en_yakinlar(aday_mesafeleri, k)
+            indeksler[i] = satirlar[yerel[0]]
+            mesafeler[i] = yerel_mesafeler[0]
+        return indeksler, mesafeler
+
+# İsimle seçilebilen indeks türleri
+INDEKS_TURLERI = {
+    'kesin': KesinIndeks,
+    'ivf': IVFIndeks,
+    'int8': partial(NiceltilmisIndeks, tur='int8'),
+    'float16': partial(NiceltilmisIndeks, tur='float16'),
+}
+
+class YuzEslestirici:
+    """
+    Kadroyu (N, 128) float32 matris olarak tutan toplu eşleştirici
+
+    Not:
+        - Arama, indeks_turu ile INDEKS_TURLERI'nden seçilen indeks üzerinden yapılır:
+          'kesin' (tam tarama), 'ivf' (liste_sayisi, taranacak_liste ayarlarıyla yaklaşık arama),
+          'int8' / 'float16' (NiceltilmisIndeks: sıkıştırılmış tarama ve float32 yeniden sıralama;
+          aday_sayisi, parca ve diskteki float32 kopya için siralama_dosyasi ayarları)
+        - face_recognition.compare_faces ile aynı kabul kuralı kullanılır (mesafe <= tolerans)
+    """
+
+    def __init__(self, kodlamalar, tolerans=VARSAYILAN_TOLERANS, indeks_turu='kesin', **indeks_ayarlari):
+        """
+        Args:
+            kodlamalar (list): Kadrodaki yüz kodlamaları (her biri 128 boyutlu)
+            tolerans (float): Kabul için en büyük mesafe
+            indeks_turu (str): INDEKS_TURLERI içindeki indeks adı
+            **indeks_ayarlari: İndeks sınıfına aktarılan ek ayarlar
+        """
+        self.matris = _sorgu_matrisi(kodlamalar)
+        self.tolerans = tolerans
+        if indeks_turu not in INDEKS_TURLERI:
+            raise ValueError(f"Bilinmeyen indeks turu: {indeks_turu}")
+        self.indeks = INDEKS_TURLERI[indeks_turu](self.matris, **indeks_ayarlari)
+        self.matris = self.indeks.matris  # İndeks matrisi diske taşımış olabilir (bellek eşlemeli)
+
+    def __len__(self):
+        return self.matris.shape[0]
+
+    def eslestir(self, yuz_kodlamalari):
+        """
+        Bir karedeki bütün yüzleri tek seferde kadroyla eşleştirir
+
+        Args:
+            yuz_kodlamalari (list): Karede bulunan yüzlerin kodlamaları
+
+        Returns:
+            list: Her yüz için bir Eslesme, giriş sırasıyla
+        """
+        if len(yuz_kodlamalari) == 0 or len(self) == 0:
+            return [Eslesme(-1, float('inf'), False) for _ in range(len(yuz_kodlamalari))]
+
+        indeksler, mesafeler = self.indeks.ara(_sorgu_matrisi(yuz_kodlamalari), k=1)
+        return [Eslesme(int(indeks), float(mesafe), bool(indeks >= 0 and mesafe <= self.tolerans))
+                for indeks, mesafe in zip(indeksler[:, 0], mesafeler[:, 0])]
@@ -0,0 +1,78 @@
+"""
+Hareket Kapısı Modülü
+Bu modül, küçültülmüş kareyi bir önceki referans kareyle karşılaştırarak sahnede
+değişiklik olup olmadığını ucuzca belirler. Sahne durağansa yüz tespiti hiç
+çalıştırılmaz; değişiklik varsa tespit yalnızca değişen bölgeyle sınırlanır.
+"""
+
+import time
+import cv2
+
+class HareketKapisi:
+    """
+    Kare farkına dayalı hareket algılayıcı
+
+    Not:
+        - Referans kare yalnızca hareket bulunduğunda güncellenir; böylece çok yavaş
+          değişiklikler birikerek eşiği aşar ve gözden kaçmaz
+        - Belirli aralıklarla bütün kare taranır (takipte kaçan yüzlere karşı güvenlik)
+    """
+
+    def __init__(self, piksel_esigi=25, en_az_oran=0.002, kenar_payi=0.25,
+                 tam_kare_orani=0.5, tam_tarama_araligi=5.0):
+        """
+        Args:
+            piksel_esigi (int): Değişmiş sayılmak için gri seviye farkı (0-255)
+            en_az_oran (float): Hareket sayılmak için değişen piksellerin en az oranı
+            kenar_payi (float): Değişen bölgenin her yönde büyütülme oranı
+            tam_kare_orani (float): Bölge karenin bu oranından büyükse bütün kare taranır
+            tam_tarama_araligi (float): Bütün karenin en az taranma aralığı (saniye)
+        """
+        self.piksel_esigi = piksel_esigi
+        self.en_az_oran = en_az_oran
+        self.kenar_payi = kenar_payi
+        self.tam_kare_orani = tam_kare_orani
+        self.tam_tarama_araligi = tam_tarama_araligi
+        self.referans = None
+        self.son_tam_tarama = 0.0
+
+    def kontrol(self, small_frame):
+        """
+        Küçültülmüş karede taranması gereken bölgeyi belirler
+
+        Args:
+            small_frame (numpy.ndarray): Küçültülmüş RGB kare
+
+        Returns:
+            tuple: Taranacak (top, right, bottom, left) bölgesi; sahne durağansa None
+        """
+        yukseklik, genislik = small_frame.shape[:2]
+        tam_kare = (0, genislik, yukseklik, 0)
+        gri = cv2.cvtColor(small_frame, cv2.COLOR_RGB2GRAY)
+        gri = cv2.GaussianBlur(gri, (5, 5), 0)  # Kamera gürültüsü bastırılır
+
+        simdi = time.monotonic()
+        # İlk kare, küçültme oranı değişimi veya periyodik tarama: bütün kare
+        if self.referans is None or self.referans.shape != gri.shape or \
+                simdi - self.son_tam_tarama >= self.tam_tarama_araligi:
+            self.referans = gri
+            self.son_tam_tarama = simdi
+            return tam_kare
+
+        fark = cv2.absdiff(gri, self.referans)
+        _, maske = cv2.threshold(fark, self.piksel_esigi, 255, cv2.THRESH_BINARY)
+        if cv2.countNonZero(maske) < self.en_az_oran * maske.size:
+            return None  # Sahne durağan
+
+        self.referans = gri
+        x, y, w, h = cv2.boundingRect(cv2.findNonZero(maske))
+
+        # Hareketin yalnızca bir kısmı değişmiş olabilir, bölge yüzü kapsayacak şekilde büyütülür
+        pay_x = int(w * self.kenar_payi) + 4
+        pay_y = int(h * self.kenar_payi) + 4
+        ust, alt = max(0, y - pay_y), min(yukseklik, y + h + pay_y)
+        sol, sag = max(0, x - pay_x), min(genislik, x + w + pay_x)
+        if (alt - ust) * (sag - sol) >= self.tam_kare_orani * genislik * yukseklik:
+            self.son_tam_tarama = simdi
+            return tam_kare
+        return (ust, sag, alt, sol)
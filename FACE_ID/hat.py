@@ -0,0 +1,257 @@
+"""
+İşlem Hattı Modülü
+Bu modül, kamera okuma, yüz tanıma ve ekrana çizim adımlarını birbirinden ayırır.
+- KameraOkuyucu: kameradan sürekli okuyup her zaman en son kareyi tutar
+- TanimaIscisi: sınırlı bir kuyruktan kare alıp tanıma yapar, sonuçları kayıpsız yayınlar
+Çizim döngüsü tanımayı beklemeden en son kareyi ve en son bilinen sonuçları gösterir.
+"""
+
+import threading
+import queue
+import time
+import cv2
+
+def en_eskiyi_atarak_ekle(kuyruk, oge):
+    """
+    Sınırlı kuyruğa öğe ekler; kuyruk doluysa en eski öğe atılır
+
+    Args:
+        kuyruk (queue.Queue): Sınırlı kuyruk
+        oge: Eklenecek öğe
+
+    Returns:
+        int: Yer açmak için atılan öğe sayısı
+    """
+    atilan = 0
+    while True:
+        try:
+            kuyruk.put_nowait(oge)
+            return atilan
+        except queue.Full:
+            try:
+                kuyruk.get_nowait()
+                atilan += 1
+            except queue.Empty:
+                pass
+
+class KameraOkuyucu(threading.Thread):
+    """
+    Kameradan sürekli kare okuyan iş parçacığı
+
+    Not:
+        Yalnızca en son kare saklanır; okuyan taraf yetişemezse eski kareler atlanır
+    """
+
+    def __init__(self, video_capture, cevir=True, hiz_siniri=None, name="KameraOkuyucu"):
+        """
+        Args:
+            video_capture (cv2.VideoCapture): Açılmış kamera
+            cevir (bool): Karenin yatay olarak çevrilip çevrilmeyeceği
+            hiz_siniri (float): Saniyede en fazla okunacak kare (video dosyasını kamera gibi
+                oynatmak için), None ise sınırsız
+            name (str): İş parçacığının adı
+        """
+        super().__init__(name=name, daemon=True)
+        self.video_capture = video_capture
+        self.cevir = cevir
+        self.hiz_siniri = hiz_siniri
+        self.kosul = threading.Condition()
+        self.kare = None
+        self.kare_no = 0  # Okunan son karenin sıra numarası
+        self.calisiyor = True
+
+    def run(self):
+        sonraki = time.perf_counter()
+        while self.calisiyor:
+            if self.hiz_siniri:
+                bekleme = sonraki - time.perf_counter()
+                if bekleme > 0:
+                    time.sleep(bekleme)
+                sonraki = max(sonraki, time.perf_counter() - 1.0) + 1.0 / self.hiz_siniri
+            ret, frame = self.video_capture.read()  # Kameradan bir kare alınır
+            if not ret:  # Kare alınamazsa okuma sonlandırılır
+                break
+            if self.cevir:
+                frame = cv2.flip(frame, 1)  # Görüntü yatay olarak çevrilir
+            with self.kosul:
+                self.kare = frame
+                self.kare_no += 1
+                self.kosul.notify_all()
+        with self.kosul:
+            self.calisiyor = False
+            self.kosul.notify_all()
+
+    def yeni_kare_bekle(self, son_gorulen, zaman_asimi=1.0):
+        """
+        son_gorulen numarasından daha yeni bir kare gelene kadar bekler
+
+        Args:
+            son_gorulen (int): Çağıranın en son işlediği kare numarası
+            zaman_asimi (float): Saniye cinsinden en uzun bekleme süresi
+
+        Returns:
+            tuple: (kare numarası, kare); kamera kapandıysa (son_gorulen, None)
+        """
+        with self.kosul:
+            self.kosul.wait_for(lambda: self.kare_no > son_gorulen or not self.calisiyor, zaman_asimi)
+            if self.kare_no > son_gorulen:
+                return self.kare_no, self.kare
+            return son_gorulen, None
+
+    def durdur(self):
+        """Okuma döngüsünü sonlandırır"""
+        self.calisiyor = False
+
+class TanimaIscisi(threading.Thread):
+    """
+    Giriş kuyruğundan kare alıp tanıma yapan iş parçacığı
+
+    Not:
+        - Giriş kuyruğu sınırlıdır ve en eskiyi atma kuralıyla doldurulur, böylece tanıma
+          geride kalırsa bekleyen eski kareler işlenmez
+        - Çıkış kuyruğu sınırsızdır; tanınan hiçbir sonuç atılmaz, çünkü atılan bir sonuç
+          yoklamaya yazılmamış bir öğrenci olabilir
+        - Birden fazla işçi aynı giriş kuyruğunu paylaşabilir; takip ve hareket durumu
+          kareye sırayla bağlı olduğundan her işçinin kendi tanımlayıcısı olmalıdır
+        - Tanıma adımları veritabanına dokunmaz; sonuçlar çıkış kuyruğundan okunur
+    """
+
+    def __init__(self, tanimlayici, giris_kuyrugu, cikis_kuyrugu, no=0):
+        """
+        Args:
+            tanimlayici (YuzTanimlayici): Kare başına tanımayı yapan nesne
+            giris_kuyrugu (queue.Queue): (kare numarası, kare, küçültme oranı) öğeleri
+            cikis_kuyrugu (queue.Queue): (kare numarası, sonuçlar, süre) öğeleri
+            no (int): İşçinin sıra numarası (iş parçacığı adı için)
+        """
+        super().__init__(name=f"TanimaIscisi-{no}", daemon=True)
+        self.tanimlayici = tanimlayici
+        self.giris_kuyrugu = giris_kuyrugu
+        self.cikis_kuyrugu = cikis_kuyrugu
+        self.calisiyor = True
+
+    def run(self):
+        while self.calisiyor:
+            try:
+                kare_no, frame, olcek = self.giris_kuyrugu.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            baslangic = time.perf_counter()
+            try:
+                sonuclar = self.tanimlayici.tani(frame, olcek)
+            except Exception as e:
+                print(f"Tanima hatasi: {e}")
+                continue
+            sure = time.perf_counter() - baslangic
+            self.cikis_kuyrugu.put((kare_no, sonuclar, sure))
+
+    def durdur(self):
+        """İşçiyi elindeki kareyi bitirdikten sonra durdurur"""
+        self.calisiyor = False
+
+class TanimaHatti:
+    """
+    Kamera okuyucu ile tanıma işçilerini bir arada yöneten sınıf
+    """
+
+    def __init__(self, video_capture, tanimlayici, isci_sayisi=1, kuyruk_boyutu=1):
+        """
+        Args:
+            video_capture (cv2.VideoCapture): Açılmış kamera
+            tanimlayici: Her işçi için yeni bir YuzTanimlayici üreten fonksiyon (ör. Kadro.tanimlayici)
+                veya tek bir YuzTanimlayici
+            isci_sayisi (int): Tanıma iş parçacığı sayısı
+            kuyruk_boyutu (int): Tanıma bekleyen en fazla kare sayısı
+
+        Not:
+            Takipçisi veya hareket kapısı olan tek bir tanımlayıcı birden fazla işçiye
+            verilemez (ValueError); işçiler kareleri aynı anda ve karışık sırayla işler,
+            bu da takip izlerini ve hareket referansını bozar.
+            Sonuç kuyruğu sınırsızdır ama büyümez: işçiler en fazla giriş kuyruğuna
+            gelen kare kadar sonuç üretir ve çizim döngüsü her karede kuyruğu boşaltır
+        """
+        if callable(tanimlayici):
+            self.tanimlayicilar = [tanimlayici() for _ in range(isci_sayisi)]
+        else:
+            if isci_sayisi > 1 and (tanimlayici.takipci is not None or tanimlayici.hareket_kapisi is not None):
+                raise ValueError("Takipçili veya hareket kapılı tek bir tanımlayıcı birden fazla işçiyle "
+                                 "paylaşılamaz; her işçi için tanımlayıcı üreten bir fonksiyon verin")
+            self.tanimlayicilar = [tanimlayici] * isci_sayisi
+        self.okuyucu = KameraOkuyucu(video_capture)
+        self.giris_kuyrugu = queue.Queue(maxsize=kuyruk_boyutu)
+        self.cikis_kuyrugu = queue.Queue()
+        self.isciler = [TanimaIscisi(self.tanimlayicilar[i], self.giris_kuyrugu, self.cikis_kuyrugu, no=i)
+                        for i in range(isci_sayisi)]
+        self.atilan_kare = 0  # Tanımaya yetişilemediği için atlanan kare sayısı
+        self.son_sonuc_no = 0  # Ekrana yansıtılan en yeni sonucun kare numarası
+        self.son_sonuclar = []  # Ekrana yansıtılan en yeni tanıma sonuçları
+
+    def baslat(self):
+        """Okuyucu ve işçi iş parçacıklarını başlatır"""
+        self.okuyucu.start()
+        for isci in self.isciler:
+            isci.start()
+
+    @property
+    def atlanan_tespit(self):
+        """Bütün işçilerde sahne durağan olduğu için yapılmayan tespit sayısı"""
+        return sum(t.atlanan_tespit for t in set(self.tanimlayicilar))
+
+    @property
+    def atlanan_kodlama(self):
+        """Bütün işçilerde takip sayesinde hesaplanmayan kodlama sayısı"""
+        return sum(t.atlanan_kodlama for t in set(self.tanimlayicilar))
+
+    @property
+    def acik(self):
+        """Kamera okumaya devam ediyor mu"""
+        return self.okuyucu.calisiyor
+
+    def kare_al(self, son_gorulen, zaman_asimi=1.0):
+        """En son kamera karesini döndürür (bkz. KameraOkuyucu.yeni_kare_bekle)"""
+        return self.okuyucu.yeni_kare_bekle(son_gorulen, zaman_asimi)
+
+    def tanimaya_gonder(self, kare_no, frame, olcek=None):
+        """
+        Kareyi tanıma kuyruğuna ekler; kuyruk doluysa en eski kare atılır
+
+        Args:
+            kare_no (int): Karenin numarası
+            frame (numpy.ndarray): BGR kare
+            olcek (float): Bu kare için küçültme oranı, None ise tanımlayıcının varsayılanı
+        """
+        self.atilan_kare += en_eskiyi_atarak_ekle(self.giris_kuyrugu, (kare_no, frame, olcek))
+
+    def yeni_sonuclar(self):
+        """
+        Çıkış kuyruğundaki sonuçları beklemeden toplar
+
+        Returns:
+            list: (kare numarası, sonuçlar, süre) öğeleri, kare sırasıyla
+
+        Not:
+            Yoklamada kayıp olmaması için her sonuç döndürülür; ekranda gösterilecek
+            en yeni sonuç ayrıca son_sonuclar alanında tutulur (birden fazla işçiden
+            geç gelen eski sonuçlar onu ezmez)
+        """
+        toplanan = []
+        while True:
+            try:
+                toplanan.append(self.cikis_kuyrugu.get_nowait())
+            except queue.Empty:
+                break
+        toplanan.sort(key=lambda oge: oge[0])
+        for kare_no, sonuclar, _ in toplanan:
+            if kare_no > self.son_sonuc_no:
+                self.son_sonuc_no = kare_no
+                self.son_sonuclar = sonuclar
+        return toplanan
+
+    def durdur(self):
+        """Bütün iş parçacıklarını durdurur ve bitmelerini bekler"""
+        self.okuyucu.durdur()
+        for isci in self.isciler:
+            isci.durdur()
+        self.okuyucu.join(timeout=2)
+        for isci in self.isciler:
+            isci.join(timeout=2)
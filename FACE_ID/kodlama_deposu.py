@@ -0,0 +1,323 @@
+"""
+Yüz Kodlama Deposu Modülü
+Bu modül, faces klasöründeki fotoğrafların yüz kodlamalarını diskte saklar.
+Her kişi tek bir fotoğrafla (faces/Ayse Yilmaz.jpg) veya birden fazla fotoğraf içeren
+bir klasörle (faces/Ayse Yilmaz/1.jpg, 2.jpg, ...) kaydedilebilir.
+Program her açıldığında bütün fotoğrafları yeniden kodlamak yerine depo tek seferde okunur;
+yalnızca yeni veya değişen fotoğraflar kodlanır, silinen fotoğraflar depodan çıkarılır.
+"""
+
+import os
+import sys
+import hashlib
+import argparse
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from yoklama_db import isim_normallestir
+
+DESTEKLENEN_UZANTILAR = ('.jpg', '.JPG', '.png', '.PNG')  # Yüz fotoğrafı olarak kabul edilen uzantılar
+VARSAYILAN_DEPO = 'yuz_kodlamalari.npz'  # Kodlamaların saklandığı dosya
+KODLAMA_BOYUTU = 128  # face_recognition kodlama vektörünün uzunluğu
+
+# Depodaki her fotoğraf için tutulan bilgiler
+# kodlama None ise fotoğrafta yüz bulunamamıştır (tekrar denenmesin diye saklanır)
+DepoKaydi = namedtuple('DepoKaydi', ['boyut', 'degisiklik', 'ozet', 'kodlama'])
+
+def dosya_ozeti(filepath):
+    """
+    Dosya içeriğinin SHA-1 özetini hesaplar
+
+    Args:
+        filepath (str): Dosya yolu
+
+    Returns:
+        str: Onaltılık (hex) özet
+    """
+    ozet = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        for parca in iter(lambda: f.read(1 << 20), b''):
+            ozet.update(parca)
+    return ozet.hexdigest()
+
+def dosya_adindan_isim(filename):
+    """
+    Fotoğraf dosyasının adından kişinin ismini üretir
+
+    Args:
+        filename (str): Fotoğrafın faces klasörüne göre yolu (ör. 'Ayşe Yılmaz.jpg'
+            veya kişi klasöründeki bir fotoğraf için 'Ayşe Yılmaz/2.jpg')
+
+    Returns:
+        str: Uzantısı kaldırılmış, Türkçe karakterleri düzeltilmiş isim (ör. 'Ayse Yilmaz');
+            kişi klasöründeki fotoğraflar için klasörün adı
+    """
+    klasor, _, ad = filename.replace(os.sep, '/').rpartition('/')
+    if klasor:
+        return isim_normallestir(klasor)
+    return isim_normallestir(os.path.splitext(ad)[0])  # Dosya uzantısı kaldırılır
+
+def fotograflari_listele(faces_dir):
+    """
+    Faces klasöründeki fotoğrafları ve kişi klasörlerindeki fotoğrafları listeler
+
+    Args:
+        faces_dir (str): Yüz fotoğraflarının bulunduğu klasör
+
+    Returns:
+        list: Fotoğrafların faces klasörüne göre yolları ('Ali.jpg', 'Ayse/1.jpg', ...), sıralı
+
+    Not:
+        Kişi klasörlerinin yalnızca ilk seviyesine bakılır; depo anahtarları işletim
+        sisteminden bağımsız olsun diye '/' ile ayrılır
+    """
+    fotograflar = []
+    for girdi in os.scandir(faces_dir):
+        if girdi.is_dir():
+            fotograflar.extend(f"{girdi.name}/{filename}" for filename in os.listdir(girdi.path)
+                               if filename.endswith(DESTEKLENEN_UZANTILAR))
+        elif girdi.name.endswith(DESTEKLENEN_UZANTILAR):  # Sadece desteklenen resim formatları işlenir
+            fotograflar.append(girdi.name)
+    return sorted(fotograflar)
+
+def goruntu_kodla(filepath):
+    """
+    Bir fotoğraftaki ilk yüzün kodlamasını çıkarır
+
+    Args:
+        filepath (str): Fotoğraf dosyasının yolu
+
+    Returns:
+        numpy.ndarray: 128 boyutlu yüz kodlaması, yüz bulunamazsa None
+    """
+    # face_recognition yalnızca gerçekten kodlama gerektiğinde yüklenir,
+    # böylece değişmemiş bir kadro için açılış dlib modellerini beklemez
+    import face_recognition
+
+    image = face_recognition.load_image_file(filepath)  # Görüntü dosyası yüklenir
+    face_encodings = face_recognition.face_encodings(image)  # Yüz özellikleri çıkarılır
+    if not face_encodings:
+        return None
+    return face_encodings[0]  # İlk yüzün özellikleri kullanılır
+
+def _dosya_kodla(filepath):
+    """
+    Süreç havuzu işçisi: tek bir fotoğrafı kodlar, hatayı yükseltmek yerine döndürür
+
+    Returns:
+        tuple: (kodlama veya None, hata mesajı veya None)
+    """
+    try:
+        return goruntu_kodla(filepath), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+def paralel_kodla(filepaths, isci_sayisi=None):
+    """
+    Fotoğrafları süreç havuzunda paralel olarak kodlar
+
+    Args:
+        filepaths (list): Kodlanacak fotoğraf yolları
+        isci_sayisi (int): İşçi süreç sayısı, None ise çekirdek sayısı kadar
+
+    Yields:
+        tuple: (dosya yolu, kodlama veya None, hata mesajı veya None),
+               giriş sırasıyla ve hazır oldukça
+
+    Not:
+        Kodlama iş parçacıklarıyla paralelleşmediği (GIL) için süreçler kullanılır;
+        tek işçi veya tek dosya için havuz kurulmaz
+    """
+    if isci_sayisi is None:
+        isci_sayisi = os.cpu_count() or 1
+    isci_sayisi = max(1, min(isci_sayisi, len(filepaths)))
+
+    if isci_sayisi == 1:
+        for filepath in filepaths:
+            yield (filepath,) + _dosya_kodla(filepath)
+        return
+
+    with ProcessPoolExecutor(max_workers=isci_sayisi) as havuz:
+        sonuclar = havuz.map(_dosya_kodla, filepaths, chunksize=1)
+        for filepath, (kodlama, hata) in zip(filepaths, sonuclar):
+            yield filepath, kodlama, hata
+
+def depo_oku(depo_yolu=VARSAYILAN_DEPO):
+    """
+    Kodlama deposunu diskten tek seferde okur
+
+    Args:
+        depo_yolu (str): Depo dosyasının yolu
+
+    Returns:
+        dict: dosya adı -> DepoKaydi, depo yoksa veya bozuksa boş sözlük
+    """
+    if not os.path.exists(depo_yolu):
+        return {}
+    try:
+        with np.load(depo_yolu, allow_pickle=False) as veri:
+            dosyalar = veri['dosyalar']
+            boyutlar = veri['boyutlar']
+            degisiklikler = veri['degisiklikler']
+            ozetler = veri['ozetler']
+            yuz_var = veri['yuz_var']
+            kodlamalar = veri['kodlamalar']
+    except (OSError, KeyError, ValueError) as e:
+        print(f"Kodlama deposu okunamadi, yeniden olusturulacak: {e}")
+        return {}
+
+    depo = {}
+    for i, filename in enumerate(dosyalar):
+        kodlama = kodlamalar[i] if yuz_var[i] else None
+        depo[str(filename)] = DepoKaydi(int(boyutlar[i]), int(degisiklikler[i]), str(ozetler[i]), kodlama)
+    return depo
+
+def depo_yaz(depo, depo_yolu=VARSAYILAN_DEPO):
+    """
+    Kodlama deposunu diske yazar
+
+    Args:
+        depo (dict): dosya adı -> DepoKaydi
+        depo_yolu (str): Depo dosyasının yolu
+
+    Not:
+        Önce geçici dosyaya yazılır, ardından yerine taşınır; yazma yarıda kesilirse
+        eski depo bozulmaz
+    """
+    dosyalar = sorted(depo)
+    kodlamalar = np.zeros((len(dosyalar), KODLAMA_BOYUTU), dtype=np.float64)
+    yuz_var = np.zeros(len(dosyalar), dtype=bool)
+    for i, filename in enumerate(dosyalar):
+        if depo[filename].kodlama is not None:
+            kodlamalar[i] = depo[filename].kodlama
+            yuz_var[i] = True
+
+    gecici_yol = depo_yolu + '.tmp'
+    with open(gecici_yol, 'wb') as f:
+        np.savez(f,
+                 dosyalar=np.array(dosyalar, dtype=str),
+                 boyutlar=np.array([depo[d].boyut for d in dosyalar], dtype=np.int64),
+                 degisiklikler=np.array([depo[d].degisiklik for d in dosyalar], dtype=np.int64),
+                 ozetler=np.array([depo[d].ozet for d in dosyalar], dtype=str),
+                 yuz_var=yuz_var,
+                 kodlamalar=kodlamalar)
+    os.replace(gecici_yol, depo_yolu)
+
+def kodlamalari_yukle(faces_dir='faces', depo_yolu=VARSAYILAN_DEPO, isci_sayisi=None):
+    """
+    Faces klasöründeki (ve kişi klasörlerindeki) fotoğrafların kodlamalarını depodan yükler,
+    gerekirse günceller
+
+    Args:
+        faces_dir (str): Yüz fotoğraflarının bulunduğu klasör
+        depo_yolu (str): Kodlama deposunun yolu
+        isci_sayisi (int): Kodlama için işçi süreç sayısı, None ise çekirdek sayısı kadar
+
+    Returns:
+        list: (dosya adı, kodlama) ikilileri, dosya adına göre sıralı; kişi klasöründeki
+              fotoğrafların dosya adı 'Kişi/fotoğraf.jpg' biçimindedir
+
+    Not:
+        - Boyutu ve değişiklik zamanı aynı kalan fotoğraflar doğrudan depodan alınır
+        - Boyutu/zamanı değişen fotoğrafın içerik özeti aynıysa yeniden kodlanmaz
+        - Yeni veya içeriği değişen fotoğraflar paralel kodlanır, silinenler depodan çıkarılır
+        - Kodlanamayan veya yüz bulunamayan her dosya ayrıca raporlanır
+    """
+    eski_depo = depo_oku(depo_yolu)
+    yeni_depo = {}
+    kodlanacaklar = {}  # dosya yolu -> (dosya adı, boyut, değişiklik zamanı, özet)
+    degisti = False
+
+    for filename in fotograflari_listele(faces_dir):
+        filepath = os.path.join(faces_dir, *filename.split('/'))
+        bilgi = os.stat(filepath)
+        kayit = eski_depo.get(filename)
+
+        # Dosya dokunulmamışsa kayıt olduğu gibi kullanılır
+        if kayit and kayit.boyut == bilgi.st_size and kayit.degisiklik == bilgi.st_mtime_ns:
+            yeni_depo[filename] = kayit
+            continue
+
+        degisti = True
+        ozet = dosya_ozeti(filepath)
+        if kayit and kayit.ozet == ozet:  # Sadece zaman damgası değişmiş (kopyalama vb.)
+            yeni_depo[filename] = kayit._replace(boyut=bilgi.st_size, degisiklik=bilgi.st_mtime_ns)
+            continue
+
+        kodlanacaklar[filepath] = (filename, bilgi.st_size, bilgi.st_mtime_ns, ozet)
+
+    # Yeni veya değişen fotoğraflar süreç havuzunda kodlanır
+    if kodlanacaklar:
+        print(f"{len(kodlanacaklar)} fotoğraf kodlanıyor...")
+        hatalar = []
+        for filepath, kodlama, hata in paralel_kodla(list(kodlanacaklar), isci_sayisi):
+            filename, boyut, degisiklik, ozet = kodlanacaklar[filepath]
+            if hata:
+                hatalar.append((filename, hata))  # Depoya yazılmaz, sonraki açılışta yeniden denenir
+                continue
+            if kodlama is None:
+                hatalar.append((filename, "Fotoğrafta yüz bulunamadı"))
+            yeni_depo[filename] = DepoKaydi(boyut, degisiklik, ozet, kodlama)
+
+        for filename, hata in hatalar:
+            print(f"  {filename}: {hata}")
+
+    # Klasörden silinen fotoğraflar depodan çıkarılır
+    if set(eski_depo) - set(yeni_depo):
+        degisti = True
+
+    if degisti:
+        try:
+            depo_yaz(yeni_depo, depo_yolu)
+        except OSError as e:
+            print(f"Kodlama deposu yazilamadi: {e}")
+
+    return [(filename, kayit.kodlama) for filename, kayit in sorted(yeni_depo.items())
+            if kayit.kodlama is not None]
+
+def prototip_raporu(kodlamalar, prototip_sayisi=3):
+    """
+    Kadronun kişi başına prototiplere indirgenmesini raporlar
+
+    Args:
+        kodlamalar (list): kodlamalari_yukle'nin döndürdüğü (dosya adı, kodlama) ikilileri
+        prototip_sayisi (int): Kişi başına en fazla prototip sayısı
+
+    Returns:
+        list: Yazdırılacak rapor satırları
+    """
+    from collections import Counter
+    from eslestirici import prototipleri_olustur
+
+    isimler = [dosya_adindan_isim(filename) for filename, _ in kodlamalar]
+    satir_isimleri, matris = prototipleri_olustur(isimler, [kodlama for _, kodlama in kodlamalar],
+                                                  prototip_sayisi)
+    fotograf_sayilari, prototip_sayilari = Counter(isimler), Counter(satir_isimleri)
+    satirlar = [f"{'Kişi':<30} {'Fotoğraf':>8} {'Prototip':>8}"]
+    satirlar += [f"{isim:<30} {fotograf_sayilari[isim]:>8} {prototip_sayilari[isim]:>8}"
+                 for isim in prototip_sayilari]
+    once = len(isimler) * KODLAMA_BOYUTU * 4  # Eşleştirme matrisi float32 tutulur
+    sonra = matris.shape[0] * KODLAMA_BOYUTU * 4
+    satirlar.append(f"Eşleştirme matrisi: {len(isimler)} -> {matris.shape[0]} satır "
+                    f"({once / 1024:.1f} KB -> {sonra / 1024:.1f} KB, "
+                    f"%{(sonra / once - 1) * 100 if once else 0:+.1f})")
+    return satirlar
+
+if __name__ == '__main__':
+    # Kayıt modu: kamera açmadan faces klasörünü kodlayıp depoyu hazırlar
+    parser = argparse.ArgumentParser(description="Faces klasöründeki fotoğrafları kodlayıp depoya yazar")
+    parser.add_argument('--faces', default='faces', help="Yüz fotoğraflarının bulunduğu klasör")
+    parser.add_argument('--depo', default=VARSAYILAN_DEPO, help="Kodlama deposunun yolu")
+    parser.add_argument('--isci', type=int, default=None, help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--yeniden', action='store_true', help="Depoyu yok sayıp bütün fotoğrafları yeniden kodlar")
+    parser.add_argument('--prototip', type=int, default=3,
+                        help="Rapor için kişi başına en fazla prototip sayısı (ortalama + k-means merkezleri)")
+    args = parser.parse_args()
+
+    if args.yeniden and os.path.exists(args.depo):
+        os.remove(args.depo)
+    kodlamalar = kodlamalari_yukle(args.faces, args.depo, args.isci)
+    print(f"Depodaki yüz sayısı: {len(kodlamalar)}")
+    if kodlamalar:
+        print("\n".join(prototip_raporu(kodlamalar, args.prototip)))
+    sys.exit(0 if kodlamalar else 1)
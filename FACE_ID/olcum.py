@@ -0,0 +1,108 @@
+"""
+Aşama Süresi Ölçüm Modülü
+Bu modül, tanıma hattının adımlarının (küçültme, tespit, kodlama, eşleştirme,
+veritabanı yazma, çizim) ne kadar sürdüğünü ölçer, özetler ve dosyaya kaydeder.
+"""
+
+import os
+import csv
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from datetime import datetime
+import numpy as np
+
+class AsamaOlcer:
+    """
+    Adlandırılmış aşamaların sürelerini toplayan ölçer
+
+    Not:
+        - Birden fazla tanıma işçisi aynı ölçeri paylaşabilir
+        - pencere verilirse her aşama için yalnızca son ölçümler tutulur (kayan yüzdelikler);
+          bir ölçüm yalnızca iki perf_counter çağrısı ve bir ekleme maliyetindedir
+    """
+
+    def __init__(self, pencere=None):
+        """
+        Args:
+            pencere (int): Aşama başına tutulacak en fazla ölçüm, None ise hepsi tutulur
+        """
+        self.pencere = pencere
+        self.sureler = defaultdict(lambda: deque(maxlen=pencere))  # Aşama adı -> saniye cinsinden ölçümler
+        self._kilit = threading.Lock()
+
+    def ekle(self, ad, sure):
+        """Bir aşamanın ölçülmüş süresini kaydeder"""
+        with self._kilit:
+            self.sureler[ad].append(sure)
+
+    @contextmanager
+    def asama(self, ad):
+        """
+        with bloğunun süresini verilen aşamaya kaydeder
+
+        Args:
+            ad (str): Aşamanın adı
+        """
+        baslangic = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.ekle(ad, time.perf_counter() - baslangic)
+
+    def ozet(self):
+        """
+        Her aşamanın gecikme istatistiklerini döndürür
+
+        Returns:
+            dict: Aşama adı -> sayı ve milisaniye cinsinden ortalama/p50/p95/p99/en çok
+        """
+        with self._kilit:
+            kopya = {ad: np.array(sureler) * 1000 for ad, sureler in self.sureler.items() if sureler}
+        ozet = {}
+        for ad, sureler in kopya.items():
+            p50, p95, p99 = np.percentile(sureler, [50, 95, 99])
+            ozet[ad] = {
+                "sayi": int(sureler.size),
+                "ortalama_ms": float(sureler.mean()),
+                "p50_ms": float(p50),
+                "p95_ms": float(p95),
+                "p99_ms": float(p99),
+                "en_cok_ms": float(sureler.max()),
+            }
+        return ozet
+
+    def sifirla(self):
+        """Bütün ölçümleri siler"""
+        with self._kilit:
+            self.sureler.clear()
+
+    def kaydet(self, yol, sayaclar=None):
+        """
+        Anlık özeti kayıt dosyasının sonuna ekler
+
+        Args:
+            yol (str): .csv uzantılıysa aşama başına bir satır, aksi halde her kayıt
+                tek satırlık bir JSON nesnesi olarak eklenir (JSON Lines)
+            sayaclar (dict): Özete eklenecek sayaçlar (işlenen/atılan kare, kuyruk doluluğu vb.)
+        """
+        zaman = datetime.now().isoformat(timespec='seconds')
+        ozet = self.ozet()
+        if yol.lower().endswith('.csv'):
+            yeni = not os.path.exists(yol)
+            with open(yol, 'a', newline='', encoding='utf-8') as f:
+                yazici = csv.writer(f)
+                if yeni:
+                    yazici.writerow(['zaman', 'asama', 'sayi', 'ortalama_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'en_cok_ms'])
+                for ad, istatistik in ozet.items():
+                    yazici.writerow([zaman, ad, istatistik['sayi']] +
+                                    [f"{istatistik[alan]:.3f}" for alan in
+                                     ('ortalama_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'en_cok_ms')])
+                for ad, deger in (sayaclar or {}).items():
+                    yazici.writerow([zaman, ad, deger, '', '', '', '', ''])
+        else:
+            with open(yol, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({"zaman": zaman, "asamalar": ozet, "sayaclar": sayaclar or {}},
+                                   ensure_ascii=False) + "\n")
@@ -0,0 +1,231 @@
+"""
+Çok Kameralı Tanıma Sunucusu Modülü
+Bu modül, birden fazla görüntü kaynağını (kamera, RTSP adresi veya video dosyası)
+aynı anda işleyerek birden fazla derslikte yoklama alır.
+- Kadro (kodlama matrisi) bellekte bir kez tutulur, bütün kaynaklar onu paylaşır
+- Ortak bir işçi havuzu bütün kaynakların karelerini tanır
+- Her kaynağın kendi dersi, takipçisi ve hareket kapısı vardır
+- Bir kaynağın aynı anda en fazla bir karesi işlenir; işçi boşalınca kaynağın en son
+  karesi alınır, arada kalan kareler atlanır
+
+Kullanım:
+    python sunucu.py --kaynak A101=0 --kaynak B203=rtsp://10.0.0.5/yayin --kaynak Deneme=ders.mp4 --isci 4
+"""
+
+import time
+import queue
+import argparse
+import threading
+import cv2
+from kodlama_deposu import VARSAYILAN_DEPO
+from eslestirici import INDEKS_TURLERI
+from tespit import TESPITCI_TURLERI
+from hat import KameraOkuyucu
+from yoklama_sistemi import Kadro, YoklamaDeposu
+
+def kaynak_ac(kaynak):
+    """
+    Kamera numarası, akış adresi veya video dosyası için görüntü kaynağı açar
+
+    Args:
+        kaynak (str): '0' gibi kamera numarası, 'rtsp://...' adresi veya dosya yolu
+
+    Returns:
+        tuple: (cv2.VideoCapture, hız sınırı); açılamazsa (None, None)
+
+    Not:
+        Video dosyaları kendi kare hızında oynatılır, böylece canlı kamera gibi davranır
+    """
+    video_capture = cv2.VideoCapture(int(kaynak) if kaynak.isdigit() else kaynak)
+    if not video_capture.isOpened():
+        video_capture.release()
+        return None, None
+    hiz_siniri = None
+    if not kaynak.isdigit() and '://' not in kaynak:
+        hiz_siniri = video_capture.get(cv2.CAP_PROP_FPS) or 25.0
+    return video_capture, hiz_siniri
+
+class Yayin:
+    """
+    Sunucunun işlediği tek bir görüntü kaynağı (derslik)
+    """
+
+    def __init__(self, ad, kaynak, video_capture, hiz_siniri, ders_id, tanimlayici):
+        """
+        Args:
+            ad (str): Dersliğin adı
+            kaynak (str): Kaynağın açıldığı adres
+            video_capture (cv2.VideoCapture): Açılmış kaynak
+            hiz_siniri (float): Dosya kaynakları için oynatma hızı
+            ders_id (int): Bu derslikte açılan dersin ID'si
+            tanimlayici (YuzTanimlayici): Bu kaynağa ait tanımlayıcı (ortak eşleştiriciyi kullanır)
+        """
+        self.ad = ad
+        self.kaynak = kaynak
+        self.video_capture = video_capture
+        self.okuyucu = KameraOkuyucu(video_capture, cevir=False, hiz_siniri=hiz_siniri,
+                                     name=f"KameraOkuyucu-{ad}")
+        self.ders_id = ders_id
+        self.tanimlayici = tanimlayici
+        self.katilanlar = set()
+        self.mesgul = False  # Bir karesi şu an işçide mi
+        self.son_gonderilen = 0  # İşçiye gönderilen son kare numarası
+        self.islenen = 0  # Tanıması biten kare sayısı
+
+class TanimaSunucusu:
+    """
+    Kaynakları ortak bir işçi havuzuna dağıtan ve yoklamaları yazan sunucu
+    """
+
+    def __init__(self, isci_sayisi=2, yazici=None):
+        """
+        Args:
+            isci_sayisi (int): Bütün kaynaklar için ortak tanıma iş parçacığı sayısı
+            yazici (YoklamaYazici): Yoklama kayıtlarını yazan iş parçacığı
+        """
+        self.yayinlar = []
+        self.yazici = yazici
+        self.kosul = threading.Condition()
+        self.is_kuyrugu = queue.Queue()
+        self.calisiyor = True
+        self.isciler = [threading.Thread(target=self._isci, name=f"SunucuIscisi-{i}", daemon=True)
+                        for i in range(isci_sayisi)]
+
+    def ekle(self, yayin):
+        """Sunucuya bir kaynak ekler"""
+        self.yayinlar.append(yayin)
+
+    def _isci(self):
+        """İş kuyruğundan (yayın, kare) alıp tanır, yeni katılanları yazıcıya iletir"""
+        while self.calisiyor:
+            try:
+                yayin, frame = self.is_kuyrugu.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            try:
+                sonuclar = yayin.tanimlayici.tani(frame)
+            except Exception as e:
+                print(f"{yayin.ad}: Tanima hatasi: {e}")
+                sonuclar = []
+            for sonuc in sonuclar:
+                if sonuc.kabul and sonuc.isim not in yayin.katilanlar:
+                    yayin.katilanlar.add(sonuc.isim)
+                    self.yazici.ekle(yayin.ders_id, sonuc.isim, "KATILDI")
+                    print(f"{yayin.ad}: {sonuc.isim} derse katıldı! - Benzerlik Orani: %{(1 - sonuc.mesafe) * 100:.1f}")
+            with self.kosul:
+                yayin.islenen += 1
+                yayin.mesgul = False
+                self.kosul.notify()
+
+    def calistir(self, durum_araligi=10.0):
+        """
+        Kaynakları ve işçileri başlatır, bütün kaynaklar bitene veya Ctrl+C'ye kadar kare dağıtır
+
+        Args:
+            durum_araligi (float): Kaynak başına işlem hızının kaç saniyede bir yazdırılacağı
+        """
+        for yayin in self.yayinlar:
+            yayin.okuyucu.start()
+        for isci in self.isciler:
+            isci.start()
+
+        son_durum = time.monotonic()
+        onceki_islenen = {yayin.ad: 0 for yayin in self.yayinlar}
+        try:
+            while any(yayin.okuyucu.calisiyor for yayin in self.yayinlar):
+                with self.kosul:
+                    # Boştaki her kaynağın en son karesi işe dönüştürülür
+                    for yayin in self.yayinlar:
+                        if yayin.mesgul:
+                            continue
+                        with yayin.okuyucu.kosul:
+                            kare_no, frame = yayin.okuyucu.kare_no, yayin.okuyucu.kare
+                        if frame is not None and kare_no > yayin.son_gonderilen:
+                            yayin.mesgul = True
+                            yayin.son_gonderilen = kare_no
+                            self.is_kuyrugu.put((yayin, frame))
+                    self.kosul.wait(timeout=0.01)  # İşçi boşalınca veya kısa süre sonra tekrar bakılır
+
+                simdi = time.monotonic()
+                if simdi - son_durum >= durum_araligi:
+                    gecen = simdi - son_durum
+                    print(" | ".join(f"{yayin.ad}: {(yayin.islenen - onceki_islenen[yayin.ad]) / gecen:.1f} kare/sn, "
+                                     f"{len(yayin.katilanlar)} katilan" for yayin in self.yayinlar))
+                    onceki_islenen = {yayin.ad: yayin.islenen for yayin in self.yayinlar}
+                    son_durum = simdi
+        except KeyboardInterrupt:
+            print("\nSunucu durduruluyor...")
+        finally:
+            with self.kosul:  # İşçilerdeki son karelerin sonuçları beklenir
+                self.kosul.wait_for(lambda: not any(yayin.mesgul for yayin in self.yayinlar), timeout=5)
+            self.durdur()
+
+    def durdur(self):
+        """Okuyucuları ve işçileri durdurur, kaynakları serbest bırakır"""
+        self.calisiyor = False
+        for yayin in self.yayinlar:
+            yayin.okuyucu.durdur()
+        for yayin in self.yayinlar:
+            yayin.okuyucu.join(timeout=2)
+            yayin.video_capture.release()
+        for isci in self.isciler:
+            isci.join(timeout=2)
+
+def main():
+    parser = argparse.ArgumentParser(description="Birden fazla kameradan aynı anda yoklama alır")
+    parser.add_argument('--kaynak', action='append', required=True, metavar='AD=KAYNAK',
+                        help="Derslik adı ve kaynağı (kamera numarası, RTSP adresi veya video dosyası); tekrarlanabilir")
+    parser.add_argument('--isci', type=int, default=2, help="Bütün kaynaklar için ortak tanıma iş parçacığı sayısı")
+    parser.add_argument('--faces', default='faces', help="Yüz fotoğraflarının bulunduğu klasör")
+    parser.add_argument('--depo', default=VARSAYILAN_DEPO, help="Kodlama deposu dosyası")
+    parser.add_argument('--indeks', choices=sorted(INDEKS_TURLERI), default='kesin', help="Eşleştirme indeksi")
+    parser.add_argument('--tespitci', choices=sorted(TESPITCI_TURLERI), default='hog', help="Yüz tespitçisi")
+    parser.add_argument('--olcek', type=float, default=0.25, help="Tespit öncesi küçültme oranı")
+    parser.add_argument('--katilmayanlari-yaz', action='store_true',
+                        help="Kapanışta her derslikte görülmeyen kadroyu KATILMADI olarak yazar")
+    args = parser.parse_args()
+
+    # Kadro bir kez yüklenir; bütün kaynaklar aynı eşleştiriciyi (tek matris) kullanır
+    kadro = Kadro.klasorden(args.faces, args.depo, indeks_turu=args.indeks)
+    if not kadro:
+        print(f"Hiç yüz bulunamadı! Lütfen '{args.faces}' klasörünü kontrol edin.")
+        return
+    print(f"Yüklenen yüz sayısı: {len(kadro)}")
+
+    depo = YoklamaDeposu()
+    yazici = depo.yazici()
+    sunucu = TanimaSunucusu(isci_sayisi=args.isci, yazici=yazici)
+
+    for tanim in args.kaynak:
+        ad, _, kaynak = tanim.partition('=')
+        if not kaynak:
+            ad, kaynak = f"Kaynak{len(sunucu.yayinlar) + 1}", ad
+        video_capture, hiz_siniri = kaynak_ac(kaynak)
+        if video_capture is None:
+            print(f"{ad}: {kaynak} acilamadi, atlaniyor")
+            continue
+        ders_id = depo.ders_baslat()
+        if ders_id is None:
+            video_capture.release()
+            continue
+        tanimlayici = kadro.tanimlayici(olcek=args.olcek, tespitci=args.tespitci)
+        sunucu.ekle(Yayin(ad, kaynak, video_capture, hiz_siniri, ders_id, tanimlayici))
+        print(f"{ad}: {kaynak} -> ders {ders_id}")
+
+    if not sunucu.yayinlar:
+        print("Hiçbir kaynak açılamadı!")
+        yazici.durdur()
+        return
+
+    sunucu.calistir()
+
+    # Bekleyen kayıtlar yazılır, istenirse katılmayanlar eklenir
+    yazici.durdur()
+    for yayin in sunucu.yayinlar:
+        if args.katilmayanlari_yaz:
+            depo.katilmadi(yayin.ders_id, sorted(set(kadro.isimler) - yayin.katilanlar))
+        print(f"{yayin.ad} (ders {yayin.ders_id}): {len(yayin.katilanlar)} katilan, {yayin.islenen} kare islendi")
+    depo.kapat()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+"""
+Yüz Takip Modülü
+Bu modül, ardışık tanıma geçişlerinde bulunan yüz konumlarını örtüşme (IoU) ile
+birbirine bağlar. Kimliği birkaç geçiş boyunca tutarlı çıkan bir yüz "onaylı" sayılır
+ve sonraki geçişlerde yeniden kodlanmaz; kimliği taşınır. Böylece yerinde oturan,
+yoklaması alınmış öğrenciler için her geçişte 128 boyutlu kodlama hesaplanmaz.
+"""
+
+import itertools
+import threading
+
+def iou(a, b):
+    """
+    İki yüz kutusunun kesişim / birleşim oranını hesaplar
+
+    Args:
+        a (tuple): (top, right, bottom, left)
+        b (tuple): (top, right, bottom, left)
+
+    Returns:
+        float: 0 ile 1 arasında örtüşme oranı
+    """
+    ust = max(a[0], b[0])
+    sag = min(a[1], b[1])
+    alt = min(a[2], b[2])
+    sol = max(a[3], b[3])
+    if alt <= ust or sag <= sol:
+        return 0.0
+    kesisim = (alt - ust) * (sag - sol)
+    alan_a = (a[2] - a[0]) * (a[1] - a[3])
+    alan_b = (b[2] - b[0]) * (b[1] - b[3])
+    return kesisim / float(alan_a + alan_b - kesisim)
+
+class Iz:
+    """
+    Geçişler boyunca takip edilen tek bir yüz
+    """
+
+    def __init__(self, iz_no, konum):
+        self.iz_no = iz_no
+        self.konum = konum  # Orijinal karedeki (top, right, bottom, left)
+        self.isim = None  # Son kodlamada bulunan kişi (tanınmadıysa None)
+        self.mesafe = float('inf')
+        self.kabul = False
+        self.ardisik_ayni = 0  # Aynı kimliğin üst üste kabul edildiği geçiş sayısı
+        self.onayli = False  # Kimlik yeterince tutarlı mı (kodlama atlanabilir)
+        self.kayip = 0  # Üst üste bulunamadığı geçiş sayısı
+        self.dogrulamadan_beri = 0  # Son kodlamadan beri geçen geçiş sayısı
+
+class YuzTakipci:
+    """
+    Tanıma geçişleri arasında yüzleri IoU ile eşleştirip kimlik taşıyan takipçi
+
+    Not:
+        - Eşleştirme açgözlüdür: en yüksek örtüşmeli çiftler önce bağlanır
+        - Onaylı izler de dogrulama_araligi geçişte bir yeniden kodlanır
+        - Kutular orijinal kare ölçeğinde tutulur, küçültme oranı değişse de eşleşir
+    """
+
+    def __init__(self, iou_esigi=0.3, onay_sayisi=2, kayip_siniri=2, dogrulama_araligi=30):
+        """
+        Args:
+            iou_esigi (float): Aynı yüz sayılmak için gereken en az örtüşme
+            onay_sayisi (int): Onay için aynı kimliğin üst üste kabul edilme sayısı
+            kayip_siniri (int): Bu kadar geçiş bulunamayan iz silinir
+            dogrulama_araligi (int): Onaylı izlerin yeniden kodlanma aralığı (geçiş)
+        """
+        self.iou_esigi = iou_esigi
+        self.onay_sayisi = onay_sayisi
+        self.kayip_siniri = kayip_siniri
+        self.dogrulama_araligi = dogrulama_araligi
+        self.izler = []
+        self._sayac = itertools.count(1)
+        self._kilit = threading.Lock()
+
+    def iliskilendir(self, konumlar):
+        """
+        Yeni geçişte bulunan konumları mevcut izlere bağlar
+
+        Args:
+            konumlar (list): Orijinal karedeki (top, right, bottom, left) kutular
+
+        Returns:
+            list: Her konum için bir Iz (eşleşmeyen konumlar için yeni iz), giriş sırasıyla
+        """
+        with self._kilit:
+            adaylar = sorted(((iou(iz.konum, konum), i, j)
+                              for i, iz in enumerate(self.izler)
+                              for j, konum in enumerate(konumlar)), reverse=True)
+            iz_secildi = set()
+            sonuc = [None] * len(konumlar)
+            for oran, i, j in adaylar:
+                if oran < self.iou_esigi:
+                    break
+                if i in iz_secildi or sonuc[j] is not None:
+                    continue
+                iz_secildi.add(i)
+                sonuc[j] = self.izler[i]
+
+            # Bulunamayan izler yaşlandırılır, sınırı aşanlar silinir
+            for i, iz in enumerate(self.izler):
+                if i not in iz_secildi:
+                    iz.kayip += 1
+            self.izler = [iz for iz in self.izler if iz.kayip < self.kayip_siniri]
+
+            for j, konum in enumerate(konumlar):
+                if sonuc[j] is None:
+                    sonuc[j] = Iz(next(self._sayac), konum)
+                    self.izler.append(sonuc[j])
+                iz = sonuc[j]
+                iz.konum = konum
+                iz.kayip = 0
+                iz.dogrulamadan_beri += 1
+            return sonuc
+
+    def kodlama_gerekli(self, iz):
+        """Izin bu geçişte yeniden kodlanması gerekip gerekmediğini döndürür"""
+        return not iz.onayli or iz.dogrulamadan_beri >= self.dogrulama_araligi
+
+    def kimlik_guncelle(self, iz, isim, mesafe, kabul):
+        """
+        Kodlanan bir izin eşleştirme sonucunu kaydeder
+
+        Args:
+            iz (Iz): Güncellenen iz
+            isim (str): Eşleşen kişi (kabul edilmediyse None)
+            mesafe (float): En yakın kadro kaydına mesafe
+            kabul (bool): Eşleşme tolerans içinde mi
+        """
+        with self._kilit:
+            if kabul and iz.kabul and iz.isim == isim:
+                iz.ardisik_ayni += 1
+            else:
+                iz.ardisik_ayni = 1 if kabul else 0
+            iz.isim = isim if kabul else None
+            iz.mesafe = mesafe
+            iz.kabul = kabul
+            iz.onayli = iz.ardisik_ayni >= self.onay_sayisi
+            iz.dogrulamadan_beri = 0
@@ -0,0 +1,171 @@
+"""
+Yüz Tanıma Modülü
+Bu modül, tek bir kamera karesi üzerinde yüz tespiti, kodlama ve kadroyla
+eşleştirme adımlarını yürütür. Veritabanı ve ekran işlemleri içermez; böylece
+ayrı bir iş parçacığında çalıştırılabilir. Takipçi verilirse kimliği onaylanmış
+yüzler yeniden kodlanmaz; hareket kapısı verilirse durağan karelerde tespit atlanır.
+Yüz tespiti değiştirilebilir bir tespitçiyle (tespit modülü) küçültülmüş karede yapılır,
+varsayılanı HOG'dur; kodlama ise tam çözünürlüklü karede, bulunan kutuların üzerinde yapılır.
+"""
+
+from collections import namedtuple
+from contextlib import nullcontext
+import cv2
+import numpy as np
+from tespit import HogTespitci
+
+BILINMEYEN_ISIM = "Yetki Yok"  # Kadroda eşleşme bulunamayan yüzler için gösterilen isim
+
+# Bir yüz için tanıma sonucu
+# konum: orijinal karedeki (top, right, bottom, left), isim: eşleşen kişi veya BILINMEYEN_ISIM,
+# mesafe: en yakın kadro kaydına mesafe, kabul: eşleşme tolerans içinde mi
+TanimaSonucu = namedtuple('TanimaSonucu', ['konum', 'isim', 'mesafe', 'kabul'])
+
+class YuzTanimlayici:
+    """
+    Kareleri küçültüp yüzleri tespit eden, kodlayan ve kadroyla eşleştiren sınıf
+    """
+
+    def __init__(self, eslestirici, isimler, olcek=0.25, takipci=None, hareket_kapisi=None, olcer=None,
+                 tespitci=None, tam_cozunurlukte_kodla=True):
+        """
+        Args:
+            eslestirici (YuzEslestirici): Kadroyu tutan eşleştirici
+            isimler (list): Eşleştiricideki sırayla kişi isimleri
+            olcek (float): Tespit öncesi karenin küçültülme oranı
+            takipci (YuzTakipci): Geçişler arası kimlik taşıyan takipçi, None ise her yüz her geçişte kodlanır
+            hareket_kapisi (HareketKapisi): Durağan karelerde tespiti atlayan kapı, None ise her kare taranır
+            olcer (AsamaOlcer): Aşama sürelerini toplayan ölçer, None ise ölçüm yapılmaz
+            tespitci: bul(rgb) yöntemi olan yüz tespitçisi, None ise HOG
+            tam_cozunurlukte_kodla (bool): Yüzler orijinal karede mi kodlansın (False ise
+                tespitle aynı küçültülmüş karede kodlanır)
+        """
+        self.eslestirici = eslestirici
+        self.isimler = isimler
+        self.olcek = olcek
+        self.takipci = takipci
+        self.hareket_kapisi = hareket_kapisi
+        self.olcer = olcer
+        self.tespitci = tespitci if tespitci is not None else HogTespitci()
+        self.tam_cozunurlukte_kodla = tam_cozunurlukte_kodla
+        self.son_sonuclar = []  # Önceki geçişin sonuçları (durağan sahnede aynen döndürülür)
+        self.atlanan_kodlama = 0  # Takip sayesinde hesaplanmayan kodlama sayısı
+        self.atlanan_tespit = 0  # Sahne durağan olduğu için yapılmayan tespit sayısı
+
+    def _tespit_et(self, small_frame, bolge):
+        """
+        Küçültülmüş karenin verilen bölgesinde yüzleri bulur
+
+        Returns:
+            list: Küçültülmüş kare koordinatlarında (top, right, bottom, left) kutular
+        """
+        ust, sag, alt, sol = bolge
+        if (ust, sag, alt, sol) == (0, small_frame.shape[1], small_frame.shape[0], 0):
+            return list(self.tespitci.bul(small_frame))
+        kesit = np.ascontiguousarray(small_frame[ust:alt, sol:sag])
+        return [(top + ust, right + sol, bottom + ust, left + sol)
+                for top, right, bottom, left in self.tespitci.bul(kesit)]
+
+    def _kodla(self, rgb_frame, small_frame, face_locations, konumlar):
+        """
+        Verilen yüzlerin 128 boyutlu kodlamalarını çıkarır
+
+        Args:
+            rgb_frame (numpy.ndarray): Orijinal çözünürlükte RGB kare
+            small_frame (numpy.ndarray): Tespitin yapıldığı küçültülmüş RGB kare
+            face_locations (list): Küçültülmüş karedeki kutular
+            konumlar (list): Aynı yüzlerin orijinal karedeki kutuları
+
+        Returns:
+            list: Her yüz için bir kodlama
+
+        Not:
+            dlib yüz işaretlerini ve hizalanmış yüz kesitini yalnızca kutunun çevresinden
+            okur; bu yüzden tam çözünürlükte kodlamanın maliyeti kare boyutuyla değil
+            yüz sayısıyla artar ve kare kopyalanmadan kutular üzerinde çalışılır
+        """
+        # face_recognition (dlib modelleri) ilk kodlamada yüklenir; modülü içe aktarmak
+        # ekransız işçilerin ve yalnızca veritabanı kullanan araçların açılışını yavaşlatmaz
+        import face_recognition
+
+        if self.tam_cozunurlukte_kodla:
+            return face_recognition.face_encodings(rgb_frame, konumlar)
+        return face_recognition.face_encodings(small_frame, face_locations)
+
+    def _asama(self, ad):
+        """Ölçer varsa aşamanın süresini ölçen, yoksa hiçbir şey yapmayan bağlam döndürür"""
+        return self.olcer.asama(ad) if self.olcer is not None else nullcontext()
+
+    def tani(self, frame, olcek=None):
+        """
+        Bir BGR kamera karesindeki bütün yüzleri tanır
+
+        Args:
+            frame (numpy.ndarray): Kameradan gelen (çevrilmiş) BGR kare
+            olcek (float): Bu kare için küçültme oranı, None ise self.olcek
+
+        Returns:
+            list: Her yüz için bir TanimaSonucu
+        """
+        if olcek is None:
+            olcek = self.olcek
+
+        # Görüntü ön işleme yapılır
+        with self._asama('kucultme'):
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)  # BGR'den RGB'ye dönüşüm (kodlama için)
+            small_frame = cv2.resize(rgb_frame, (0, 0), fx=olcek, fy=olcek)  # Tespit küçültülmüş karede yapılır
+
+        # Hareket kapısı: durağan sahnede tespit atlanır, aksi halde yalnızca değişen bölge taranır
+        bolge = (0, small_frame.shape[1], small_frame.shape[0], 0)
+        if self.hareket_kapisi is not None:
+            with self._asama('hareket'):
+                bolge = self.hareket_kapisi.kontrol(small_frame)
+            if bolge is None:
+                self.atlanan_tespit += 1
+                return list(self.son_sonuclar)
+
+        # Yüz tespiti yapılır
+        with self._asama('tespit'):
+            face_locations = self._tespit_et(small_frame, bolge)  # Yüz konumları bulunur
+
+        # Taranan bölgenin tamamen dışında kalan önceki yüzler yerinde kabul edilir
+        ust, sag, alt, sol = bolge
+        for sonuc in self.son_sonuclar:
+            top, right, bottom, left = (int(v * olcek) for v in sonuc.konum)
+            if bottom <= ust or top >= alt or right <= sol or left >= sag:
+                face_locations.append((top, right, bottom, left))
+
+        # Koordinatlar orijinal boyuta çevrilir
+        konumlar = [(int(top / olcek), int(right / olcek), int(bottom / olcek), int(left / olcek))
+                    for top, right, bottom, left in face_locations]
+
+        if self.takipci is None:
+            with self._asama('kodlama'):
+                face_encodings = self._kodla(rgb_frame, small_frame, face_locations, konumlar)  # Yüz özellikleri çıkarılır
+            with self._asama('eslestirme'):
+                eslesmeler = self.eslestirici.eslestir(face_encodings)  # Bütün yüzler tek seferde eşleştirilir
+            sonuclar = []
+            for konum, eslesme in zip(konumlar, eslesmeler):
+                isim = self.isimler[eslesme.indeks] if eslesme.kabul else BILINMEYEN_ISIM
+                sonuclar.append(TanimaSonucu(konum, isim, eslesme.mesafe, eslesme.kabul))
+            self.son_sonuclar = sonuclar
+            return sonuclar
+
+        # Yüzler önceki geçişlerdeki izlere bağlanır, yalnızca yeni veya onaysız izler kodlanır
+        with self._asama('takip'):
+            izler = self.takipci.iliskilendir(konumlar)
+        kodlanacak = [i for i, iz in enumerate(izler) if self.takipci.kodlama_gerekli(iz)]
+        self.atlanan_kodlama += len(izler) - len(kodlanacak)
+        if kodlanacak:
+            with self._asama('kodlama'):
+                face_encodings = self._kodla(rgb_frame, small_frame, [face_locations[i] for i in kodlanacak],
+                                             [konumlar[i] for i in kodlanacak])
+            with self._asama('eslestirme'):
+                eslesmeler = self.eslestirici.eslestir(face_encodings)
+            for i, eslesme in zip(kodlanacak, eslesmeler):
+                isim = self.isimler[eslesme.indeks] if eslesme.kabul else None
+                self.takipci.kimlik_guncelle(izler[i], isim, eslesme.mesafe, eslesme.kabul)
+
+        self.son_sonuclar = [TanimaSonucu(iz.konum, iz.isim if iz.kabul else BILINMEYEN_ISIM, iz.mesafe, iz.kabul)
+                             for iz in izler]
+        return self.son_sonuclar
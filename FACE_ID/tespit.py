@@ -0,0 +1,296 @@
+"""
+Yüz Tespit Modülü
+Bu modül, küçültülmüş karede yüz kutularını bulan değiştirilebilir tespitçileri içerir:
+- 'hog': face_recognition (dlib) HOG tespitçisi, varsayılan ve en isabetli CPU seçeneği
+- 'haar' / 'lbp': OpenCV kaskat sınıflandırıcıları, en hızlı ama yan yüzlerde zayıf
+- 'yunet': OpenCV'nin cv2.FaceDetectorYN (YuNet) DNN tespitçisi; gerçek modelle doğrulanana
+  kadar deneyseldir, yalnızca ölçüm betiğinden veya hazır nesne olarak kullanılır
+OpenCV tespitçileri model dosyalarını çevrimdışı okur; dosyalar verilen yolda, bu
+modülün yanındaki 'modeller' klasöründe veya OpenCV'nin kaskat klasöründe aranır.
+Bütün tespitçiler RGB kare alır ve (top, right, bottom, left) kutular döndürür.
+
+Model dosyaları bir kez indirilir (bkz. modeller/README.md):
+    python tespit.py indir              # Bütün modeller
+    python tespit.py indir lbp yunet    # Yalnızca seçilenler
+"""
+
+import os
+import sys
+import argparse
+import threading
+import urllib.request
+from functools import partial
+import cv2
+import numpy as np
+
+MODEL_KLASORU = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'modeller')
+
+# Kaskat türü -> varsayılan model dosyası
+KASKAT_DOSYALARI = {
+    'haar': 'haarcascade_frontalface_default.xml',
+    'lbp': 'lbpcascade_frontalface_improved.xml',
+}
+YUNET_DOSYASI = 'face_detection_yunet_2023mar.onnx'
+
+# Tespitçi türü -> (model dosyası, indirme adresi); dosyalar OpenCV'nin resmi depolarındandır
+MODEL_ADRESLERI = {
+    'haar': (KASKAT_DOSYALARI['haar'],
+             'https://raw.githubusercontent.com/opencv/opencv/4.x/data/haarcascades/haarcascade_frontalface_default.xml'),
+    'lbp': (KASKAT_DOSYALARI['lbp'],
+            'https://raw.githubusercontent.com/opencv/opencv/4.x/data/lbpcascades/lbpcascade_frontalface_improved.xml'),
+    'yunet': (YUNET_DOSYASI,
+              'https://github.com/opencv/opencv_zoo/raw/main/models/face_detection_yunet/face_detection_yunet_2023mar.onnx'),
+}
+
+def model_dosyasi_bul(dosya):
+    """
+    Model dosyasını verilen yolda, modeller klasöründe veya OpenCV'nin kaskat klasöründe arar
+
+    Args:
+        dosya (str): Dosya yolu veya yalnızca dosya adı
+
+    Returns:
+        str: Bulunan dosyanın yolu
+
+    Not:
+        Dosya bulunamazsa FileNotFoundError fırlatılır; tespitçi seçimi hatası kamera
+        açıldıktan sonra değil, program başlarken görülür
+    """
+    adaylar = [dosya, os.path.join(MODEL_KLASORU, os.path.basename(dosya))]
+    kaskat_klasoru = getattr(getattr(cv2, 'data', None), 'haarcascades', None)
+    if kaskat_klasoru:
+        adaylar.append(os.path.join(kaskat_klasoru, os.path.basename(dosya)))
+    for aday in adaylar:
+        if os.path.isfile(aday):
+            return aday
+    turler = [tur for tur, (ad, _) in MODEL_ADRESLERI.items() if ad == os.path.basename(dosya)]
+    cozum = (f"İndirmek için: python tespit.py indir {turler[0]}" if turler
+             else "Dosya yolunu kontrol edin")
+    raise FileNotFoundError(f"Model dosyası bulunamadı: {dosya} (aranan: {', '.join(adaylar)}). "
+                            f"{cozum} (ayrıntılar: modeller/README.md)")
+
+def modeli_indir(tur, klasor=MODEL_KLASORU, zaman_asimi=60):
+    """
+    Tespitçinin model dosyasını OpenCV deposundan indirir
+
+    Args:
+        tur (str): MODEL_ADRESLERI anahtarlarından biri
+        klasor (str): Dosyanın kaydedileceği klasör
+        zaman_asimi (float): Bağlantı zaman aşımı (saniye)
+
+    Returns:
+        str: İndirilen dosyanın yolu
+
+    Not:
+        Dosya önce geçici bir adla yazılır; yarıda kalan indirme bozuk bir model bırakmaz
+    """
+    dosya, adres = MODEL_ADRESLERI[tur]
+    os.makedirs(klasor, exist_ok=True)
+    hedef = os.path.join(klasor, dosya)
+    gecici = hedef + '.indiriliyor'
+    try:
+        with urllib.request.urlopen(adres, timeout=zaman_asimi) as yanit, open(gecici, 'wb') as f:
+            while True:
+                parca = yanit.read(1 << 16)
+                if not parca:
+                    break
+                f.write(parca)
+        os.replace(gecici, hedef)
+    finally:
+        if os.path.exists(gecici):
+            os.remove(gecici)
+    return hedef
+
+def _kirp(kutular, yukseklik, genislik):
+    """(x, y, w, h) kutularını kareye sığan (top, right, bottom, left) kutulara çevirir"""
+    sonuc = []
+    for x, y, w, h in kutular:
+        top, left = max(0, int(y)), max(0, int(x))
+        bottom, right = min(yukseklik, int(y + h)), min(genislik, int(x + w))
+        if bottom > top and right > left:
+            sonuc.append((top, right, bottom, left))
+    return sonuc
+
+class HogTespitci:
+    """
+    face_recognition kütüphanesinin HOG tespitçisi
+    """
+
+    ad = 'hog'
+
+    def __init__(self, yukseltme=1):
+        """
+        Args:
+            yukseltme (int): Küçük yüzler için görüntünün kaç kez büyütülerek taranacağı
+        """
+        self.yukseltme = yukseltme
+
+    def bul(self, rgb):
+        """
+        RGB görüntüdeki yüzleri bulur
+
+        Returns:
+            list: (top, right, bottom, left) kutular
+        """
+        import face_recognition
+        return face_recognition.face_locations(rgb, number_of_times_to_upsample=self.yukseltme, model="hog")
+
+class KaskatTespitci:
+    """
+    OpenCV Haar veya LBP kaskat sınıflandırıcısı
+
+    Not:
+        cv2.CascadeClassifier nesneleri iş parçacıkları arasında paylaşılmaz; her tanıma
+        işçisi kendi kopyasını ilk kullanımda yükler
+    """
+
+    def __init__(self, tur='haar', model=None, olcek_adimi=1.1, en_az_komsu=5, en_kucuk_yuz=20):
+        """
+        Args:
+            tur (str): 'haar' veya 'lbp'
+            model (str): Kaskat XML dosyası, None ise türün varsayılan dosyası
+            olcek_adimi (float): Tarama piramidindeki ölçek adımı (büyüdükçe hızlanır, kaçırma artar)
+            en_az_komsu (int): Bir kutunun kabulü için gereken en az örtüşen aday
+            en_kucuk_yuz (int): Piksel cinsinden en küçük yüz kenarı (küçültülmüş karede)
+        """
+        if not hasattr(cv2, 'CascadeClassifier'):
+            raise RuntimeError("Bu OpenCV kurulumunda cv2.CascadeClassifier yok "
+                               "(OpenCV 5'te kaskatlar yalnızca opencv-contrib-python paketindedir)")
+        self.ad = tur
+        self.model = model_dosyasi_bul(model or KASKAT_DOSYALARI[tur])
+        self.olcek_adimi = olcek_adimi
+        self.en_az_komsu = en_az_komsu
+        self.en_kucuk_yuz = en_kucuk_yuz
+        self._yerel = threading.local()
+        if cv2.CascadeClassifier(self.model).empty():
+            raise ValueError(f"Kaskat dosyası okunamadı: {self.model}")
+
+    def bul(self, rgb):
+        """
+        RGB görüntüdeki yüzleri bulur
+
+        Returns:
+            list: (top, right, bottom, left) kutular
+        """
+        siniflandirici = getattr(self._yerel, 'siniflandirici', None)
+        if siniflandirici is None:
+            siniflandirici = self._yerel.siniflandirici = cv2.CascadeClassifier(self.model)
+        gri = cv2.equalizeHist(cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY))
+        kutular = siniflandirici.detectMultiScale(gri, scaleFactor=self.olcek_adimi, minNeighbors=self.en_az_komsu,
+                                                  minSize=(self.en_kucuk_yuz, self.en_kucuk_yuz))
+        return _kirp(kutular, *rgb.shape[:2])
+
+class YuNetTespitci:
+    """
+    OpenCV cv2.FaceDetectorYN (YuNet ONNX modeli) tespitçisi
+
+    Not:
+        Dedektörün girdi boyutu kareye göre ayarlanır; her iş parçacığı kendi dedektörünü
+        tutar, böylece boyut değişimleri işçiler arasında karışmaz.
+        Gerçek YuNet modeliyle henüz ölçülmediğinden TESPITCI_TURLERI'nde değil,
+        DENEYSEL_TESPITCILER'dedir
+    """
+
+    ad = 'yunet'
+
+    def __init__(self, model=None, skor_esigi=0.7, nms_esigi=0.3, en_fazla_yuz=5000):
+        """
+        Args:
+            model (str): YuNet ONNX dosyası, None ise modeller klasöründeki varsayılan dosya
+            skor_esigi (float): Yüz sayılmak için en düşük güven skoru
+            nms_esigi (float): Örtüşen kutuları eleyen IoU eşiği
+            en_fazla_yuz (int): Eleme öncesi tutulacak en fazla aday
+        """
+        if not hasattr(cv2, 'FaceDetectorYN'):
+            raise RuntimeError("Bu OpenCV sürümünde cv2.FaceDetectorYN yok (4.5.4 veya üstü gerekir)")
+        self.model = model_dosyasi_bul(model or YUNET_DOSYASI)
+        self.skor_esigi = skor_esigi
+        self.nms_esigi = nms_esigi
+        self.en_fazla_yuz = en_fazla_yuz
+        self._yerel = threading.local()
+        self._dedektor((320, 240))  # Model dosyası hemen doğrulanır
+
+    def _dedektor(self, boyut):
+        """Çağıran iş parçacığının dedektörünü verilen (genişlik, yükseklik) için hazırlar"""
+        dedektor = getattr(self._yerel, 'dedektor', None)
+        if dedektor is None:
+            dedektor = self._yerel.dedektor = cv2.FaceDetectorYN.create(
+                self.model, "", boyut, self.skor_esigi, self.nms_esigi, self.en_fazla_yuz)
+            self._yerel.boyut = boyut
+        elif self._yerel.boyut != boyut:
+            dedektor.setInputSize(boyut)
+            self._yerel.boyut = boyut
+        return dedektor
+
+    def bul(self, rgb):
+        """
+        RGB görüntüdeki yüzleri bulur
+
+        Returns:
+            list: (top, right, bottom, left) kutular
+        """
+        yukseklik, genislik = rgb.shape[:2]
+        dedektor = self._dedektor((genislik, yukseklik))
+        _, yuzler = dedektor.detect(cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR))  # Model BGR girdiyle eğitilmiştir
+        if yuzler is None:
+            return []
+        return _kirp(np.asarray(yuzler)[:, :4], yukseklik, genislik)
+
+# Tespitçi türü -> yapıcı; Kadro.tanimlayici ve komut satırı seçenekleri buradan seçer
+TESPITCI_TURLERI = {
+    'hog': HogTespitci,
+    'haar': partial(KaskatTespitci, tur='haar'),
+    'lbp': partial(KaskatTespitci, tur='lbp'),
+}
+
+# Gerçek modelle doğrulanmamış tespitçiler; --tespitci ve YUZ_TESPITCISI seçeneklerinde yer
+# almaz, yalnızca benchmark_tespit.py ve model indirme doğrulaması bunları oluşturabilir
+DENEYSEL_TESPITCILER = {
+    'yunet': YuNetTespitci,
+}
+
+def tespitci_olustur(tur='hog', deneysel=False, **ayarlar):
+    """
+    Adı verilen türde bir tespitçi oluşturur
+
+    Args:
+        tur (str): TESPITCI_TURLERI anahtarlarından biri
+        deneysel (bool): DENEYSEL_TESPITCILER'deki türler de kabul edilsin mi
+        **ayarlar: Tespitçi yapıcısına iletilen ek ayarlar (model yolu, eşikler)
+
+    Returns:
+        Tespitçi: bul(rgb) yöntemi olan nesne
+    """
+    turler = {**TESPITCI_TURLERI, **DENEYSEL_TESPITCILER} if deneysel else TESPITCI_TURLERI
+    if tur not in turler:
+        raise ValueError(f"Bilinmeyen tespitçi: {tur} (seçenekler: {', '.join(turler)})")
+    return turler[tur](**ayarlar)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OpenCV yüz tespitçilerinin model dosyalarını indirir")
+    parser.add_argument('komut', choices=['indir'], help="Yapılacak işlem")
+    # choices burada kullanılmaz: argparse, nargs='*' konumsal argümanın varsayılan
+    # listesini de seçeneklerle karşılaştırdığından argümansız çağrı hata verir
+    parser.add_argument('turler', nargs='*', metavar='TUR',
+                        help=f"İndirilecek modeller ({', '.join(MODEL_ADRESLERI)}; varsayılan: hepsi)")
+    parser.add_argument('--klasor', default=MODEL_KLASORU, help="Modellerin kaydedileceği klasör")
+    args = parser.parse_args(argv)
+    bilinmeyen = [tur for tur in args.turler if tur not in MODEL_ADRESLERI]
+    if bilinmeyen:
+        parser.error(f"bilinmeyen model: {', '.join(bilinmeyen)} (seçenekler: {', '.join(MODEL_ADRESLERI)})")
+    args.turler = args.turler or list(MODEL_ADRESLERI)
+
+    hata = False
+    for tur in args.turler:
+        try:
+            yol = modeli_indir(tur, args.klasor)
+            # İndirilen dosyanın OpenCV tarafından okunabildiği doğrulanır
+            tespitci_olustur(tur, deneysel=True, model=yol).bul(np.zeros((120, 160, 3), dtype=np.uint8))
+            print(f"{tur}: {yol}")
+        except (OSError, ValueError, RuntimeError, cv2.error) as e:
+            print(f"{tur}: indirilemedi ({e})")
+            hata = True
+    return 1 if hata else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,213 @@
+"""
+Kayıttan Toplu Yoklama Modülü
+Bu modül, kaydedilmiş ders videolarını veya kare klasörlerini kamera ve pencere
+açmadan işler ve bulunan öğrencilerin yoklamasını veritabanına yazar.
+- Kareler gerçek zamanlı beklenmeden, işlemcinin yetiştiği hızda işlenir
+- Kare çözme (video decode) ayrı bir iş parçacığında tanımayla paralel yürür
+- Aynı girdi her seferinde aynı kareleri verdiği için performans ölçümlerinde de kullanılır
+
+Kullanım:
+    python toplu_isle.py ders1.mp4 ders2.mp4 --kare-araligi 5
+    python toplu_isle.py kareler/ --ders-id 42 --katilmayanlari-yaz
+"""
+
+import os
+import time
+import queue
+import argparse
+import threading
+from datetime import datetime
+import cv2
+from kodlama_deposu import VARSAYILAN_DEPO
+from eslestirici import INDEKS_TURLERI
+from tespit import TESPITCI_TURLERI
+from yoklama_sistemi import Kadro, YoklamaDeposu
+
+GORUNTU_UZANTILARI = ('.jpg', '.jpeg', '.png', '.bmp')  # Kare klasörlerinde okunan uzantılar
+
+def kareleri_oku(kaynak, kare_araligi=1):
+    """
+    Bir video dosyasından veya kare klasöründen kareleri sırayla üretir
+
+    Args:
+        kaynak (str): Video dosyası veya görüntü klasörü yolu
+        kare_araligi (int): Her kaç karede bir karenin işleneceği
+
+    Yields:
+        tuple: (kaynaktaki kare numarası, saniye cinsinden konum, BGR kare)
+
+    Not:
+        Videoda atlanan kareler yalnızca grab() ile geçilir, BGR görüntüye çevrilmez
+    """
+    if os.path.isdir(kaynak):
+        dosyalar = sorted(f for f in os.listdir(kaynak) if f.lower().endswith(GORUNTU_UZANTILARI))
+        for sira, dosya in enumerate(dosyalar[::kare_araligi]):
+            frame = cv2.imread(os.path.join(kaynak, dosya))
+            if frame is None:
+                print(f"{dosya}: okunamadi, atlaniyor")
+                continue
+            yield sira * kare_araligi, None, frame
+        return
+
+    video = cv2.VideoCapture(kaynak)
+    if not video.isOpened():
+        raise IOError(f"{kaynak} acilamadi")
+    try:
+        kare_no = 0
+        while True:
+            if kare_no % kare_araligi:
+                if not video.grab():  # Atlanan kare çözülmeden geçilir
+                    break
+            else:
+                ret, frame = video.read()
+                if not ret:
+                    break
+                yield kare_no, video.get(cv2.CAP_PROP_POS_MSEC) / 1000.0, frame
+            kare_no += 1
+    finally:
+        video.release()
+
+class KareOnYukleyici(threading.Thread):
+    """
+    Kareleri ayrı bir iş parçacığında okuyup sınırlı bir kuyrukta bekleten sınıf
+
+    Not:
+        Canlı hattan farklı olarak hiçbir kare atılmaz; kuyruk doluysa okuma bekler
+    """
+
+    _BITTI = object()  # Kaynağın sonunu bildiren işaret
+
+    def __init__(self, kaynak, kare_araligi=1, kuyruk_boyutu=8):
+        """
+        Args:
+            kaynak (str): Video dosyası veya görüntü klasörü yolu
+            kare_araligi (int): Her kaç karede bir karenin işleneceği
+            kuyruk_boyutu (int): Önceden okunup bekletilecek en fazla kare sayısı
+        """
+        super().__init__(name="KareOnYukleyici", daemon=True)
+        self.kaynak = kaynak
+        self.kare_araligi = kare_araligi
+        self.kuyruk = queue.Queue(maxsize=kuyruk_boyutu)
+        self.hata = None
+
+    def run(self):
+        try:
+            for oge in kareleri_oku(self.kaynak, self.kare_araligi):
+                self.kuyruk.put(oge)
+        except Exception as e:
+            self.hata = e
+        finally:
+            self.kuyruk.put(self._BITTI)
+
+    def __iter__(self):
+        while True:
+            oge = self.kuyruk.get()
+            if oge is self._BITTI:
+                if self.hata is not None:
+                    raise self.hata
+                return
+            yield oge
+
+def kaynak_isle(kaynak, tanimlayici, kare_araligi=1):
+    """
+    Bir kaynağın bütün karelerini tanır ve görülen kişileri toplar
+
+    Args:
+        kaynak (str): Video dosyası veya görüntü klasörü yolu
+        tanimlayici (YuzTanimlayici): Kareleri tanıyacak nesne
+        kare_araligi (int): Her kaç karede bir karenin işleneceği
+
+    Returns:
+        tuple: ({isim: (ilk görüldüğü konum, görüldüğü kare sayısı, en iyi mesafe)}, işlenen kare sayısı)
+    """
+    gorulenler = {}
+    islenen = 0
+    okuyucu = KareOnYukleyici(kaynak, kare_araligi)
+    okuyucu.start()
+    for kare_no, saniye, frame in okuyucu:
+        islenen += 1
+        konum = f"{saniye:.1f} sn" if saniye is not None else f"kare {kare_no}"
+        for sonuc in tanimlayici.tani(frame):
+            if not sonuc.kabul:
+                continue
+            ilk, sayi, en_iyi = gorulenler.get(sonuc.isim, (konum, 0, sonuc.mesafe))
+            gorulenler[sonuc.isim] = (ilk, sayi + 1, min(en_iyi, sonuc.mesafe))
+    return gorulenler, islenen
+
+def main():
+    parser = argparse.ArgumentParser(description="Kaydedilmiş ders videolarından veya kare klasörlerinden yoklama alır")
+    parser.add_argument('kaynaklar', nargs='+', help="Video dosyaları veya görüntü klasörleri (hepsi aynı derse yazılır)")
+    parser.add_argument('--ders-id', type=int, help="Yoklamanın yazılacağı mevcut ders, verilmezse yeni ders açılır")
+    parser.add_argument('--ders-zamani', help="Açılacak dersin zamanı 'YYYY-MM-DD HH:MM:SS' (varsayılan: şu an)")
+    parser.add_argument('--faces', default='faces', help="Yüz fotoğraflarının bulunduğu klasör")
+    parser.add_argument('--depo', default=VARSAYILAN_DEPO, help="Kodlama deposu dosyası")
+    parser.add_argument('--kare-araligi', type=int, default=1, help="Her kaç karede bir tanıma yapılacağı")
+    parser.add_argument('--olcek', type=float, default=0.25, help="Tespit öncesi küçültme oranı")
+    parser.add_argument('--indeks', choices=sorted(INDEKS_TURLERI), default='kesin', help="Eşleştirme indeksi")
+    parser.add_argument('--tespitci', choices=sorted(TESPITCI_TURLERI), default='hog', help="Yüz tespitçisi")
+    parser.add_argument('--tolerans', type=float, default=0.5, help="Eşleşme için en büyük mesafe")
+    parser.add_argument('--en-az-gorulme', type=int, default=1,
+                        help="Katıldı sayılmak için kişinin tanınması gereken en az kare sayısı")
+    parser.add_argument('--takipsiz', action='store_true', help="Takipçiyi kapatır (her yüz her karede kodlanır)")
+    parser.add_argument('--hareketsiz', action='store_true', help="Hareket kapısını kapatır (her kare baştan taranır)")
+    parser.add_argument('--katilmayanlari-yaz', action='store_true', help="Bulunamayanları KATILMADI olarak yazar")
+    args = parser.parse_args()
+
+    # Verilen ders kadro yüklenmeden önce doğrulanır; olmayan bir derse yazılan
+    # yoklamalar hiçbir ekranda görünmez
+    depo = YoklamaDeposu()
+    if args.ders_id is not None and not depo.ders_var(args.ders_id):
+        depo.kapat()
+        parser.error(f"--ders-id {args.ders_id}: böyle bir ders yok")
+
+    # Kadro yüklenir
+    kadro = Kadro.klasorden(args.faces, args.depo, tolerans=args.tolerans, indeks_turu=args.indeks)
+    if not kadro:
+        print(f"Hiç yüz bulunamadı! Lütfen '{args.faces}' klasörünü kontrol edin.")
+        depo.kapat()
+        return
+    isimler = kadro.isimler
+
+    # Ders belirlenir
+    ders_id = args.ders_id
+    if ders_id is None:
+        zaman = datetime.strptime(args.ders_zamani, '%Y-%m-%d %H:%M:%S') if args.ders_zamani else None
+        ders_id = depo.ders_baslat(zaman)
+        if ders_id is None:
+            return
+
+    # Bütün kaynaklar işlenir; takip ve hareket kapısı kaynaklar arasında sıfırlanır
+    gorulenler = {}
+    for kaynak in args.kaynaklar:
+        tanimlayici = kadro.tanimlayici(olcek=args.olcek, takip=not args.takipsiz, hareket=not args.hareketsiz,
+                                        tespitci=args.tespitci)
+        baslangic = time.perf_counter()
+        try:
+            bulunanlar, islenen = kaynak_isle(kaynak, tanimlayici, args.kare_araligi)
+        except IOError as e:
+            print(f"{kaynak}: {e}")
+            continue
+        sure = time.perf_counter() - baslangic
+        print(f"\n{kaynak}: {islenen} kare {sure:.1f} sn'de işlendi "
+              f"({islenen / sure if sure else 0:.1f} kare/sn, atlanan tespit: {tanimlayici.atlanan_tespit}, "
+              f"atlanan kodlama: {tanimlayici.atlanan_kodlama})")
+        for isim, (ilk, sayi, en_iyi) in sorted(bulunanlar.items()):
+            print(f"  {isim}: ilk {ilk}, {sayi} karede, en iyi benzerlik %{(1 - en_iyi) * 100:.1f}")
+            onceki = gorulenler.get(isim, (ilk, 0, en_iyi))
+            gorulenler[isim] = (onceki[0], onceki[1] + sayi, min(onceki[2], en_iyi))
+
+    # Yoklama tek işlemde yazılır
+    katilanlar = sorted(isim for isim, (_, sayi, _) in gorulenler.items() if sayi >= args.en_az_gorulme)
+    depo.katildi(ders_id, katilanlar)
+    print(f"\nDers {ders_id}: {len(katilanlar)}/{len(set(isimler))} kişi KATILDI olarak yazıldı")
+    if args.katilmayanlari_yaz:
+        # Derste daha önce (ör. canlı yoklamada) KATILDI yazılmış kişiler ezilmez
+        onceden_katilan = depo.katilanlar(ders_id)
+        katilmayanlar = sorted(set(isimler) - set(katilanlar) - onceden_katilan)
+        depo.katilmadi(ders_id, katilmayanlar)
+        print(f"{len(katilmayanlar)} kişi KATILMADI olarak yazıldı")
+
+    depo.kapat()
+
+if __name__ == '__main__':
+    main()
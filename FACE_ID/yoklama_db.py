@@ -2,74 +2,501 @@
 Yoklama Veritabanı Yönetim Modülü
 Bu modül, yüz tanıma sistemi için SQLite veritabanı işlemlerini yönetir.
 Dersler ve yoklamalar için tablo oluşturma, veri ekleme ve sorgulama işlemlerini içerir.
-Ayrıca yoklama sonuçlarını görsel olarak gösteren GUI arayüzünü de sağlar.
+Öğrenciler ogrenciler tablosunda bir kez tutulur; yoklama kayıtları tamsayı öğrenci ve
+ders ID'leri, Unix zamanları ve durum kodlarıyla saklanır.
+Yoklama sonuçlarını gösteren pencereler yoklama_arayuz modülündedir; tkinter yalnızca
+bu pencereler ilk kez kullanıldığında yüklenir, böylece ekransız işçiler hızlı açılır.
 """
 
 import sqlite3
 from datetime import datetime
-import tkinter as tk
-from tkinter import ttk
 import random
 from datetime import datetime, timedelta
-import os
+import itertools
+import threading
+import queue
+import time
+
+VERITABANI_YOLU = 'yoklama.db'  # Varsayılan veritabanı dosyası
+# Veritabanı şema sürümü (PRAGMA user_version ile dosyada tutulur)
+SEMA_SURUMU = 3
+
+# Yoklama durumlarının veritabanındaki kodları (katilimlar.durum sütunu)
+DURUM_KODLARI = {'KATILMADI': 0, 'KATILDI': 1}
+DURUMLAR = ('KATILMADI', 'KATILDI')  # Kod -> durum
+
+# Dosya adlarındaki Türkçe karakterlerin karşılıkları (isim_normallestir)
+TURKCE_KARSILIKLAR = str.maketrans('ığüşöçİĞÜŞÖÇ', 'igusocIGUSOC')
+
+# Öğrenciyi (yoksa) ekleme ifadesi
+OGRENCI_EKLE_SQL = 'INSERT INTO ogrenciler (isim) VALUES (?) ON CONFLICT (isim) DO NOTHING'
+
+# Yoklama kaydı ekleme/güncelleme ifadesi; öğrenci isimle verilir, ID'si benzersiz isim
+# indeksinden alınır (öğrencinin önce OGRENCI_EKLE_SQL ile eklenmiş olması gerekir)
+# INSERT OR REPLACE yerine UPSERT kullanılır: mevcut satır silinip yeniden eklenmez,
+# böylece özet tablolarını güncelleyen tetikleyiciler tek bir UPDATE olarak çalışır
+YOKLAMA_YAZ_SQL = '''
+    INSERT INTO katilimlar (ders_id, ogrenci_id, durum, kayit_zamani)
+    VALUES (?, (SELECT id FROM ogrenciler WHERE isim = ?), ?, ?)
+    ON CONFLICT (ders_id, ogrenci_id) DO UPDATE SET
+        durum = excluded.durum,
+        kayit_zamani = excluded.kayit_zamani
+'''
+
+# Sürüm 3 tabloları: isimler ve zamanlar tek yerde, kayıtlar yalnızca tamsayılardan oluşur
+# - Zamanlar Unix zamanı (saniye), durumlar DURUM_KODLARI ile saklanır
+# - katilimlar rowid'siz tutulur; (ders_id, ogrenci_id) anahtarı tablonun kendisidir
+SEMA_TABLOLARI = (
+    '''
+    CREATE TABLE IF NOT EXISTS ogrenciler (
+        id INTEGER PRIMARY KEY,
+        isim TEXT NOT NULL UNIQUE
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS ders_oturumlari (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        zaman INTEGER NOT NULL UNIQUE
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS katilimlar (
+        ders_id INTEGER NOT NULL REFERENCES ders_oturumlari(id),
+        ogrenci_id INTEGER NOT NULL REFERENCES ogrenciler(id),
+        durum INTEGER NOT NULL,
+        kayit_zamani INTEGER NOT NULL,
+        PRIMARY KEY (ders_id, ogrenci_id)
+    ) WITHOUT ROWID
+    ''',
+    # Öğrenci geçmişi ve son görülme: öğrencinin kayıtları tabloya inmeden okunur
+    # (rowid'siz tabloda indeks, anahtarın geri kalanını (ders_id) da içerir)
+    '''
+    CREATE INDEX IF NOT EXISTS idx_katilimlar_ogrenci
+    ON katilimlar (ogrenci_id, durum, kayit_zamani)
+    ''',
+    # Ders başına toplam / katılan / katılmayan sayıları
+    '''
+    CREATE TABLE IF NOT EXISTS ders_ozetleri (
+        ders_id INTEGER PRIMARY KEY REFERENCES ders_oturumlari(id),
+        toplam INTEGER NOT NULL DEFAULT 0,
+        katilan INTEGER NOT NULL DEFAULT 0,
+        katilmayan INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+    # Öğrenci başına katıldığı / katılmadığı ders sayısı ve son görülme (ders zamanı)
+    '''
+    CREATE TABLE IF NOT EXISTS ogrenci_ozetleri (
+        ogrenci_id INTEGER PRIMARY KEY REFERENCES ogrenciler(id),
+        katildigi INTEGER NOT NULL DEFAULT 0,
+        katilmadigi INTEGER NOT NULL DEFAULT 0,
+        son_gorulme INTEGER
+    )
+    ''',
+)
+
+# Eski sorgular için uyumluluk görünümleri: sürüm 2'deki dersler ve yoklamalar tablolarının
+# sütunlarını (metin tarih/saat ve durum) verir; yalnızca okuma içindir
+UYUMLULUK_GORUNUMLERI = (
+    '''
+    CREATE VIEW IF NOT EXISTS dersler AS
+    SELECT id,
+           strftime('%Y-%m-%d', zaman, 'unixepoch', 'localtime') AS ders_tarihi,
+           strftime('%H:%M:%S', zaman, 'unixepoch', 'localtime') AS ders_saati
+    FROM ders_oturumlari
+    ''',
+    '''
+    CREATE VIEW IF NOT EXISTS yoklamalar AS
+    SELECT k.ders_id,
+           o.isim,
+           CASE k.durum WHEN 1 THEN 'KATILDI' ELSE 'KATILMADI' END AS durum,
+           strftime('%H:%M:%S', k.kayit_zamani, 'unixepoch', 'localtime') AS kayit_saati
+    FROM katilimlar k
+    JOIN ogrenciler o ON o.id = k.ogrenci_id
+    ''',
+)
+
+# Özet tablolarını yoklama kayıtlarıyla eş tutan tetikleyiciler
+# (Dış ifadenin çakışma kuralı tetikleyici içindekileri ezdiği için özet satırları
+# INSERT OR IGNORE yerine NOT EXISTS koşuluyla eklenir)
+OZET_TETIKLEYICILERI = {
+    'trg_ders_oturumlari_ekle': '''
+        CREATE TRIGGER IF NOT EXISTS trg_ders_oturumlari_ekle AFTER INSERT ON ders_oturumlari
+        BEGIN
+            INSERT INTO ders_ozetleri (ders_id)
+            SELECT NEW.id WHERE NOT EXISTS (SELECT 1 FROM ders_ozetleri WHERE ders_id = NEW.id);
+        END
+    ''',
+    'trg_ders_oturumlari_sil': '''
+        CREATE TRIGGER IF NOT EXISTS trg_ders_oturumlari_sil AFTER DELETE ON ders_oturumlari
+        BEGIN
+            DELETE FROM ders_ozetleri WHERE ders_id = OLD.id;
+        END
+    ''',
+    'trg_katilimlar_ekle': '''
+        CREATE TRIGGER IF NOT EXISTS trg_katilimlar_ekle AFTER INSERT ON katilimlar
+        BEGIN
+            INSERT INTO ders_ozetleri (ders_id)
+            SELECT NEW.ders_id WHERE NOT EXISTS (SELECT 1 FROM ders_ozetleri WHERE ders_id = NEW.ders_id);
+            UPDATE ders_ozetleri SET
+                toplam = toplam + 1,
+                katilan = katilan + (NEW.durum = 1),
+                katilmayan = katilmayan + (NEW.durum = 0)
+            WHERE ders_id = NEW.ders_id;
+
+            INSERT INTO ogrenci_ozetleri (ogrenci_id)
+            SELECT NEW.ogrenci_id WHERE NOT EXISTS (SELECT 1 FROM ogrenci_ozetleri WHERE ogrenci_id = NEW.ogrenci_id);
+            UPDATE ogrenci_ozetleri SET
+                katildigi = katildigi + (NEW.durum = 1),
+                katilmadigi = katilmadigi + (NEW.durum = 0),
+                son_gorulme = CASE WHEN NEW.durum = 1 THEN
+                    MAX(COALESCE(son_gorulme, 0),
+                        (SELECT zaman FROM ders_oturumlari WHERE id = NEW.ders_id))
+                    ELSE son_gorulme END
+            WHERE ogrenci_id = NEW.ogrenci_id;
+        END
+    ''',
+    'trg_katilimlar_sil': '''
+        CREATE TRIGGER IF NOT EXISTS trg_katilimlar_sil AFTER DELETE ON katilimlar
+        BEGIN
+            UPDATE ders_ozetleri SET
+                toplam = toplam - 1,
+                katilan = katilan - (OLD.durum = 1),
+                katilmayan = katilmayan - (OLD.durum = 0)
+            WHERE ders_id = OLD.ders_id;
+
+            UPDATE ogrenci_ozetleri SET
+                katildigi = katildigi - (OLD.durum = 1),
+                katilmadigi = katilmadigi - (OLD.durum = 0),
+                son_gorulme = CASE WHEN OLD.durum = 1 THEN
+                    (SELECT MAX(d.zaman)
+                     FROM katilimlar k JOIN ders_oturumlari d ON d.id = k.ders_id
+                     WHERE k.ogrenci_id = OLD.ogrenci_id AND k.durum = 1)
+                    ELSE son_gorulme END
+            WHERE ogrenci_id = OLD.ogrenci_id;
+        END
+    ''',
+    'trg_katilimlar_guncelle': '''
+        CREATE TRIGGER IF NOT EXISTS trg_katilimlar_guncelle
+        AFTER UPDATE OF ders_id, ogrenci_id, durum ON katilimlar
+        BEGIN
+            UPDATE ders_ozetleri SET
+                toplam = toplam - 1,
+                katilan = katilan - (OLD.durum = 1),
+                katilmayan = katilmayan - (OLD.durum = 0)
+            WHERE ders_id = OLD.ders_id;
+            INSERT INTO ders_ozetleri (ders_id)
+            SELECT NEW.ders_id WHERE NOT EXISTS (SELECT 1 FROM ders_ozetleri WHERE ders_id = NEW.ders_id);
+            UPDATE ders_ozetleri SET
+                toplam = toplam + 1,
+                katilan = katilan + (NEW.durum = 1),
+                katilmayan = katilmayan + (NEW.durum = 0)
+            WHERE ders_id = NEW.ders_id;
+
+            UPDATE ogrenci_ozetleri SET
+                katildigi = katildigi - (OLD.durum = 1),
+                katilmadigi = katilmadigi - (OLD.durum = 0)
+            WHERE ogrenci_id = OLD.ogrenci_id;
+            INSERT INTO ogrenci_ozetleri (ogrenci_id)
+            SELECT NEW.ogrenci_id WHERE NOT EXISTS (SELECT 1 FROM ogrenci_ozetleri WHERE ogrenci_id = NEW.ogrenci_id);
+            UPDATE ogrenci_ozetleri SET
+                katildigi = katildigi + (NEW.durum = 1),
+                katilmadigi = katilmadigi + (NEW.durum = 0)
+            WHERE ogrenci_id = NEW.ogrenci_id;
+
+            UPDATE ogrenci_ozetleri SET
+                son_gorulme = (SELECT MAX(d.zaman)
+                               FROM katilimlar k JOIN ders_oturumlari d ON d.id = k.ders_id
+                               WHERE k.ogrenci_id = ogrenci_ozetleri.ogrenci_id AND k.durum = 1)
+            WHERE ogrenci_id IN (OLD.ogrenci_id, NEW.ogrenci_id);
+        END
+    ''',
+}
+
+def isim_normallestir(isim):
+    """
+    İsimdeki Türkçe karakterleri Latin karşılıklarıyla değiştirir
+
+    Args:
+        isim (str): Kişinin ismi (ör. 'Ayşe Yılmaz')
+
+    Returns:
+        str: Düzeltilmiş isim (ör. 'Ayse Yilmaz')
+    """
+    return isim.translate(TURKCE_KARSILIKLAR)
+
+def zaman_damgasi(zaman=None):
+    """
+    Yerel saatteki zamanı veritabanında saklanan Unix zamanına çevirir
+
+    Args:
+        zaman (datetime): Çevrilecek zaman, None ise şu an
+
+    Returns:
+        int: Saniye cinsinden Unix zamanı
+    """
+    return int((zaman or datetime.now()).timestamp())
+
+def baglanti_ayarla(conn):
+    """
+    Bağlantıya performans ayarlarını uygular
+
+    Args:
+        conn (sqlite3.Connection): Veritabanı bağlantısı
+
+    Not:
+        - WAL kipi: okuyan pencereler yazan tanıma döngüsünü bekletmez (dosyada kalıcıdır)
+        - synchronous=NORMAL: WAL ile birlikte her işlemde fsync yapılmaz, veri bütünlüğü korunur
+        - Sayfa önbelleği ve bellek eşleme geçmiş ekranlarındaki taramaları hızlandırır
+    """
+    conn.execute('PRAGMA journal_mode = WAL')
+    conn.execute('PRAGMA synchronous = NORMAL')
+    conn.execute('PRAGMA cache_size = -16000')  # Yaklaşık 16 MB
+    conn.execute('PRAGMA mmap_size = 268435456')  # 256 MB
+    conn.execute('PRAGMA temp_store = MEMORY')
+    conn.execute('PRAGMA busy_timeout = 5000')  # Kilitli veritabanında 5 sn beklenir
+    # INSERT OR REPLACE ile silinen satırlar için de özet tetikleyicileri çalışsın
+    conn.execute('PRAGMA recursive_triggers = ON')
+
+def ozetleri_yeniden_olustur(conn):
+    """
+    Ders ve öğrenci özet tablolarını yoklama kayıtlarından baştan hesaplar
+
+    Args:
+        conn (sqlite3.Connection): Veritabanı bağlantısı
+
+    Not:
+        Normal işleyişte özetler tetikleyicilerle güncel kalır; bu fonksiyon
+        şema yükseltmesinde ve toplu veri yüklemelerinden sonra kullanılır
+    """
+    with conn:
+        _ozetleri_hesapla(conn)
+
+def _ozetleri_hesapla(conn):
+    """Özet tablolarını baştan doldurur (açık işlem içinde)"""
+    conn.execute('DELETE FROM ders_ozetleri')
+    conn.execute('''
+        INSERT INTO ders_ozetleri (ders_id, toplam, katilan, katilmayan)
+        SELECT d.id,
+               COUNT(k.ders_id),
+               COALESCE(SUM(k.durum = 1), 0),
+               COALESCE(SUM(k.durum = 0), 0)
+        FROM ders_oturumlari d
+        LEFT JOIN katilimlar k ON k.ders_id = d.id
+        GROUP BY d.id
+    ''')
+    conn.execute('DELETE FROM ogrenci_ozetleri')
+    conn.execute('''
+        INSERT INTO ogrenci_ozetleri (ogrenci_id, katildigi, katilmadigi, son_gorulme)
+        SELECT k.ogrenci_id,
+               SUM(k.durum = 1),
+               SUM(k.durum = 0),
+               MAX(CASE WHEN k.durum = 1 THEN d.zaman END)
+        FROM katilimlar k
+        JOIN ders_oturumlari d ON d.id = k.ders_id
+        GROUP BY k.ogrenci_id
+    ''')
+
+def _tetikleyicileri_ve_gorunumleri_olustur(conn):
+    """Özet tetikleyicilerini ve uyumluluk görünümlerini oluşturur (açık işlem içinde)"""
+    for tetikleyici in OZET_TETIKLEYICILERI.values():
+        conn.execute(tetikleyici)
+    for gorunum in UYUMLULUK_GORUNUMLERI:
+        conn.execute(gorunum)
+
+def sema_guncelle(conn):
+    """
+    Veritabanı şemasını SEMA_SURUMU sürümüne yükseltir
+
+    Args:
+        conn (sqlite3.Connection): Veritabanı bağlantısı
+
+    Not:
+        Mevcut yoklama.db dosyaları açılışta yükseltilir; her adım tek seferlik çalışır
+        Sürüm 1: öğrenci ve ders bazlı sorgular için kapsayan indeksler
+        Sürüm 2: tetikleyicilerle güncel tutulan ders ve öğrenci özet tabloları
+        Sürüm 3: ogrenciler tablosu, tamsayı ID'ler, Unix zamanları ve durum kodları;
+            eski dersler / yoklamalar tabloları aynı isimli görünümlere dönüşür
+        Sürüm 3 indeksleri ve özetleri yeni tablolarda baştan kurduğundan sürüm 0-2
+        dosyaları doğrudan sürüm 3'e taşınır
+    """
+    surum = conn.execute('PRAGMA user_version').fetchone()[0]
+
+    if surum < 3:
+        # Bütün taşıma, özetler ve sürüm numarası tek işlemdir; yarıda kalan yükseltme
+        # geri alınır ve bir sonraki açılışta baştan yapılır
+        with conn:
+            conn.execute('BEGIN')  # DDL ifadeleri de işleme dahil edilir
+            # Eski özetler yeni tablolardan yeniden hesaplanacağı için silinir
+            conn.execute('DROP TABLE IF EXISTS ders_ozetleri')
+            conn.execute('DROP TABLE IF EXISTS ogrenci_ozetleri')
+            for ifade in SEMA_TABLOLARI:
+                conn.execute(ifade)
+
+            conn.execute('INSERT INTO ogrenciler (isim) SELECT DISTINCT isim FROM yoklamalar ORDER BY isim')
+            # Metin tarih/saatler yerel saat olarak yorumlanıp Unix zamanına çevrilir;
+            # ders ID'leri korunur
+            conn.execute('''
+                INSERT INTO ders_oturumlari (id, zaman)
+                SELECT id, CAST(strftime('%s', ders_tarihi || ' ' || ders_saati, 'utc') AS INTEGER)
+                FROM dersler
+            ''')
+            # Yalnızca saat olarak tutulan kayıt zamanları dersin tarihiyle birleştirilir
+            conn.execute('''
+                INSERT INTO katilimlar (ders_id, ogrenci_id, durum, kayit_zamani)
+                SELECT y.ders_id, o.id, y.durum = 'KATILDI',
+                       CAST(strftime('%s', d.ders_tarihi || ' ' || y.kayit_saati, 'utc') AS INTEGER)
+                FROM yoklamalar y
+                JOIN dersler d ON d.id = y.ders_id
+                JOIN ogrenciler o ON o.isim = y.isim
+            ''')
+
+            # Eski tablolar (indeksleri ve tetikleyicileriyle) kaldırılır, yerlerine görünümler gelir
+            conn.execute('DROP TABLE yoklamalar')
+            conn.execute('DROP TABLE dersler')
+            _tetikleyicileri_ve_gorunumleri_olustur(conn)
+            _ozetleri_hesapla(conn)
+            conn.execute('PRAGMA user_version = 3')
+        conn.execute('VACUUM')  # Silinen eski tabloların sayfaları dosyadan atılır
+
+    conn.execute('PRAGMA optimize')  # Sorgu planlayıcı istatistikleri gerekirse güncellenir
+
+def sema_olustur(conn):
+    """
+    Tabloları oluşturur ve şemayı güncel sürüme yükseltir
+
+    Args:
+        conn (sqlite3.Connection): Veritabanı bağlantısı
+
+    Not:
+        Yeni veritabanında doğrudan güncel şema oluşturulur:
+        1. ogrenciler: Öğrenci isimleri (id, isim)
+        2. ders_oturumlari: Ders kayıtları (id, zaman)
+        3. katilimlar: Yoklama kayıtları (ders_id, ogrenci_id, durum, kayit_zamani)
+        Eski sürümdeki (dersler / yoklamalar tablolu) dosyalar sema_guncelle ile yükseltilir
+    """
+    eski = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'dersler'").fetchone()
+    if eski is None and conn.execute('PRAGMA user_version').fetchone()[0] == 0:
+        with conn:
+            for ifade in SEMA_TABLOLARI:
+                conn.execute(ifade)
+            _tetikleyicileri_ve_gorunumleri_olustur(conn)
+            conn.execute(f'PRAGMA user_version = {SEMA_SURUMU}')
+    sema_guncelle(conn)
+
+class Veritabani:
+    """
+    Bütün modülün kullandığı tek veritabanı erişim katmanı
+
+    Not:
+        - Her iş parçacığı kendi bağlantısını bir kez açar ve sonraki çağrılarda yeniden kullanır
+          (SQLite bağlantıları iş parçacıkları arasında paylaşılmamalıdır)
+        - Bağlantılar açık kaldığı için derlenmiş SQL ifadeleri önbellekte kalır
+        - Şema, ilk bağlantıda bir kez oluşturulur/yükseltilir
+    """
+
+    def __init__(self, yol=VERITABANI_YOLU, ifade_onbellegi=128):
+        """
+        Args:
+            yol (str): Veritabanı dosyasının yolu
+            ifade_onbellegi (int): Bağlantı başına önbellekte tutulan derlenmiş ifade sayısı
+        """
+        self.yol = yol
+        self.ifade_onbellegi = ifade_onbellegi
+        self._yerel = threading.local()
+        self._kilit = threading.Lock()
+        self._baglantilar = []
+        self._sema_hazir = False
+
+    def baglanti(self):
+        """
+        Çağıran iş parçacığına ait bağlantıyı döndürür, yoksa açar
+
+        Returns:
+            sqlite3.Connection: Veritabanı bağlantısı
+        """
+        conn = getattr(self._yerel, 'conn', None)
+        if conn is not None:
+            return conn
+
+        # Bağlantı yalnızca açan iş parçacığında kullanılır; kapat() başka iş parçacığından
+        # çağrılabildiği için aynı iş parçacığı denetimi kapatılır
+        conn = sqlite3.connect(self.yol, cached_statements=self.ifade_onbellegi, check_same_thread=False)
+        baglanti_ayarla(conn)
+        with self._kilit:
+            if not self._sema_hazir:
+                sema_olustur(conn)
+                self._sema_hazir = True
+            self._baglantilar.append(conn)
+        self._yerel.conn = conn
+        return conn
+
+    def kapat(self):
+        """Bütün iş parçacıklarının bağlantılarını kapatır"""
+        with self._kilit:
+            for conn in self._baglantilar:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+            self._baglantilar = []
+            self._yerel = threading.local()
+
+# Arayüz fonksiyonları eski içe aktarmalar bozulmasın diye buradan da erişilebilir
+# (örn. from yoklama_db import sonuc_tablosu_goster); modül ancak ilk erişimde yüklenir
+_ARAYUZ_ISIMLERI = ('sonuc_tablosu_goster', 'gecmis_yoklamalari_goster', 'detay_goster',
+                    'SayfaliAgacYukleyici', 'okuma_havuzu')
+
+def __getattr__(isim):
+    if isim in _ARAYUZ_ISIMLERI:
+        import yoklama_arayuz
+        return getattr(yoklama_arayuz, isim)
+    raise AttributeError(f"module {__name__!r} has no attribute {isim!r}")
+
+_varsayilan_veritabani = None
+_varsayilan_kilit = threading.Lock()
+
+def veritabani():
+    """
+    Uygulama genelinde paylaşılan Veritabani nesnesini döndürür
+
+    Returns:
+        Veritabani: Varsayılan veritabanı erişim katmanı
+    """
+    global _varsayilan_veritabani
+    with _varsayilan_kilit:
+        if _varsayilan_veritabani is None:
+            _varsayilan_veritabani = Veritabani()
+        return _varsayilan_veritabani
 
 def veritabani_olustur():
     """
     SQLite veritabanını oluşturur ve bağlantıyı döndürür
     
     Returns:
-        sqlite3.Connection: Veritabanı bağlantı objesi, hata durumunda None
+        sqlite3.Connection: Çağıran iş parçacığının paylaşılan bağlantısı, hata durumunda None
         
     Not:
-        İki ana tablo oluşturulur:
-        1. dersler: Ders kayıtlarını tutar (id, tarih, saat)
-        2. yoklamalar: Yoklama kayıtlarını tutar (id, ders_id, isim, durum, kayit_saati)
+        Bağlantı ortak erişim katmanından alınır; kapatmak için veritabani().kapat() kullanılır
     """
     try:
-        conn = sqlite3.connect('yoklama.db')
-        cursor = conn.cursor()
-        
-        # Dersler tablosu oluştur
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS dersler (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                ders_tarihi DATE NOT NULL,
-                ders_saati TIME NOT NULL,
-                UNIQUE(ders_tarihi, ders_saati)
-            )
-        ''')
-        
-        # Yoklamalar tablosu oluştur (dersler tablosuyla ilişkili)
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS yoklamalar (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                ders_id INTEGER NOT NULL,
-                isim TEXT NOT NULL,
-                durum TEXT NOT NULL,
-                kayit_saati TIME NOT NULL,
-                FOREIGN KEY (ders_id) REFERENCES dersler(id),
-                UNIQUE(ders_id, isim)
-            )
-        ''')
-        
-        conn.commit()
-        return conn
+        return veritabani().baglanti()
     except sqlite3.Error as e:
         print(f"Veritabani hatasi: {e}")
         return None
 
-def yeni_ders_baslat(conn):
+def yeni_ders_baslat(conn, zaman=None):
     """
     Yeni bir ders kaydı oluşturur
     
     Args:
         conn (sqlite3.Connection): Veritabanı bağlantısı
+        zaman (datetime): Dersin tarihi ve saati, None ise şu an (kayıttan işlenen dersler için)
         
     Returns:
         int: Oluşturulan dersin ID'si, hata durumunda None
         
     Not:
-        Mevcut tarih ve saat bilgisiyle yeni bir ders kaydı oluşturur
+        Verilen (veya mevcut) tarih ve saat bilgisiyle yeni bir ders kaydı oluşturur
     """
     try:
         if conn is None:
@@ -77,20 +504,28 @@ def yeni_ders_baslat(conn):
             return None
             
         cursor = conn.cursor()
-        simdi = datetime.now()
-        tarih = simdi.strftime('%Y-%m-%d')
-        saat = simdi.strftime('%H:%M:%S')
-        
         cursor.execute('''
-            INSERT INTO dersler (ders_tarihi, ders_saati)
-            VALUES (?, ?)
-        ''', (tarih, saat))
+            INSERT INTO ders_oturumlari (zaman)
+            VALUES (?)
+        ''', (zaman_damgasi(zaman),))
         conn.commit()
         return cursor.lastrowid
     except sqlite3.Error as e:
         print(f"Ders başlatılırken hata olustu: {e}")
         return None
 
+def _yoklamalari_yaz(conn, kayitlar):
+    """
+    (ders_id, isim, durum, kayıt zamanı) kayıtlarını açık işlem içinde yazar
+
+    Not:
+        Kadroda yeni olan isimler önce ogrenciler tablosuna eklenir; durum metni
+        DURUM_KODLARI ile koda çevrilir
+    """
+    conn.executemany(OGRENCI_EKLE_SQL, [(isim,) for _, isim, _, _ in kayitlar])
+    conn.executemany(YOKLAMA_YAZ_SQL, [(ders_id, isim, DURUM_KODLARI[durum], zaman)
+                                       for ders_id, isim, durum, zaman in kayitlar])
+
 def yoklama_ekle(conn, ders_id, isim, durum):
     """
     Yoklama kaydı ekler veya günceller
@@ -109,18 +544,111 @@ def yoklama_ekle(conn, ders_id, isim, durum):
             print("Veritabani baglantisi kurulamadi")
             return
             
-        cursor = conn.cursor()
-        simdi = datetime.now()
-        saat = simdi.strftime('%H:%M:%S')
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO yoklamalar (ders_id, isim, durum, kayit_saati)
-            VALUES (?, ?, ?, ?)
-        ''', (ders_id, isim, durum, saat))
-        conn.commit()
+        with conn:
+            _yoklamalari_yaz(conn, [(ders_id, isim, durum, zaman_damgasi())])
     except sqlite3.Error as e:
         print(f"Kayit eklenirken hata olustu: {e}")
 
+def toplu_yoklama_ekle(conn, ders_id, isimler, durum):
+    """
+    Birden fazla öğrenci için aynı durumla yoklama kaydını tek işlemde ekler
+
+    Args:
+        conn (sqlite3.Connection): Veritabanı bağlantısı
+        ders_id (int): Dersin ID'si
+        isimler (list): Öğrenci isimleri
+        durum (str): Yoklama durumu (KATILDI/KATILMADI)
+
+    Not:
+        Ders sonunda katılmayanların yazılması gibi toplu işlemlerde kayıt başına
+        commit yapılmaz; bütün kayıtlar tek bir işlemde (tek fsync) yazılır
+    """
+    try:
+        if conn is None:
+            print("Veritabani baglantisi kurulamadi")
+            return
+
+        zaman = zaman_damgasi()
+        with conn:
+            _yoklamalari_yaz(conn, [(ders_id, isim, durum, zaman) for isim in isimler])
+    except sqlite3.Error as e:
+        print(f"Toplu kayit eklenirken hata olustu: {e}")
+
+class YoklamaYazici(threading.Thread):
+    """
+    Yoklama kayıtlarını arka planda toplu olarak yazan iş parçacığı
+
+    Not:
+        - ekle() yalnızca kuyruğa ekler, diske yazmayı beklemez
+        - Kayıtlar kısa bir aralıkta veya parti dolunca tek işlemde yazılır
+        - Yazıcı, ortak erişim katmanından kendi iş parçacığına ait bağlantıyı kullanır
+        - Kayıt saati, kaydın kuyruğa eklendiği an olarak tutulur
+    """
+
+    def __init__(self, db=None, aralik=0.5, parti_boyutu=64, olcer=None):
+        """
+        Args:
+            db (Veritabani): Kullanılacak erişim katmanı, None ise varsayılan
+            aralik (float): Kuyruğun en geç kaç saniyede bir yazılacağı
+            parti_boyutu (int): Beklemeden yazılacak kayıt sayısı
+            olcer (AsamaOlcer): Parti yazma sürelerini toplayan ölçer, None ise ölçülmez
+        """
+        super().__init__(name="YoklamaYazici", daemon=True)
+        self.db = db or veritabani()
+        self.aralik = aralik
+        self.parti_boyutu = parti_boyutu
+        self.olcer = olcer
+        self.kuyruk = queue.Queue()
+        self._durdur = threading.Event()
+
+    def ekle(self, ders_id, isim, durum):
+        """
+        Yoklama kaydını yazılmak üzere kuyruğa ekler
+
+        Args:
+            ders_id (int): Dersin ID'si
+            isim (str): Öğrencinin ismi
+            durum (str): Yoklama durumu (KATILDI/KATILMADI)
+        """
+        self.kuyruk.put((ders_id, isim, durum, zaman_damgasi()))
+
+    def _parti_topla(self):
+        """Kuyruktan en fazla parti_boyutu kayıt veya aralık dolana kadar kayıt toplar"""
+        parti = []
+        son_zaman = time.monotonic() + self.aralik
+        while len(parti) < self.parti_boyutu:
+            kalan = son_zaman - time.monotonic()
+            if kalan <= 0:
+                break
+            try:
+                parti.append(self.kuyruk.get(timeout=kalan))
+            except queue.Empty:
+                break
+        return parti
+
+    def _yaz(self, conn, parti):
+        """Bir partiyi tek işlemde veritabanına yazar"""
+        baslangic = time.perf_counter()
+        try:
+            with conn:
+                _yoklamalari_yaz(conn, parti)
+        except sqlite3.Error as e:
+            print(f"Kayit eklenirken hata olustu: {e}")
+        if self.olcer is not None:
+            self.olcer.ekle('vt_yazma', time.perf_counter() - baslangic)
+
+    def run(self):
+        conn = self.db.baglanti()
+        while not (self._durdur.is_set() and self.kuyruk.empty()):
+            parti = self._parti_topla()
+            if parti:
+                self._yaz(conn, parti)
+
+    def durdur(self):
+        """Kuyrukta kalan kayıtları yazdıktan sonra iş parçacığını sonlandırır"""
+        self._durdur.set()
+        self.join()
+
 def yoklama_getir(conn, isim):
     """
     Öğrencinin son 5 dersin yoklama kayıtlarını getirir
@@ -142,626 +670,114 @@ def yoklama_getir(conn, isim):
             return []
             
         cursor = conn.cursor()
+        # Zamanlar yalnızca seçilen 5 kayıt için metne çevrilir
         cursor.execute('''
-            SELECT d.ders_tarihi, d.ders_saati, y.durum, y.kayit_saati
-            FROM yoklamalar y
-            JOIN dersler d ON y.ders_id = d.id
-            WHERE y.isim = ?
-            ORDER BY d.ders_tarihi DESC, d.ders_saati DESC
-            LIMIT 5
+            SELECT strftime('%Y-%m-%d', zaman, 'unixepoch', 'localtime'),
+                   strftime('%H:%M:%S', zaman, 'unixepoch', 'localtime'),
+                   durum,
+                   strftime('%H:%M:%S', kayit_zamani, 'unixepoch', 'localtime')
+            FROM (
+                SELECT d.zaman, k.durum, k.kayit_zamani
+                FROM ogrenciler o
+                JOIN katilimlar k ON k.ogrenci_id = o.id
+                JOIN ders_oturumlari d ON d.id = k.ders_id
+                WHERE o.isim = ?
+                ORDER BY d.zaman DESC
+                LIMIT 5
+            )
+            ORDER BY zaman DESC
         ''', (isim,))
-        return cursor.fetchall()
+        return [(tarih, saat, DURUMLAR[durum], kayit_saati) for tarih, saat, durum, kayit_saati in cursor]
     except sqlite3.Error as e:
         print(f"Kayitlar getirilirken hata olustu: {e}")
         return []
 
-def detay_goster(event, tree):
+def genel_istatistikler(conn):
     """
-    Seçilen öğrencinin detaylı yoklama bilgilerini gösteren pencereyi açar
-    
+    Geçmiş yoklamalar ekranındaki genel sayıları getirir
+
     Args:
-        event: Treeview seçim olayı
-        tree: Ana penceredeki Treeview widget'ı
-        
+        conn (sqlite3.Connection): Veritabanı bağlantısı
+
+    Returns:
+        tuple: (ders sayısı, yoklaması olan öğrenci sayısı, toplam katılım)
+
     Not:
-        - Son 5 dersin yoklama kayıtlarını gösterir
-        - Modern ve koyu tema kullanır
-        - Durum bilgisi emoji ile gösterilir (✅/❌)
+        Sayılar özet tablolarından okunur (bütün yoklama kayıtları taranmaz)
     """
-    try:
-        item = tree.selection()[0]
-        kisi = tree.item(item, "values")[0]
-        
-        # Detay penceresi oluştur ve yapılandır
-        detay_pencere = tk.Toplevel()
-        detay_pencere.title(f"Kisi Detayi - {kisi}")
-        detay_pencere.geometry("500x300")
-        detay_pencere.configure(bg='#0A0E17')  # Koyu tema arka planı
-        
-        style = ttk.Style()
-        style.configure("Detay.TLabel",
-                      font=('Arial', 10),
-                      padding=5,
-                      background='#0A0E17',
-                      foreground='#E2E8F0')
-        
-        style.configure("Custom.TButton",
-                       font=('Segoe UI', 11),
-                       background='#3B82F6',
-                       foreground='white',
-                       padding=[15, 8])
-        
-        style.map("Custom.TButton",
-                  background=[('active', '#60A5FA')],
-                  foreground=[('active', '#FFFFFF')])
-        
-        # Treeview stili
-        style.configure("Detay.Treeview",
-                      background='#1A1F2C',
-                      foreground='#E2E8F0',
-                      fieldbackground='#1A1F2C',
-                      font=('Segoe UI', 10),
-                      rowheight=35,
-                      borderwidth=0)  # Kenarlık kaldırıldı
-        
-        style.configure("Detay.Treeview.Heading",
-                      background='#1A1F2C',
-                      foreground='#60A5FA',
-                      font=('Segoe UI', 11, 'bold'),
-                      borderwidth=0)  # Kenarlık kaldırıldı
-        
-        style.map("Detay.Treeview",
-                 background=[('selected', '#3B82F6'), ('!selected', '#1A1F2C')],
-                 foreground=[('selected', '#FFFFFF'), ('!selected', '#E2E8F0')])
-        
-        # Üst kısım container
-        top_container = ttk.Frame(detay_pencere, style="Dark.TFrame")
-        top_container.pack(fill='x', padx=10, pady=5)
-        
-        # Frame stili
-        style.configure("Dark.TFrame", background='#0A0E17')
-        
-        # Geri butonu
-        geri_button = ttk.Button(
-            top_container,
-            text="← Geri",
-            command=detay_pencere.destroy,
-            style="Custom.TButton"
-        )
-        geri_button.pack(side='left')
-        
-        # Başlık
-        baslik_label = tk.Label(
-            top_container, 
-            text=f"{kisi} - Son 5 Ders Yoklama Kaydi", 
-            font=('Segoe UI', 12, 'bold'),
-            bg='#0A0E17',
-            fg='#E2E8F0'
-        )
-        baslik_label.pack(side='left', padx=20)
-        
-        columns = ('Tarih', 'Ders Saati', 'Durum', 'Kayit Saati')
-        detay_tree = ttk.Treeview(detay_pencere, columns=columns, show='headings', style="Detay.Treeview")
-        
-        for col in columns:
-            detay_tree.heading(col, text=col)
-            detay_tree.column(col, width=120, anchor='center')
-        
-        conn = sqlite3.connect('yoklama.db')
-        kayitlar = yoklama_getir(conn, kisi)
-        conn.close()
-        
-        for kayit in kayitlar:
-            tarih, ders_saati, durum, kayit_saati = kayit
-            durum_simge = "✅" if durum == "KATILDI" else "❌"
-            detay_tree.insert('', 'end', values=(tarih, ders_saati, durum_simge, kayit_saati))
-        
-        detay_tree.pack(pady=10, padx=10, fill='both', expand=True)
-        
-    except Exception as e:
-        print(f"Detay gosterilirken hata olustu: {e}")
-
-def sonuc_tablosu_goster(yoklama_durumu, ders_id):
-    root = tk.Tk()
-    root.title("Yoklama Sonuçları")
-    root.geometry("1200x800")
-    root.configure(bg='#0A0E17')
-    
-    # Stil ayarları
-    style = ttk.Style()
-    style.theme_use('clam')
-    
-    # Ana tema renkleri
-    PRIMARY_BG = '#0A0E17'      # Koyu arka plan
-    SECONDARY_BG = '#1A1F2C'    # Biraz daha açık arka plan
-    ACCENT_COLOR = '#3B82F6'    # Mavi vurgu rengi
-    TEXT_COLOR = '#E2E8F0'      # Ana metin rengi
-    HIGHLIGHT_COLOR = '#60A5FA'  # Vurgulu metin rengi
-    
-    # Stil konfigürasyonları
-    style.configure("Header.TLabel",
-                   font=('Segoe UI', 24, 'bold'),
-                   background=PRIMARY_BG,
-                   foreground=TEXT_COLOR)
-    
-    style.configure("Stats.TLabel",
-                   font=('Segoe UI', 12),
-                   background=PRIMARY_BG,
-                   foreground=TEXT_COLOR,
-                   padding=5)
-    
-    style.configure("Custom.TNotebook",
-                   background=PRIMARY_BG,
-                   borderwidth=0)
-    
-    style.configure("Custom.TNotebook.Tab",
-                   padding=[20, 10],
-                   font=('Segoe UI', 11),
-                   background=SECONDARY_BG,
-                   foreground=TEXT_COLOR)
-    
-    style.map("Custom.TNotebook.Tab",
-              background=[("selected", ACCENT_COLOR)],
-              foreground=[("selected", "#FFFFFF")])
-    
-    style.configure("Custom.Treeview",
-                   background=SECONDARY_BG,
-                   foreground=TEXT_COLOR,
-                   fieldbackground=SECONDARY_BG,
-                   font=('Segoe UI', 10),
-                   rowheight=35,
-                   borderwidth=0)
-    
-    style.configure("Custom.Treeview.Heading",
-                   background=SECONDARY_BG,
-                   foreground=HIGHLIGHT_COLOR,
-                   font=('Segoe UI', 11, 'bold'),
-                   borderwidth=0)
-    
-    style.map("Custom.Treeview",
-              background=[('selected', ACCENT_COLOR), ('!selected', SECONDARY_BG)],
-              foreground=[('selected', '#FFFFFF'), ('!selected', TEXT_COLOR)])
-    
-    # Buton stili
-    style.configure("Custom.TButton",
-                   font=('Segoe UI', 11),
-                   background=ACCENT_COLOR,
-                   foreground='white',
-                   padding=[15, 8])
-    
-    style.map("Custom.TButton",
-              background=[('active', HIGHLIGHT_COLOR)],
-              foreground=[('active', '#FFFFFF')])
-    
-    # Ana container frame
-    main_container = ttk.Frame(root)
-    main_container.pack(pady=20, padx=20, fill='both', expand=True)
-    
-    # Geçmiş Detay butonu
-    gecmis_detay_button = ttk.Button(
-        main_container,
-        text="📋 Geçmiş Yoklamalar",
-        command=lambda: gecmis_yoklamalari_goster(),
-        style="Custom.TButton"
-    )
-    gecmis_detay_button.pack(anchor='nw', pady=(0, 20))
-    
-    # Üst bilgi frame'i
-    header_frame = tk.Frame(main_container, bg=PRIMARY_BG)
-    header_frame.pack(fill='x', pady=(0, 30))
-    
-    # Logo/İkon
-    logo_label = tk.Label(header_frame,
-                         text="📊",
-                         font=('Segoe UI', 48),
-                         bg=PRIMARY_BG,
-                         fg=ACCENT_COLOR)
-    logo_label.pack(pady=(0, 15))
-    
-    # Başlık
-    baslik = tk.Label(header_frame,
-                     text="YOKLAMA SONUÇLARI",
-                     font=('Segoe UI', 28, 'bold'),
-                     bg=PRIMARY_BG,
-                     fg=TEXT_COLOR)
-    baslik.pack()
-    
-    simdi = datetime.now()
-    tarih_saat = tk.Label(header_frame,
-                         text=f"{simdi.strftime('%d/%m/%Y %H:%M')}",
-                         font=('Segoe UI', 13),
-                         bg=PRIMARY_BG,
-                         fg=HIGHLIGHT_COLOR)
-    tarih_saat.pack(pady=8)
-    
-    # İstatistik kartları
-    stats_frame = tk.Frame(main_container, bg=PRIMARY_BG)
-    stats_frame.pack(fill='x', pady=(0, 30))
-    
-    # İstatistikleri getir
-    conn = sqlite3.connect('yoklama.db')
-    cursor = conn.cursor()
-    
-    cursor.execute('''
+    ders_sayisi, toplam_ogrenci, toplam_katilim = conn.execute('''
         SELECT 
-            COUNT(DISTINCT d.id) as ders_sayisi,
-            SUM(CASE WHEN y.durum = 'KATILDI' THEN 1 ELSE 0 END) as toplam_katilim
-        FROM dersler d
-        LEFT JOIN yoklamalar y ON d.id = y.ders_id
-    ''')
-    
-    ders_sayisi, toplam_katilim = cursor.fetchone()
-    
-    # Faces klasöründeki öğrenci sayısını al
-    faces_dir = 'faces'
-    toplam_ogrenci = len([f for f in os.listdir(faces_dir) if f.endswith(('.jpg', '.JPG', '.png', '.PNG'))])
-    
-    # İstatistik kartları
-    stats = [
-        {"title": "Toplam Ders", "value": ders_sayisi, "icon": "📚", "color": HIGHLIGHT_COLOR},
-        {"title": "Toplam Öğrenci", "value": toplam_ogrenci, "icon": "👥", "color": "#10B981"},
-        {"title": "Toplam Katılım", "value": toplam_katilim or 0, "icon": "✅", "color": "#8B5CF6"}
-    ]
-    
-    for stat in stats:
-        card = tk.Frame(stats_frame, bg=SECONDARY_BG)
-        card.pack(side='left', fill='x', expand=True, padx=10)
-        
-        tk.Label(card, text=stat["icon"],
-                font=('Segoe UI', 24),
-                bg=SECONDARY_BG, fg=stat["color"]).pack()
-        
-        tk.Label(card, text=stat["title"],
-                font=('Segoe UI', 11),
-                bg=SECONDARY_BG, fg=TEXT_COLOR).pack(pady=(5,0))
-        
-        tk.Label(card, text=str(stat["value"]),
-                font=('Segoe UI', 20, 'bold'),
-                bg=SECONDARY_BG, fg=stat["color"]).pack(pady=(5,15))
+            (SELECT COUNT(*) FROM ders_ozetleri) as ders_sayisi,
+            (SELECT COUNT(*) FROM ogrenci_ozetleri
+             WHERE katildigi + katilmadigi > 0) as toplam_ogrenci,
+            (SELECT SUM(katilan) FROM ders_ozetleri) as toplam_katilim
+    ''').fetchone()
+    return ders_sayisi, toplam_ogrenci or 0, toplam_katilim or 0
 
-    # Notebook (sekmeli görünüm)
-    notebook = ttk.Notebook(main_container, style="Custom.TNotebook")
-    notebook.pack(expand=True, fill='both', pady=(0, 20))
-    
-    # Katılanlar sekmesi
-    katilan_frame = ttk.Frame(notebook)
-    notebook.add(katilan_frame, text='✓ Katılanlar')
-    
-    katilan_tree = ttk.Treeview(katilan_frame,
-                               columns=('Isim', 'Kayit Saati'),
-                               show='headings',
-                               style="Custom.Treeview")
-    katilan_tree.heading('Isim', text='İsim')
-    katilan_tree.heading('Kayit Saati', text='Kayıt Saati')
-    katilan_tree.column('Isim', width=300, anchor='center')
-    katilan_tree.column('Kayit Saati', width=300, anchor='center')
-    
-    # Katılmayanlar sekmesi
-    katilmayan_frame = ttk.Frame(notebook)
-    notebook.add(katilmayan_frame, text='✗ Katılmayanlar')
-    
-    katilmayan_tree = ttk.Treeview(katilmayan_frame,
-                                  columns=('Isim', 'Durum'),
-                                  show='headings',
-                                  style="Custom.Treeview")
-    katilmayan_tree.heading('Isim', text='İsim')
-    katilmayan_tree.heading('Durum', text='Durum')
-    katilmayan_tree.column('Isim', width=300, anchor='center')
-    katilmayan_tree.column('Durum', width=300, anchor='center')
-    
-    # Scrollbar'lar
-    katilan_scroll = ttk.Scrollbar(katilan_frame, orient='vertical', command=katilan_tree.yview)
-    katilan_tree.configure(yscrollcommand=katilan_scroll.set)
-    
-    katilmayan_scroll = ttk.Scrollbar(katilmayan_frame, orient='vertical', command=katilmayan_tree.yview)
-    katilmayan_tree.configure(yscrollcommand=katilmayan_scroll.set)
-    
-    # Verileri ağaçlara ekle
-    for name, durum in yoklama_durumu.items():
-        if durum:
-            katilan_tree.insert('', 'end', values=(name, simdi.strftime('%H:%M:%S')))
-        else:
-            katilmayan_tree.insert('', 'end', values=(name, "Katılmadı"))
-    
-    # Ağaçları ve scrollbar'ları yerleştir
-    katilan_tree.pack(side='left', fill='both', expand=True)
-    katilan_scroll.pack(side='right', fill='y')
-    
-    katilmayan_tree.pack(side='left', fill='both', expand=True)
-    katilmayan_scroll.pack(side='right', fill='y')
-    
-    # Detay görüntüleme için çift tıklama eventi
-    katilan_tree.bind('<Double-1>', lambda e: detay_goster(e, katilan_tree))
-    katilmayan_tree.bind('<Double-1>', lambda e: detay_goster(e, katilmayan_tree))
-    
-    # Alt bilgi
-    footer_frame = ttk.Frame(main_container, style="Main.TFrame")
-    footer_frame.pack(fill='x', pady=10)
-
-    # Geçmiş yoklamaları görüntüleme butonu
-    gecmis_button = ttk.Button(
-        footer_frame,
-        text="Geçmiş Yoklamaları Görüntüle",
-        command=lambda: gecmis_yoklamalari_goster(),
-        style="Custom.TButton"
-    )
-    gecmis_button.pack(side='left', padx=20)
-
-    # Footer text
-    footer_text = "Yoklama sistemi başarıyla tamamlandı."
-    footer_label = tk.Label(footer_frame,
-                          text=footer_text,
-                          font=('Segoe UI', 10),
-                          bg='#0A0E17',
-                          fg='#E2E8F0')
-    footer_label.pack(side='right', pady=5, padx=20)
-
-    root.mainloop()
-
-def gecmis_yoklamalari_goster():
-    root = tk.Tk()
-    root.title("Geçmiş Yoklamalar")
-    root.geometry("1200x800")
-    root.configure(bg='#0A0E17')
-    
-    # Stil ayarları
-    style = ttk.Style()
-    style.theme_use('clam')
-    
-    # Ana tema renkleri
-    PRIMARY_BG = '#0A0E17'      # Koyu arka plan
-    SECONDARY_BG = '#1A1F2C'    # Biraz daha açık arka plan
-    ACCENT_COLOR = '#3B82F6'    # Mavi vurgu rengi
-    TEXT_COLOR = '#E2E8F0'      # Ana metin rengi
-    HIGHLIGHT_COLOR = '#60A5FA'  # Vurgulu metin rengi
-    
-    # Treeview stili
-    style.configure("Custom.Treeview",
-                   background=SECONDARY_BG,
-                   foreground=TEXT_COLOR,
-                   fieldbackground=SECONDARY_BG,
-                   font=('Segoe UI', 11),
-                   rowheight=40,
-                   borderwidth=0)
-    
-    style.configure("Custom.Treeview.Heading",
-                   background=SECONDARY_BG,
-                   foreground=HIGHLIGHT_COLOR,
-                   font=('Segoe UI', 12, 'bold'),
-                   borderwidth=0)
-    
-    style.map("Custom.Treeview",
-              background=[('selected', ACCENT_COLOR), ('!selected', SECONDARY_BG)],
-              foreground=[('selected', '#FFFFFF'), ('!selected', TEXT_COLOR)])
-    
-    # Buton stili
-    style.configure("Custom.TButton",
-                   font=('Segoe UI', 11),
-                   background=ACCENT_COLOR,
-                   foreground='white',
-                   padding=[15, 8])
-    
-    style.map("Custom.TButton",
-              background=[('active', HIGHLIGHT_COLOR)],
-              foreground=[('active', '#FFFFFF')])
-    
-    # Ana container frame
-    main_container = ttk.Frame(root)
-    main_container.pack(fill='both', expand=True, padx=30, pady=20)
-    
-    # Üst kısım container
-    top_container = ttk.Frame(main_container)
-    top_container.pack(fill='x', pady=(0, 30))
-    
-    # Başlık ve tarih container
-    header_container = ttk.Frame(top_container)
-    header_container.pack(fill='x')
-    
-    # Logo
-    logo_label = tk.Label(header_container,
-                         text="📅",
-                         font=('Segoe UI', 48),
-                         bg=PRIMARY_BG,
-                         fg=ACCENT_COLOR)
-    logo_label.pack(pady=(0, 15))
-    
-    # Başlık
-    baslik = tk.Label(header_container,
-                     text="Geçmiş Yoklamalar",
-                     font=('Segoe UI', 28, 'bold'),
-                     bg=PRIMARY_BG,
-                     fg=TEXT_COLOR)
-    baslik.pack()
-    
-    simdi = datetime.now()
-    tarih_saat = tk.Label(header_container,
-                         text=f"{simdi.strftime('%d/%m/%Y %H:%M')}",
-                         font=('Segoe UI', 13),
-                         bg=PRIMARY_BG,
-                         fg=HIGHLIGHT_COLOR)
-    tarih_saat.pack(pady=8)
-    
-    # İstatistik kartları için frame
-    stats_frame = ttk.Frame(top_container)
-    stats_frame.pack(fill='x', pady=20)
-    
-    # Veritabanı bağlantısı ve istatistikler
-    conn = sqlite3.connect('yoklama.db')
-    cursor = conn.cursor()
-    
-    # İstatistikleri getir
-    cursor.execute('''
-        SELECT 
-            COUNT(DISTINCT d.id) as ders_sayisi,
-            COUNT(DISTINCT y.isim) as toplam_ogrenci,
-            SUM(CASE WHEN y.durum = 'KATILDI' THEN 1 ELSE 0 END) as toplam_katilim
-        FROM dersler d
-        LEFT JOIN yoklamalar y ON d.id = y.ders_id
-    ''')
-    
-    ders_sayisi, toplam_ogrenci, toplam_katilim = cursor.fetchone()
-    
-    # İstatistik kartları
-    stats = [
-        {"title": "Toplam Ders", "value": ders_sayisi, "icon": "📚", "color": HIGHLIGHT_COLOR},
-        {"title": "Toplam Öğrenci", "value": toplam_ogrenci or 0, "icon": "👥", "color": "#10B981"},
-        {"title": "Toplam Katılım", "value": toplam_katilim or 0, "icon": "✅", "color": "#8B5CF6"}
-    ]
-    
-    for stat in stats:
-        card = tk.Frame(stats_frame, bg=SECONDARY_BG)
-        card.pack(side='left', fill='x', expand=True, padx=10)
-        
-        tk.Label(card, text=stat["icon"],
-                font=('Segoe UI', 24),
-                bg=SECONDARY_BG, fg=stat["color"]).pack()
-        
-        tk.Label(card, text=stat["title"],
-                font=('Segoe UI', 12),
-                bg=SECONDARY_BG, fg=TEXT_COLOR).pack(pady=(5,0))
-        
-        tk.Label(card, text=str(stat["value"]),
-                font=('Segoe UI', 20, 'bold'),
-                bg=SECONDARY_BG, fg=stat["color"]).pack(pady=(5,15))
+def dersleri_getir(conn, son_anahtar=None, sayfa_boyutu=200):
+    """
+    Dersleri özetleriyle birlikte en yeniden eskiye sayfa sayfa getirir
 
-    # Treeview container
-    tree_container = ttk.Frame(main_container)
-    tree_container.pack(fill='both', expand=True)
-    
-    # Treeview
-    tree = ttk.Treeview(tree_container, style="Custom.Treeview")
-    
-    # Scrollbar
-    scrollbar = ttk.Scrollbar(tree_container, orient="vertical", command=tree.yview)
-    scrollbar.pack(side='right', fill='y')
-    
-    tree.configure(yscrollcommand=scrollbar.set)
-    
-    # Sütunlar
-    tree["columns"] = ("Tarih", "Saat", "Toplam", "Katılan", "Katılmayan", "Katılım Oranı")
-    tree["show"] = "headings"
-    
-    # Sütun genişlikleri ve başlıkları
-    column_widths = {
-        "Tarih": 180,
-        "Saat": 140,
-        "Toplam": 140,
-        "Katılan": 140,
-        "Katılmayan": 140,
-        "Katılım Oranı": 140
-    }
-    
-    for col, width in column_widths.items():
-        tree.heading(col, text=col)
-        tree.column(col, width=width, anchor="center")
-    
-    # Dersleri getir
-    cursor.execute('''
-        SELECT 
-            d.ders_tarihi,
-            d.ders_saati,
-            COUNT(DISTINCT y.isim) as toplam,
-            SUM(CASE WHEN y.durum = 'KATILDI' THEN 1 ELSE 0 END) as katilan,
-            SUM(CASE WHEN y.durum = 'KATILMADI' THEN 1 ELSE 0 END) as katilmayan
-        FROM dersler d
-        LEFT JOIN yoklamalar y ON d.id = y.ders_id
-        GROUP BY d.id
-        ORDER BY d.ders_tarihi DESC, d.ders_saati DESC
-    ''')
-    
-    for row in cursor.fetchall():
-        tarih, saat, toplam, katilan, katilmayan = row
-        if toplam > 0:
-            oran = f"%{(katilan/toplam*100):.1f}"
-        else:
-            oran = "%0.0"
-        tree.insert("", "end", values=(tarih, saat, toplam, katilan, katilmayan, oran))
-    
-    tree.pack(fill='both', expand=True)
-    
-    # Alt bilgi
-    footer_frame = ttk.Frame(main_container, style="Main.TFrame")
-    footer_frame.pack(fill='x', pady=15)
-    
-    # Info ikonu ve metin
-    info_text = "Detaylı bilgi için tablodaki derslere çift tıklayın"
-    info_label = tk.Label(footer_frame,
-                         text="ℹ️ " + info_text,
-                         font=('Segoe UI', 11),
-                         bg='#0A0E17',
-                         fg='#E2E8F0')
-    info_label.pack(side='left')
-    
-    # Detay penceresi
-    def detay_goster(event):
-        item = tree.selection()[0]
-        tarih, saat = tree.item(item)["values"][:2]
-        
-        detay = tk.Toplevel(root)
-        detay.title(f"Ders Detayı - {tarih} {saat}")
-        detay.geometry("900x700")
-        detay.configure(bg='#0A0E17')
-        
-        # Üst kısım
-        header_frame = ttk.Frame(detay, style="Main.TFrame")
-        header_frame.pack(fill='x', padx=30, pady=20)
-        
-        # Başlık
-        tk.Label(header_frame,
-                text=f"{tarih} {saat}",
-                font=('Segoe UI', 24, 'bold'),
-                bg='#0A0E17',
-                fg='#E2E8F0').pack(side='left')
-        
-        # Kapat butonu
-        ttk.Button(header_frame,
-                  text="✕ Kapat",
-                  command=detay.destroy,
-                  style="Custom.TButton").pack(side='right')
-        
-        # Detay tablosu
-        detay_tree = ttk.Treeview(detay, style="Custom.Treeview")
-        detay_tree["columns"] = ("İsim", "Durum", "Kayıt Saati")
-        detay_tree["show"] = "headings"
-        
-        # Sütun ayarları
-        column_widths = {
-            "İsim": 300,
-            "Durum": 200,
-            "Kayıt Saati": 200
-        }
-        
-        for col, width in column_widths.items():
-            detay_tree.heading(col, text=col)
-            detay_tree.column(col, width=width, anchor="center")
-        
-        # Scrollbar
-        detay_scroll = ttk.Scrollbar(detay, orient="vertical", command=detay_tree.yview)
-        detay_scroll.pack(side='right', fill='y', padx=(0, 30))
-        
-        detay_tree.configure(yscrollcommand=detay_scroll.set)
-        
-        # Verileri getir
-        cursor.execute('''
-            SELECT y.isim, y.durum, y.kayit_saati
-            FROM yoklamalar y
-            JOIN dersler d ON y.ders_id = d.id
-            WHERE d.ders_tarihi = ? AND d.ders_saati = ?
-            ORDER BY y.isim
-        ''', (tarih, saat))
-        
-        for kayit in cursor.fetchall():
-            detay_tree.insert("", "end", values=kayit)
-        
-        detay_tree.pack(fill='both', expand=True, padx=30)
-    
-    # Çift tıklama eventi
-    tree.bind('<Double-1>', detay_goster)
-    
-    root.mainloop()
-    
-    if conn:
-        conn.close()
+    Args:
+        conn (sqlite3.Connection): Veritabanı bağlantısı
+        son_anahtar (tuple): Önceki sayfanın son dersinin (zaman, ders_id) bilgisi, ilk sayfa için None
+        sayfa_boyutu (int): Getirilecek en fazla ders sayısı
+
+    Returns:
+        list: (ders_id, tarih, saat, toplam, katilan, katilmayan, zaman) satırları;
+            son sütun sayfalama anahtarında kullanılan Unix zamanıdır
+
+    Not:
+        - OFFSET yerine anahtar tabanlı sayfalama yapılır; her sayfa ders zamanı (zaman)
+          indeksinde doğrudan kaldığı yerden okunur, geçmiş büyüdükçe yavaşlamaz
+        - Anahtar saklanan tamsayı zamandır; yerel tarih/saat yalnızca gösterim içindir
+          (yaz saati geri alınırken aynı yerel saat iki kez yaşandığından anahtar olamaz)
+    """
+    if son_anahtar is None:
+        return conn.execute('''
+            SELECT d.id,
+                   strftime('%Y-%m-%d', d.zaman, 'unixepoch', 'localtime'),
+                   strftime('%H:%M:%S', d.zaman, 'unixepoch', 'localtime'),
+                   o.toplam, o.katilan, o.katilmayan, d.zaman
+            FROM ders_oturumlari d
+            JOIN ders_ozetleri o ON o.ders_id = d.id
+            ORDER BY d.zaman DESC, d.id DESC
+            LIMIT ?
+        ''', (sayfa_boyutu,)).fetchall()
+    return conn.execute('''
+        SELECT d.id,
+               strftime('%Y-%m-%d', d.zaman, 'unixepoch', 'localtime'),
+               strftime('%H:%M:%S', d.zaman, 'unixepoch', 'localtime'),
+               o.toplam, o.katilan, o.katilmayan, d.zaman
+        FROM ders_oturumlari d
+        JOIN ders_ozetleri o ON o.ders_id = d.id
+        WHERE (d.zaman, d.id) < (?, ?)
+        ORDER BY d.zaman DESC, d.id DESC
+        LIMIT ?
+    ''', (son_anahtar[0], son_anahtar[1], sayfa_boyutu)).fetchall()
+
+def ders_detayi_getir(conn, ders_id, son_isim=None, sayfa_boyutu=200):
+    """
+    Bir dersin yoklama kayıtlarını isim sırasıyla sayfa sayfa getirir
+
+    Args:
+        conn (sqlite3.Connection): Veritabanı bağlantısı
+        ders_id (int): Dersin ID'si
+        son_isim (str): Önceki sayfanın son ismi, ilk sayfa için None
+        sayfa_boyutu (int): Getirilecek en fazla kayıt sayısı
+
+    Returns:
+        list: (isim, durum, kayit_saati) satırları
+    """
+    satirlar = conn.execute('''
+        SELECT o.isim, k.durum, strftime('%H:%M:%S', k.kayit_zamani, 'unixepoch', 'localtime')
+        FROM katilimlar k
+        JOIN ogrenciler o ON o.id = k.ogrenci_id
+        WHERE k.ders_id = ? AND o.isim > ?
+        ORDER BY o.isim
+        LIMIT ?
+    ''', (ders_id, son_isim if son_isim is not None else '', sayfa_boyutu))
+    return [(isim, DURUMLAR[durum], kayit_saati) for isim, durum, kayit_saati in satirlar]
 
 def rastgele_yoklama_ekle(conn, kayit_sayisi=200):
     """
@@ -782,49 +798,122 @@ def rastgele_yoklama_ekle(conn, kayit_sayisi=200):
             
         cursor = conn.cursor()
         
-        # Faces klasöründeki isimleri al
+        # Faces klasöründeki isimleri al (tek fotoğraflar ve kişi klasörleri)
+        from kodlama_deposu import fotograflari_listele, dosya_adindan_isim  # kodlama_deposu bu modülü içe aktarır
         faces_dir = 'faces'
-        ogrenciler = []
-        for filename in os.listdir(faces_dir):
-            if filename.endswith(('.jpg', '.JPG', '.png', '.PNG')):
-                name = os.path.splitext(filename)[0]
-                # Türkçe karakterleri düzelt
-                name = name.replace('ı', 'i').replace('ğ', 'g').replace('ü', 'u').replace('ş', 's').replace('ö', 'o').replace('ç', 'c')
-                name = name.replace('İ', 'I').replace('Ğ', 'G').replace('Ü', 'U').replace('Ş', 'S').replace('Ö', 'O').replace('Ç', 'C')
-                ogrenciler.append(name)
+        ogrenciler = list(dict.fromkeys(dosya_adindan_isim(filename)
+                                        for filename in fotograflari_listele(faces_dir)))
         
         if not ogrenciler:
             print("Faces klasöründe fotoğraf bulunamadı")
             return
             
-        # Son 30 gün için rastgele tarihler oluştur
-        bugun = datetime.now()
-        for _ in range(kayit_sayisi):
-            # Rastgele bir tarih seç (son 30 gün içinde)
-            rastgele_gun = random.randint(1, 30)
-            ders_tarihi = (bugun - timedelta(days=rastgele_gun)).strftime('%Y-%m-%d')
-            ders_saati = f"{random.randint(9,16):02d}:00:00"
-            
+        # Son 30 gün için rastgele ve birbirinden farklı ders zamanları seçilir
+        # (ders_oturumlari tablosunda zaman benzersizdir, mevcut dersler atlanır)
+        bugun = datetime.now().replace(minute=0, second=0, microsecond=0)
+        mevcut = {satir[0] for satir in cursor.execute('SELECT zaman FROM ders_oturumlari')}
+        bos_zamanlar = [(bugun - timedelta(days=gun)).replace(hour=saat)
+                        for gun in range(1, 31) for saat in range(9, 17)]
+        bos_zamanlar = [zaman for zaman in bos_zamanlar if zaman_damgasi(zaman) not in mevcut]
+        if kayit_sayisi > len(bos_zamanlar):
+            print(f"Son 30 günde yalnızca {len(bos_zamanlar)} boş ders zamanı var")
+            kayit_sayisi = len(bos_zamanlar)
+
+        for ders_zamani in random.sample(bos_zamanlar, kayit_sayisi):
             # Yeni ders kaydı oluştur
             cursor.execute('''
-                INSERT INTO dersler (ders_tarihi, ders_saati)
-                VALUES (?, ?)
-            ''', (ders_tarihi, ders_saati))
+                INSERT INTO ders_oturumlari (zaman)
+                VALUES (?)
+            ''', (zaman_damgasi(ders_zamani),))
             
             ders_id = cursor.lastrowid
             
-            # Her öğrenci için rastgele katılım durumu ekle
-            for ogrenci in ogrenciler:
-                durum = random.choice(['KATILDI', 'KATILMADI'])
-                kayit_saati = f"{random.randint(9,16):02d}:{random.randint(0,59):02d}:00"
-                
-                cursor.execute('''
-                    INSERT OR REPLACE INTO yoklamalar (ders_id, isim, durum, kayit_saati)
-                    VALUES (?, ?, ?, ?)
-                ''', (ders_id, ogrenci, durum, kayit_saati))
+            # Her öğrenci için rastgele katılım durumu eklenir (ders başına tek executemany)
+            _yoklamalari_yaz(conn, [
+                (ders_id, ogrenci, random.choice(['KATILDI', 'KATILMADI']),
+                 zaman_damgasi(ders_zamani.replace(hour=random.randint(9, 16), minute=random.randint(0, 59))))
+                for ogrenci in ogrenciler
+            ])
         
         conn.commit()
         print(f"{kayit_sayisi} adet rastgele yoklama kaydı başarıyla eklendi.")
         
     except sqlite3.Error as e:
         print(f"Rastgele kayıt eklenirken hata oluştu: {e}")
+
+def sentetik_veri_olustur(conn, ogrenci_sayisi, ders_sayisi, katilim_orani=0.8,
+                          parca_boyutu=50000, tohum=None, tetikleyicileri_kapat=True):
+    """
+    Performans ölçümleri için büyük miktarda sentetik ders ve yoklama kaydı üretir
+
+    Args:
+        conn (sqlite3.Connection): Veritabanı bağlantısı
+        ogrenci_sayisi (int): Üretilecek öğrenci sayısı (Ogrenci_00001, Ogrenci_00002, ...)
+        ders_sayisi (int): Üretilecek ders sayısı; her derse her öğrenci için bir kayıt eklenir
+        katilim_orani (float): Bir kaydın KATILDI olma olasılığı
+        parca_boyutu (int): Tek işlemde (transaction) eklenecek yoklama kaydı sayısı
+        tohum (int): Rastgele sayı tohumu, aynı tohum aynı veriyi üretir
+        tetikleyicileri_kapat (bool): Yükleme sırasında özet tetikleyicileri kaldırılıp
+            sonunda özetler tek seferde hesaplansın mı
+
+    Returns:
+        int: Eklenen yoklama kaydı sayısı (ogrenci_sayisi * ders_sayisi)
+
+    Not:
+        - Öğrenciler faces klasöründen okunmaz, istenen sayıda isim üretilir
+        - Dersler mevcut en eski dersten geriye doğru, günde 8 saat (09:00-16:00) olacak
+          şekilde sırayla yerleştirilir; benzersizlik kısıtına hiç takılmaz
+        - Kayıtlar executemany ile, her biri ayrı bir işlem olan parçalar halinde eklenir;
+          öğrenci ID'leri baştan alındığı için kayıtlar doğrudan tamsayı olarak yazılır
+    """
+    rastgele = random.Random(tohum)
+    ogrenciler = [f"Ogrenci_{i:05d}" for i in range(1, ogrenci_sayisi + 1)]
+    with conn:
+        conn.executemany(OGRENCI_EKLE_SQL, [(isim,) for isim in ogrenciler])
+    ogrenci_idleri = [satir[0] for satir in conn.execute(
+        'SELECT id FROM ogrenciler WHERE isim BETWEEN ? AND ? ORDER BY isim', (ogrenciler[0], ogrenciler[-1]))]
+
+    # Dersler mevcut en eski dersin öncesine yerleştirilir
+    en_eski = conn.execute('SELECT MIN(zaman) FROM ders_oturumlari').fetchone()[0]
+    baslangic = (datetime.fromtimestamp(en_eski) if en_eski else datetime.now()).replace(
+        hour=0, minute=0, second=0, microsecond=0)
+    zamanlar = [zaman_damgasi(baslangic - timedelta(days=1 + i // 8) + timedelta(hours=9 + i % 8))
+                for i in range(ders_sayisi)]
+
+    if tetikleyicileri_kapat:
+        # Satır başına çalışan tetikleyiciler yerine özetler yükleme sonunda tek sorguyla hesaplanır
+        with conn:
+            for tetikleyici in OZET_TETIKLEYICILERI:
+                conn.execute(f'DROP TRIGGER IF EXISTS {tetikleyici}')
+
+    try:
+        with conn:
+            conn.executemany('INSERT INTO ders_oturumlari (zaman) VALUES (?)', [(zaman,) for zaman in zamanlar])
+        dersler = conn.execute('SELECT id, zaman FROM ders_oturumlari ORDER BY id DESC LIMIT ?',
+                               (ders_sayisi,)).fetchall()
+
+        def kayitlar():
+            for ders_id, ders_zamani in dersler:
+                for ogrenci_id in ogrenci_idleri:
+                    durum = 1 if rastgele.random() < katilim_orani else 0
+                    yield (ders_id, ogrenci_id, durum, ders_zamani + rastgele.randint(0, 3599))
+
+        uretec = kayitlar()
+        eklenen = 0
+        while True:
+            parca = list(itertools.islice(uretec, parca_boyutu))
+            if not parca:
+                break
+            with conn:
+                conn.executemany('INSERT INTO katilimlar (ders_id, ogrenci_id, durum, kayit_zamani) '
+                                 'VALUES (?, ?, ?, ?)', parca)
+            eklenen += len(parca)
+    finally:
+        if tetikleyicileri_kapat:
+            with conn:
+                for tetikleyici in OZET_TETIKLEYICILERI.values():
+                    conn.execute(tetikleyici)
+            ozetleri_yeniden_olustur(conn)
+
+    conn.execute('PRAGMA optimize')
+    return eklenen
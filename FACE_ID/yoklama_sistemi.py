@@ -0,0 +1,236 @@
+"""
+Yoklama Sistemi Kütüphane Arayüzü
+Bu modül, yüz tanımalı yoklamayı betik çalıştırmadan başka programlara gömmek için
+üç temel yapı taşını bir araya getirir:
+- Kadro: faces klasöründen yüklenen isimler ve ortak eşleştirme matrisi (kişi başına
+  birden fazla fotoğraf, az sayıda prototip vektöre indirgenir)
+- YuzTanimlayici: kare başına tespit, kodlama ve eşleştirme (tanima modülünden)
+- YoklamaDeposu: ders açma ve yoklama yazma / okuma işlemleri
+Modül içe aktarıldığında veritabanı, kamera veya pencere açılmaz; tkinter ve
+face_recognition yalnızca gerçekten gerektiklerinde yüklenir.
+
+Komut satırı:
+    python yoklama_sistemi.py canli              # Kamerayla canlı yoklama (deneme.py)
+    python yoklama_sistemi.py toplu ders.mp4     # Kayıttan yoklama (toplu_isle.py)
+    python yoklama_sistemi.py sunucu --kaynak A101=0 --kaynak B203=1
+    python yoklama_sistemi.py kayit              # Kadroyu kodlayıp depoyu hazırlar
+    python yoklama_sistemi.py gecmis             # Geçmiş yoklamalar penceresi
+
+Örnek:
+    kadro = Kadro.klasorden('faces')
+    tanimlayici = kadro.tanimlayici()
+    depo = YoklamaDeposu()
+    ders_id = depo.ders_baslat()
+    sonuclar = tanimlayici.tani(frame)
+    depo.katildi(ders_id, [s.isim for s in sonuclar if s.kabul])
+"""
+
+import sys
+from datetime import datetime, timedelta
+from kodlama_deposu import kodlamalari_yukle, dosya_adindan_isim, VARSAYILAN_DEPO
+from eslestirici import YuzEslestirici, prototipleri_olustur
+from tanima import YuzTanimlayici, TanimaSonucu, BILINMEYEN_ISIM
+from takip import YuzTakipci
+from hareket import HareketKapisi
+from tespit import tespitci_olustur
+import yoklama_db
+
+__all__ = ['Kadro', 'YuzTanimlayici', 'TanimaSonucu', 'BILINMEYEN_ISIM', 'YoklamaDeposu']
+
+class Kadro:
+    """
+    Tanınacak kişilerin isimleri ve bütün tanımlayıcıların paylaştığı eşleştirici
+    """
+
+    def __init__(self, isimler, kodlamalar, tolerans=0.5, indeks_turu='kesin', prototip_sayisi=3, **ayarlar):
+        """
+        Args:
+            isimler (list): Her kodlamanın ait olduğu kişi (aynı kişi birden fazla kez geçebilir)
+            kodlamalar (list): İsimlerle aynı sırada 128 boyutlu yüz kodlamaları
+            tolerans (float): Eşleşme için en büyük mesafe
+            indeks_turu (str): INDEKS_TURLERI içindeki indeks adı ('kesin', 'ivf', 'int8', 'float16')
+            prototip_sayisi (int): Kişi başına eşleştirme matrisinde tutulacak en fazla satır
+                (ortalama + k-means merkezleri), None ise her fotoğraf ayrı satırdır
+            **ayarlar: Eşleştirme indeksine iletilen ek ayarlar (ör. 'ivf' için taranacak_liste,
+                'int8' / 'float16' için aday_sayisi ve siralama_dosyasi)
+        """
+        self.satir_isimleri, matris = prototipleri_olustur(isimler, kodlamalar, prototip_sayisi)
+        self.isimler = list(dict.fromkeys(self.satir_isimleri))  # Her kişi bir kez, ilk görünme sırasıyla
+        self.eslestirici = YuzEslestirici(matris, tolerans=tolerans, indeks_turu=indeks_turu, **ayarlar)
+
+    @classmethod
+    def klasorden(cls, faces_dir='faces', depo_yolu=VARSAYILAN_DEPO, isci_sayisi=None, **ayarlar):
+        """
+        Kadroyu faces klasöründen (kodlama deposu üzerinden) yükler; kişi klasörlerindeki
+        bütün fotoğraflar o kişiye aittir
+
+        Args:
+            faces_dir (str): Yüz fotoğraflarının bulunduğu klasör
+            depo_yolu (str): Kodlama deposu dosyası
+            isci_sayisi (int): Yeni fotoğrafları kodlayacak süreç sayısı
+            **ayarlar: Kadro yapıcısına iletilen eşleştirme ayarları
+
+        Returns:
+            Kadro: Yüklenen kadro (fotoğraf yoksa boş)
+        """
+        kadro = kodlamalari_yukle(faces_dir, depo_yolu, isci_sayisi=isci_sayisi)
+        return cls([dosya_adindan_isim(filename) for filename, _ in kadro],
+                   [kodlama for _, kodlama in kadro], **ayarlar)
+
+    def __len__(self):
+        return len(self.isimler)
+
+    def tanimlayici(self, olcek=0.25, takip=True, hareket=True, olcer=None, tespitci='hog',
+                    tam_cozunurlukte_kodla=True, **tespit_ayarlari):
+        """
+        Bu kadroyu kullanan yeni bir tanımlayıcı oluşturur
+
+        Args:
+            olcek (float): Tespit öncesi küçültme oranı
+            takip (bool): Onaylanmış yüzler yeniden kodlanmasın mı
+            hareket (bool): Durağan karelerde tespit atlansın mı
+            olcer (AsamaOlcer): Aşama sürelerini toplayan ölçer
+            tespitci (str): Yüz tespitçisi türü ('hog', 'haar', 'lbp') veya hazır bir tespitçi
+            tam_cozunurlukte_kodla (bool): Yüzler orijinal karede mi kodlansın (tespit her zaman küçültülmüş karede)
+            **tespit_ayarlari: Tespitçi yapıcısına iletilen ek ayarlar (model yolu, eşikler)
+
+        Returns:
+            YuzTanimlayici: Her görüntü kaynağı için ayrı bir tanımlayıcı kullanılmalıdır
+                (takip ve hareket durumu kaynağa özeldir); eşleştirici paylaşılır
+        """
+        return YuzTanimlayici(self.eslestirici, self.satir_isimleri, olcek=olcek,
+                              takipci=YuzTakipci() if takip else None,
+                              hareket_kapisi=HareketKapisi() if hareket else None,
+                              olcer=olcer,
+                              tespitci=tespitci_olustur(tespitci, **tespit_ayarlari)
+                              if isinstance(tespitci, str) else tespitci,
+                              tam_cozunurlukte_kodla=tam_cozunurlukte_kodla)
+
+class YoklamaDeposu:
+    """
+    Dersleri ve yoklama kayıtlarını tutan veritabanı için üst düzey erişim
+    """
+
+    def __init__(self, yol=None):
+        """
+        Args:
+            yol (str): Veritabanı dosyası, None ise programın ortak veritabanı (yoklama.db)
+        """
+        self.db = yoklama_db.veritabani() if yol is None else yoklama_db.Veritabani(yol)
+
+    @property
+    def baglanti(self):
+        """Çağıran iş parçacığının bağlantısı"""
+        return self.db.baglanti()
+
+    def ders_baslat(self, zaman=None):
+        """
+        Yeni bir ders açar; o saniyede ders varsa sonraki boş saniyeyi kullanır
+
+        Args:
+            zaman (datetime): Dersin zamanı, None ise şu an
+
+        Returns:
+            int: Dersin ID'si, hata durumunda None
+
+        Not:
+            Ders zamanı (saniye hassasiyetinde) benzersiz olduğundan aynı anda açılan
+            dersler birer saniye arayla kaydedilir
+        """
+        conn = self.baglanti
+        zaman = (zaman or datetime.now()).replace(microsecond=0)
+        while conn.execute('SELECT 1 FROM ders_oturumlari WHERE zaman = ?',
+                           (yoklama_db.zaman_damgasi(zaman),)).fetchone():
+            zaman += timedelta(seconds=1)
+        return yoklama_db.yeni_ders_baslat(conn, zaman)
+
+    def ders_var(self, ders_id):
+        """Verilen ID'de bir ders kayıtlı mı"""
+        return self.baglanti.execute('SELECT 1 FROM ders_oturumlari WHERE id = ?', (ders_id,)).fetchone() is not None
+
+    def katildi(self, ders_id, isimler):
+        """Verilen kişileri derse KATILDI olarak tek işlemde yazar"""
+        yoklama_db.toplu_yoklama_ekle(self.baglanti, ders_id, list(isimler), "KATILDI")
+
+    def katilmadi(self, ders_id, isimler):
+        """Verilen kişileri derse KATILMADI olarak tek işlemde yazar"""
+        yoklama_db.toplu_yoklama_ekle(self.baglanti, ders_id, list(isimler), "KATILMADI")
+
+    def katilanlar(self, ders_id):
+        """Derste KATILDI olarak kayıtlı kişilerin kümesini döndürür"""
+        return {satir[0] for satir in self.baglanti.execute('''
+            SELECT o.isim FROM katilimlar k JOIN ogrenciler o ON o.id = k.ogrenci_id
+            WHERE k.ders_id = ? AND k.durum = ?
+        ''', (ders_id, yoklama_db.DURUM_KODLARI['KATILDI']))}
+
+    def yazici(self, **ayarlar):
+        """
+        Bu depoya yazan, başlatılmış bir arka plan yazıcısı döndürür
+
+        Returns:
+            YoklamaYazici: İşi bitince durdur() çağrılmalıdır
+        """
+        yazici = yoklama_db.YoklamaYazici(db=self.db, **ayarlar)
+        yazici.start()
+        return yazici
+
+    def ogrenci_gecmisi(self, isim):
+        """Öğrencinin son 5 dersteki yoklama kayıtlarını döndürür"""
+        return yoklama_db.yoklama_getir(self.baglanti, isim)
+
+    def dersler(self, son_anahtar=None, sayfa_boyutu=200):
+        """
+        Dersleri özetleriyle birlikte en yeniden eskiye sayfa sayfa döndürür
+
+        Not:
+            Sonraki sayfa için son_anahtar, önceki sayfanın son satırının (zaman, ders_id) değeridir
+        """
+        return yoklama_db.dersleri_getir(self.baglanti, son_anahtar, sayfa_boyutu)
+
+    def ders_detayi(self, ders_id, son_isim=None, sayfa_boyutu=200):
+        """Bir dersin yoklama kayıtlarını isim sırasıyla sayfa sayfa döndürür"""
+        return yoklama_db.ders_detayi_getir(self.baglanti, ders_id, son_isim, sayfa_boyutu)
+
+    def istatistikler(self):
+        """(ders sayısı, öğrenci sayısı, toplam katılım) döndürür"""
+        return yoklama_db.genel_istatistikler(self.baglanti)
+
+    def kapat(self):
+        """Deponun açtığı bütün bağlantıları kapatır"""
+        self.db.kapat()
+
+def _kayit():
+    """Kadroyu kodlayıp depoyu hazırlar (kodlama_deposu.py ile aynı seçenekler)"""
+    import runpy
+    runpy.run_module('kodlama_deposu', run_name='__main__')
+
+def _gecmis():
+    """Geçmiş yoklamalar penceresini açar"""
+    from yoklama_arayuz import gecmis_yoklamalari_goster
+    gecmis_yoklamalari_goster()
+
+# Alt komut -> (modül, fonksiyon); modüller yalnızca seçilen komut için yüklenir
+KOMUTLAR = {
+    'canli': ('deneme', 'main'),
+    'toplu': ('toplu_isle', 'main'),
+    'sunucu': ('sunucu', 'main'),
+    'kayit': (__name__, '_kayit'),
+    'gecmis': (__name__, '_gecmis'),
+}
+
+def main(argv=None):
+    """
+    Alt komutu seçip ilgili programı çalıştırır; kalan argümanlar o programa iletilir
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in KOMUTLAR:
+        print("Kullanım: python yoklama_sistemi.py {" + ",".join(KOMUTLAR) + "} [seçenekler]")
+        return 2
+    import importlib
+    modul, fonksiyon = KOMUTLAR[argv[0]]
+    sys.argv = [f"{sys.argv[0]} {argv[0]}"] + argv[1:]  # Alt programın argparse'ı kendi seçeneklerini görür
+    getattr(importlib.import_module(modul), fonksiyon)()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
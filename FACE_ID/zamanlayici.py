@@ -0,0 +1,105 @@
+"""
+Uyarlamalı Tanıma Zamanlayıcısı Modülü
+Bu modül, kaç karede bir tanıma yapılacağına ve karenin ne kadar küçültüleceğine
+ölçülen tanıma süresine ve sahnedeki yüzlere göre karar verir.
+- Sahne boşsa veya herkes tanınmışsa tanıma seyrekleşir (boşta düşük işlemci kullanımı)
+- Yeni veya tanınmayan bir yüz görünürse hemen her kare tanımaya gönderilir
+- Tanıma süresi hedefi aşarsa kare daha çok küçültülür, hedefin epey altındaysa büyütülür
+"""
+
+import math
+import time
+
+class UyarlamaliZamanlayici:
+    """
+    Tanıma aralığını ve küçültme oranını çalışma anında ayarlayan zamanlayıcı
+    """
+
+    def __init__(self, hedef_sure=0.08, en_az_aralik=1, en_cok_aralik=15,
+                 olcekler=(0.2, 0.25, 0.33, 0.5), baslangic_olcek=0.25, yumusatma=0.3):
+        """
+        Args:
+            hedef_sure (float): Bir tanıma geçişi için saniye cinsinden hedef süre
+            en_az_aralik (int): İki tanıma arasındaki en az kare sayısı
+            en_cok_aralik (int): Boş sahnede ulaşılabilecek en büyük aralık
+            olcekler (tuple): Kullanılabilecek küçültme oranları (küçükten büyüğe)
+            baslangic_olcek (float): İlk kullanılacak küçültme oranı
+            yumusatma (float): Süre ortalamasında yeni ölçümün ağırlığı (0-1)
+        """
+        self.hedef_sure = hedef_sure
+        self.en_az_aralik = en_az_aralik
+        self.en_cok_aralik = en_cok_aralik
+        self.olcekler = sorted(olcekler)
+        self.olcek_sirasi = min(range(len(self.olcekler)),
+                                key=lambda i: abs(self.olcekler[i] - baslangic_olcek))
+        self.yumusatma = yumusatma
+
+        self.aralik = en_az_aralik  # Şu anki tanıma aralığı (kare)
+        self.ortalama_sure = None  # Tanıma süresinin üstel ortalaması
+        self.ortalama_kare_suresi = None  # Gösterilen kareler arası sürenin üstel ortalaması
+        self.son_yuz_sayisi = 0
+        self._son_kare_zamani = None
+        self._gonderimden_beri = None  # Son gönderimden beri gösterilen kare sayısı
+
+    @property
+    def olcek(self):
+        """Tanımaya gönderilecek karenin küçültülme oranı"""
+        return self.olcekler[self.olcek_sirasi]
+
+    def _ortala(self, ortalama, yeni):
+        """Üstel hareketli ortalamayı günceller"""
+        if ortalama is None:
+            return yeni
+        return (1 - self.yumusatma) * ortalama + self.yumusatma * yeni
+
+    def kare_gosterildi(self):
+        """
+        Çizim döngüsünde her kare için çağrılır
+
+        Returns:
+            bool: Bu karenin tanımaya gönderilip gönderilmeyeceği
+        """
+        simdi = time.perf_counter()
+        if self._son_kare_zamani is not None:
+            self.ortalama_kare_suresi = self._ortala(self.ortalama_kare_suresi, simdi - self._son_kare_zamani)
+        self._son_kare_zamani = simdi
+
+        if self._gonderimden_beri is None or self._gonderimden_beri + 1 >= self.aralik:
+            self._gonderimden_beri = 0
+            return True
+        self._gonderimden_beri += 1
+        return False
+
+    def sonuc_bildir(self, sure, sonuclar):
+        """
+        Biten bir tanıma geçişinin süresini ve sonuçlarını bildirir
+
+        Args:
+            sure (float): Geçişin saniye cinsinden süresi
+            sonuclar (list): Geçişte bulunan TanimaSonucu listesi
+        """
+        self.ortalama_sure = self._ortala(self.ortalama_sure, sure)
+
+        # Küçültme oranı süre hedefine göre ayarlanır
+        if self.ortalama_sure > self.hedef_sure and self.olcek_sirasi > 0:
+            self.olcek_sirasi -= 1
+            self.ortalama_sure = None  # Yeni oranın süresi baştan ölçülür
+        elif self.ortalama_sure < self.hedef_sure * 0.5 and self.olcek_sirasi < len(self.olcekler) - 1:
+            self.olcek_sirasi += 1
+            self.ortalama_sure = None
+
+        # Aralık sahnedeki yüzlere göre ayarlanır
+        yuz_sayisi = len(sonuclar)
+        bilinmeyen_var = any(not sonuc.kabul for sonuc in sonuclar)
+        if yuz_sayisi > self.son_yuz_sayisi or bilinmeyen_var:
+            self.aralik = self.en_az_aralik  # Yeni yüz: hemen sık tanıma
+        elif yuz_sayisi == 0:
+            self.aralik = min(self.en_cok_aralik, self.aralik * 2)  # Boş sahne: hızla seyrekleş
+        else:
+            self.aralik = min(self.en_cok_aralik, self.aralik + 1)  # Tanınmış yüzler: yavaşça seyrekleş
+        self.son_yuz_sayisi = yuz_sayisi
+
+        # Tanıma, sürdüremeyeceği hızda kareyle beslenmez
+        if self.ortalama_sure is not None and self.ortalama_kare_suresi:
+            yetisilen = math.ceil(self.ortalama_sure / self.ortalama_kare_suresi)
+            self.aralik = max(self.aralik, min(yetisilen, self.en_cok_aralik))